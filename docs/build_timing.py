@@ -0,0 +1,220 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Sphinx extension recording where the time of a docs build goes.
+
+For every document read or written in a build it records
+- read: from source-read to doctree-read (parsing, directives, transforms),
+- resolve: resolving the doctree (sphinx-needs filters and charts run here),
+- write: translating and writing the output file,
+and the time spent in each directive, and writes them to a JSON report
+(build_timing_report, default <doctreedir>/timing.json).
+
+Works with -j: read timings are kept in the environment, which Sphinx merges
+back from the reading processes; write timings are appended by the writing
+processes to a file next to the report and collected when the build finishes.
+Directive times include the directives nested in them.
+"""
+
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from docutils.parsers.rst import states
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of slowest documents logged and of slowest directives reported
+TOP = 10
+
+# Per process: start of the phase a document is in, and its directive times
+_started = {}
+_directives = defaultdict(lambda: defaultdict(float))
+_resolve = {}
+_directive_timing_installed = False
+
+
+def _install_directive_timing():
+    """Wrap docutils' Body.run_directive to time directives by document (once)."""
+    global _directive_timing_installed
+    if _directive_timing_installed:
+        return
+    _directive_timing_installed = True
+    original = states.Body.run_directive
+
+    def run_directive(self, directive, match, type_name, option_presets):
+        start = time.perf_counter()
+        try:
+            return original(self, directive, match, type_name, option_presets)
+        finally:
+            env = getattr(self.document.settings, "env", None)
+            if env is not None and env.docname:
+                _directives[env.docname][type_name] += time.perf_counter() - start
+
+    states.Body.run_directive = run_directive
+
+
+def _write_log_path(app):
+    path = _report_path(app)
+    return path.with_name(path.name + ".write.jsonl")
+
+
+def _report_path(app):
+    return Path(app.config.build_timing_report or Path(app.doctreedir) / "timing.json")
+
+
+def _builder_inited(app):
+    _started.clear()
+    _directives.clear()
+    _resolve.clear()
+    _report_path(app).parent.mkdir(parents=True, exist_ok=True)
+    _write_log_path(app).write_text("", encoding="utf-8")
+
+    builder = app.builder
+    write_doc = builder.write_doc
+    log_path = _write_log_path(app)
+
+    def timed_write_doc(docname, doctree):
+        start = time.perf_counter()
+        try:
+            return write_doc(docname, doctree)
+        finally:
+            line = json.dumps({"docname": docname, "write": time.perf_counter() - start})
+            # One short line per write in append mode, so lines of parallel
+            # writers do not interleave.
+            with log_path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    builder.write_doc = timed_write_doc
+
+
+def _before_read_docs(_app, env, _docnames):
+    # Only documents read in this build are reported.
+    env.build_timing_read = {}
+
+
+def _source_read(_app, docname, _source):
+    _started[docname] = time.perf_counter()
+
+
+def _doctree_read(app, _doctree):
+    docname = app.env.docname
+    start = _started.pop(docname, None)
+    if start is None:
+        return
+    app.env.build_timing_read[docname] = {
+        "read": time.perf_counter() - start,
+        "directives": dict(_directives.pop(docname, {})),
+    }
+
+
+def _purge_doc(_app, env, docname):
+    getattr(env, "build_timing_read", {}).pop(docname, None)
+
+
+def _merge_info(_app, env, docnames, other):
+    timings = getattr(other, "build_timing_read", {})
+    env.build_timing_read.update((docname, timings[docname]) for docname in docnames if docname in timings)
+
+
+def _resolve_started(_app, _doctree, docname):
+    _started[docname] = time.perf_counter()
+
+
+def _resolve_finished(_app, _doctree, docname):
+    start = _started.pop(docname, None)
+    if start is not None:
+        _resolve[docname] = time.perf_counter() - start
+
+
+def _read_write_log(path):
+    writes = {}
+    try:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                writes[entry["docname"]] = entry["write"]
+    except (OSError, ValueError):
+        pass
+    return writes
+
+
+def _build_finished(app, exception):
+    if exception is not None:
+        return
+    log_path = _write_log_path(app)
+    writes = _read_write_log(log_path)
+    reads = getattr(app.env, "build_timing_read", {})
+
+    documents = {}
+    directives = []
+    for docname in sorted(set(reads) | set(_resolve) | set(writes)):
+        read = reads.get(docname, {})
+        documents[docname] = {
+            "read": read.get("read"),
+            "resolve": _resolve.get(docname),
+            "write": writes.get(docname),
+        }
+        directives.extend(
+            {"docname": docname, "directive": name, "seconds": seconds}
+            for name, seconds in read.get("directives", {}).items()
+        )
+
+    per_directive = defaultdict(float)
+    for entry in directives:
+        per_directive[entry["directive"]] += entry["seconds"]
+
+    report = {
+        "builder": app.builder.name,
+        "parallel": app.parallel,
+        "totals": {
+            phase: sum(doc[phase] or 0.0 for doc in documents.values()) for phase in ("read", "resolve", "write")
+        },
+        "documents": documents,
+        "directives": dict(sorted(per_directive.items(), key=lambda item: -item[1])),
+        "slowest_directives": sorted(directives, key=lambda entry: -entry["seconds"])[:TOP],
+    }
+    path = _report_path(app)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    tmp.replace(path)
+    log_path.unlink()
+
+    def total(doc):
+        return sum(value or 0.0 for value in doc.values())
+
+    slowest = sorted(documents.items(), key=lambda item: -total(item[1]))[:TOP]
+    if slowest:
+        logger.info(f"build timing written to {path}; slowest documents:")
+    for docname, doc in slowest:
+        phases = ", ".join(f"{phase} {value:.2f}s" for phase, value in doc.items() if value is not None)
+        logger.info(f"  {docname:<50} {total(doc):7.2f}s ({phases})")
+
+
+def setup(app):
+    app.add_config_value("build_timing_report", "", "", types=(str,))
+    _install_directive_timing()
+
+    app.connect("builder-inited", _builder_inited)
+    app.connect("env-before-read-docs", _before_read_docs)
+    app.connect("env-purge-doc", _purge_doc)
+    app.connect("env-merge-info", _merge_info)
+    app.connect("source-read", _source_read, priority=0)
+    app.connect("doctree-read", _doctree_read, priority=1000)
+    app.connect("doctree-resolved", _resolve_started, priority=0)
+    app.connect("doctree-resolved", _resolve_finished, priority=1000)
+    app.connect("build-finished", _build_finished)
+    return {"version": "1.0", "parallel_read_safe": True, "parallel_write_safe": True}
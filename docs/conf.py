@@ -13,26 +13,14 @@
 
 # Configuration file for the Sphinx documentation builder.
 
-import os as _os
 import sys as _sys
+from pathlib import Path as _Path
 
 # Make docs/ importable so needs_filters.py (and similar helpers) can be used
 # as :filter-func: targets in sphinx-needs directives.
-_sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))
+_sys.path.insert(0, str(_Path(__file__).resolve().parent))
 
 
-def _patch_needpie_suppress_legend() -> None:
-    """Suppress all in-chart legends in sphinx-needs needpie charts."""
-    try:
-        import matplotlib.axes
-
-        matplotlib.axes.Axes.legend = lambda self, *args, **kwargs: None
-    except Exception:
-        pass
-
-
-_patch_needpie_suppress_legend()
-
 project = "REF_INT"
 project_url = "https://eclipse-score.github.io/reference_integration"
 version = "0.1"
@@ -43,6 +31,9 @@ extensions = [
     # is updated with new sphinx-needs version
     "sphinxcontrib.plantuml",
     "score_sphinx_bundle",
+    # Local extensions in docs/
+    "needs_charts",
+    "build_timing",
 ]
 
 exclude_patterns = [
@@ -0,0 +1,191 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Cache of the chart images sphinx-needs renders with matplotlib, across builds.
+
+sphinx-needs computes the values of a needpie (from its filter lines or its
+filter-func), builds the matplotlib figure and saves it as need_pie_<id>.<ext>.
+Saving (rasterizing or writing SVG) is the expensive part. install() wraps
+Figure.savefig: for sphinx-needs charts the figure's content - every drawn
+artist with its geometry, colors and text, plus the output-relevant rcParams -
+is hashed, and an image stored under that hash is copied instead of rendering.
+A chart whose needs, and therefore values, did not change is thus not rendered
+again.
+
+Cache entries are refreshed on use and removed after MAX_AGE_DAYS unused days.
+"""
+
+import contextlib
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+
+CACHE_FORMAT_VERSION = 1
+MAX_AGE_DAYS = 30
+
+# File name prefix of the charts sphinx-needs saves (need_pie_*, need_bar_*)
+CHART_PREFIX = "need_"
+
+# rcParams that change the written file without changing the figure's artists
+_OUTPUT_RC_PARAMS = (
+    "svg.hashsalt",
+    "svg.fonttype",
+    "pdf.fonttype",
+    "savefig.dpi",
+    "savefig.bbox",
+    "savefig.pad_inches",
+    "savefig.transparent",
+    "savefig.facecolor",
+)
+
+_state = {"dir": None, "hits": 0, "misses": 0, "installed": False}
+
+
+def configure(cache_dir):
+    """Store cached images in *cache_dir*; caching is disabled until this is called."""
+    _state.update(dir=Path(cache_dir), hits=0, misses=0)
+
+
+def _artist_state(artist):
+    """Return the drawn state of one matplotlib artist as a hashable tuple."""
+    from matplotlib.axes import Axes
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+    from matplotlib.text import Text
+
+    state = (type(artist).__name__, artist.get_visible(), artist.get_zorder(), artist.get_alpha())
+    if isinstance(artist, Patch):
+        path = artist.get_path()
+        return state + (
+            path.vertices.tobytes(),
+            None if path.codes is None else path.codes.tobytes(),
+            artist.get_patch_transform().get_matrix().tobytes(),
+            tuple(artist.get_facecolor()),
+            tuple(artist.get_edgecolor()),
+            artist.get_linewidth(),
+            artist.get_hatch(),
+        )
+    if isinstance(artist, Text):
+        return state + (
+            artist.get_text(),
+            artist.get_position(),
+            str(artist.get_color()),
+            artist.get_fontsize(),
+            artist.get_fontweight(),
+            tuple(artist.get_fontfamily()),
+            artist.get_horizontalalignment(),
+            artist.get_verticalalignment(),
+            artist.get_rotation(),
+        )
+    if isinstance(artist, Line2D):
+        return state + (
+            artist.get_xydata().tobytes(),
+            str(artist.get_color()),
+            artist.get_linewidth(),
+            artist.get_linestyle(),
+            str(artist.get_marker()),
+        )
+    if isinstance(artist, Axes):
+        return state + (
+            artist.get_position().bounds,
+            artist.get_xlim(),
+            artist.get_ylim(),
+            artist.axison,
+            str(artist.get_aspect()),
+        )
+    return state
+
+
+def figure_key(figure, ext, kwargs):
+    """Return the hash of everything that determines the file *figure* is saved as."""
+    import matplotlib
+
+    digest = hashlib.sha256()
+    header = (
+        CACHE_FORMAT_VERSION,
+        matplotlib.__version__,
+        ext,
+        tuple(figure.get_size_inches()),
+        figure.get_dpi(),
+        tuple(figure.get_facecolor()),
+        tuple(str(matplotlib.rcParams[name]) for name in _OUTPUT_RC_PARAMS),
+        sorted((key, repr(value)) for key, value in kwargs.items()),
+    )
+    digest.update(repr(header).encode("utf-8"))
+
+    pending = [figure]
+    while pending:
+        artist = pending.pop()
+        digest.update(repr(_artist_state(artist)).encode("utf-8"))
+        pending.extend(reversed(artist.get_children()))
+    return digest.hexdigest()
+
+
+def is_chart_path(fname):
+    """Return whether *fname* is the path of a chart image saved by sphinx-needs."""
+    return isinstance(fname, (str, os.PathLike)) and Path(fname).name.startswith(CHART_PREFIX)
+
+
+def install():
+    """Wrap matplotlib's Figure.savefig with the image cache (once)."""
+    import matplotlib.figure
+
+    if _state["installed"]:
+        return
+    _state["installed"] = True
+    original = matplotlib.figure.Figure.savefig
+
+    def savefig(self, fname, *args, **kwargs):
+        cache_dir = _state["dir"]
+        if cache_dir is None or args or not is_chart_path(fname):
+            return original(self, fname, *args, **kwargs)
+
+        path = Path(fname)
+        ext = path.suffix.lstrip(".") or "png"
+        cached = cache_dir / f"{figure_key(self, ext, kwargs)}.{ext}"
+        if cached.exists():
+            shutil.copyfile(cached, path)
+            os.utime(cached)
+            _state["hits"] += 1
+            return None
+
+        original(self, fname, **kwargs)
+        _state["misses"] += 1
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Unique per process, in case several builds share the cache directory.
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, tmp)
+        tmp.replace(cached)
+        return None
+
+    matplotlib.figure.Figure.savefig = savefig
+
+
+def prune(max_age_days=MAX_AGE_DAYS):
+    """Remove cached images not used for *max_age_days* days."""
+    cache_dir = _state["dir"]
+    if cache_dir is None or not cache_dir.is_dir():
+        return
+    cutoff = time.time() - max_age_days * 86400
+    for entry in cache_dir.iterdir():
+        with contextlib.suppress(OSError):
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+
+
+def stats():
+    """Return (hits, misses) of this process."""
+    return _state["hits"], _state["misses"]
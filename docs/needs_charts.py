@@ -0,0 +1,84 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Sphinx extension for the sphinx-needs charts of these docs.
+
+- Removes the in-chart legend of sphinx-needs charts just before they are
+  saved, instead of disabling Axes.legend for all of matplotlib.
+- Reuses rendered chart images across builds (see needpie_cache).
+- Resets the needs index of needs_filters at the start of each build.
+
+sphinx-needs renders charts while resolving doctrees, which Sphinx does in the
+main process also with -j, so the state kept here is never split across
+processes. The extension is parallel read and write safe.
+"""
+
+from pathlib import Path
+
+import needpie_cache
+import needs_filters
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+_legend_suppression_installed = False
+
+
+def _install_legend_suppression():
+    """Wrap Figure.savefig to drop the legends of sphinx-needs charts (once)."""
+    global _legend_suppression_installed
+    import matplotlib.figure
+
+    if _legend_suppression_installed:
+        return
+    _legend_suppression_installed = True
+    original = matplotlib.figure.Figure.savefig
+
+    def savefig(self, fname, *args, **kwargs):
+        if needpie_cache.is_chart_path(fname):
+            for axes in self.axes:
+                legend = axes.get_legend()
+                if legend is not None:
+                    legend.remove()
+        return original(self, fname, *args, **kwargs)
+
+    matplotlib.figure.Figure.savefig = savefig
+
+
+def _builder_inited(app):
+    needs_filters.reset_needs_index()
+    # Rendered chart images live next to the doctrees, which persist between
+    # incremental builds.
+    needpie_cache.configure(Path(app.doctreedir) / "needpie_cache")
+
+
+def _build_finished(_app, _exception):
+    hits, misses = needpie_cache.stats()
+    if hits or misses:
+        logger.info(f"needpie image cache: {hits} reused, {misses} rendered")
+    needpie_cache.prune()
+
+
+def setup(app):
+    try:
+        # The legend wrapper goes outside the cache, so legends are removed
+        # before a figure is hashed.
+        needpie_cache.install()
+        _install_legend_suppression()
+    except ImportError:
+        pass  # sphinx-needs warns itself if matplotlib is missing
+
+    app.connect("builder-inited", _builder_inited)
+    app.connect("build-finished", _build_finished)
+    return {"version": "1.0", "parallel_read_safe": True, "parallel_write_safe": True}
@@ -13,8 +13,127 @@
 
 """
 Custom filter functions for use with sphinx-needs :filter-func: option.
+
+All filter functions share one index of the needs (see NeedsIndex), built on
+the first call of a build for the needs of the build, so each chart is a few
+bitset operations instead of a scan over all needs.
 """
 
+# Index of each verification status class in the counts of the charts
+AUTOMATED, WAITING, INSPECTION, OTHER = range(4)
+
+# std_req compliance tags in priority order, followed by "other"
+STD_REQ_STATUS_TAGS = ("ok", "recommendation", "open", "action", "deviation", "n/a")
+STD_REQ_STATUS_PRIORITY = ("deviation", "action", "open", "ok", "recommendation", "n/a")
+ISO26262_STD_REQ_PREFIX = "std_req__iso26262__"
+
+
+def _verification_class(tags):
+    """Return the verification status class of a gd_req with the given tags."""
+    if "done_automation" in tags:
+        return AUTOMATED
+    if any(t.startswith("prio_") and t.endswith("_automation") for t in tags):
+        return WAITING
+    if any(t.startswith("manual_prio_") for t in tags):
+        return INSPECTION
+    return OTHER
+
+
+def _std_req_status(tags):
+    """Return the index in STD_REQ_STATUS_TAGS of a std_req's status, len(STD_REQ_STATUS_TAGS) for "other"."""
+    for tag in STD_REQ_STATUS_PRIORITY:
+        if tag in tags:
+            return STD_REQ_STATUS_TAGS.index(tag)
+    return len(STD_REQ_STATUS_TAGS)
+
+
+class NeedsIndex:
+    """
+    Lookup structures over the internal gd_req needs, built in one pass.
+
+    Sets of gd_req needs are int bitsets over their position, so combining a
+    process area with a workflow or a status class is a bitwise operation and
+    counting is int.bit_count().
+    """
+
+    def __init__(self, needs):
+        self.by_tag = {}
+        self.by_workflow = {}
+        self.by_class = [0] * 4
+        self.complies_by_tag = {}
+        self.std_req_status = {}
+
+        bit = 1
+        for need in needs:
+            need_type = need.get("type")
+            if need.get("id", "").startswith(ISO26262_STD_REQ_PREFIX):
+                self.std_req_status[need["id"]] = _std_req_status(set(need.get("tags", [])))
+            if need_type != "gd_req" or need.get("is_external", False):
+                continue
+            tags = need.get("tags", [])
+            for tag in set(tags):
+                self.by_tag[tag] = self.by_tag.get(tag, 0) | bit
+            for workflow in set(need.get("satisfies", [])):
+                self.by_workflow[workflow] = self.by_workflow.get(workflow, 0) | bit
+            self.by_class[_verification_class(tags)] |= bit
+            complies = [ref for ref in need.get("complies", []) if ref.startswith(ISO26262_STD_REQ_PREFIX)]
+            if complies:
+                for tag in tags:
+                    self.complies_by_tag.setdefault(tag, set()).update(complies)
+            bit <<= 1
+
+    def tagged(self, tag):
+        """Bitset of the gd_req needs with *tag*."""
+        return self.by_tag.get(tag, 0)
+
+    def satisfying(self, workflow_ids):
+        """Bitset of the gd_req needs satisfying any of *workflow_ids*."""
+        mask = 0
+        for workflow in workflow_ids:
+            mask |= self.by_workflow.get(workflow, 0)
+        return mask
+
+    def verification_counts(self, mask):
+        """Return [automated, waiting, inspection, other] counts of the gd_req needs in *mask*."""
+        return [(mask & class_mask).bit_count() for class_mask in self.by_class]
+
+    def std_req_counts(self, tag):
+        """Return the status counts of the ISO 26262 std_req needs complied with by gd_req needs with *tag*."""
+        counts = [0] * (len(STD_REQ_STATUS_TAGS) + 1)
+        for std_req_id in self.complies_by_tag.get(tag, ()):
+            status = self.std_req_status.get(std_req_id)
+            if status is not None:
+                counts[status] += 1
+        return counts
+
+
+_index_cache = {"container": None, "index": None}
+
+
+def needs_index(needs):
+    """
+    Return the NeedsIndex of *needs*, built once per build for all needs.
+
+    sphinx-needs passes every needpie a new view of the needs of the build; the
+    views of all needs share the container of the build's needs (their
+    ``_indexes``), so their index is reused until that container changes and the
+    lookup does not depend on the number of needs. Scoped views (which share the
+    container too, but select some of its needs) and plain lists are indexed on
+    every call, which costs what scanning them would.
+    """
+    container = getattr(needs, "_indexes", None)
+    if container is None or getattr(needs, "_selected_ids", None) is not None:
+        return NeedsIndex(needs)
+    if container is not _index_cache["container"]:
+        # Keeping the container referenced keeps its identity from being reused.
+        _index_cache.update(container=container, index=NeedsIndex(needs))
+    return _index_cache["index"]
+
+
+def reset_needs_index(*_args):
+    """Drop the cached index, e.g. at the start of a new build in the same process."""
+    _index_cache.update(container=None, index=None)
+
 
 def std_req_status_for_area(needs, results, arg1=""):
     """
@@ -27,34 +146,7 @@ def std_req_status_for_area(needs, results, arg1=""):
 
     arg1 = process area tag (e.g. requirements_engineering)
     """
-    area_tag = arg1.strip()
-    std_req_ids = set()
-    needs_by_id = {n["id"]: n for n in needs}
-    for need in needs:
-        if need.get("type") == "gd_req" and not need.get("is_external", False) and area_tag in need.get("tags", []):
-            for ref_id in need.get("complies", []):
-                if ref_id.startswith("std_req__iso26262__"):
-                    std_req_ids.add(ref_id)
-    ok = recommendation = open_ = action = deviation = na = other = 0
-    for sid in std_req_ids:
-        n = needs_by_id.get(sid)
-        if n:
-            t = set(n.get("tags", []))
-            if "deviation" in t:
-                deviation += 1
-            elif "action" in t:
-                action += 1
-            elif "open" in t:
-                open_ += 1
-            elif "ok" in t:
-                ok += 1
-            elif "recommendation" in t:
-                recommendation += 1
-            elif "n/a" in t:
-                na += 1
-            else:
-                other += 1
-    results += [ok, recommendation, open_, action, deviation, na, other]
+    results += needs_index(needs).std_req_counts(arg1.strip())
 
 
 def wp_tag_status(needs, results, arg1=""):
@@ -71,21 +163,8 @@ def wp_tag_status(needs, results, arg1=""):
     arg1 = workflow id(s), pipe-separated (e.g. wf__foo or wf__foo|wf__bar)
     """
     workflow_ids = [w.strip() for w in arg1.split("|") if w.strip()]
-    automated = waiting = inspection = other = 0
-    for need in needs:
-        if need.get("type") == "gd_req" and not need.get("is_external", False):
-            satisfies = need.get("satisfies", [])
-            if any(wf in satisfies for wf in workflow_ids):
-                tags = set(need.get("tags", []))
-                if "done_automation" in tags:
-                    automated += 1
-                elif any(t.startswith("prio_") and t.endswith("_automation") for t in tags):
-                    waiting += 1
-                elif any(t.startswith("manual_prio_") for t in tags):
-                    inspection += 1
-                else:
-                    other += 1
-    results += [automated, waiting, inspection, other]
+    index = needs_index(needs)
+    results += index.verification_counts(index.satisfying(workflow_ids))
 
 
 def area_verification_status(needs, results, arg1=""):
@@ -102,20 +181,8 @@ def area_verification_status(needs, results, arg1=""):
 
     arg1 = process area tag (e.g. requirements_engineering)
     """
-    area_tag = arg1.strip()
-    automated = waiting = inspection = other = 0
-    for need in needs:
-        if need.get("type") == "gd_req" and not need.get("is_external", False) and area_tag in need.get("tags", []):
-            tags = set(need.get("tags", []))
-            if "done_automation" in tags:
-                automated += 1
-            elif any(t.startswith("prio_") and t.endswith("_automation") for t in tags):
-                waiting += 1
-            elif any(t.startswith("manual_prio_") for t in tags):
-                inspection += 1
-            else:
-                other += 1
-    results += [automated, waiting, inspection, other]
+    index = needs_index(needs)
+    results += index.verification_counts(index.tagged(arg1.strip()))
 
 
 def wp_done_automation_status(needs, results, arg1=""):
@@ -126,14 +193,7 @@ def wp_done_automation_status(needs, results, arg1=""):
     arg1 = workflow id(s), pipe-separated (e.g. wf__foo or wf__foo|wf__bar)
     """
     workflow_ids = [w.strip() for w in arg1.split("|") if w.strip()]
-    done = rest = 0
-    for need in needs:
-        if need.get("type") == "gd_req" and not need.get("is_external", False):
-            satisfies = need.get("satisfies", [])
-            if any(wf in satisfies for wf in workflow_ids):
-                tags = set(need.get("tags", []))
-                if "done_automation" in tags:
-                    done += 1
-                else:
-                    rest += 1
-    results += [done, rest]
+    index = needs_index(needs)
+    selected = index.satisfying(workflow_ids)
+    done = (selected & index.by_class[AUTOMATED]).bit_count()
+    results += [done, selected.bit_count() - done]
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Find the module commit that breaks the integration build between two known_good files.
+
+The search runs in two stages, each a binary search:
+
+1. Over the modules that differ between the good and the bad known_good.json:
+   the changes are applied one prefix at a time to find the first module whose
+   update breaks the build.
+2. Over the commits of that module between its good and bad hash, with all
+   earlier module updates applied.
+
+Each step regenerates bazel_common with update_module_from_known_good.py and
+checks the build groups with integration_test.build_group. By default only the
+loading and analysis phases are run (--nobuild), and all steps share one disk
+cache, so a step costs seconds to minutes instead of a full build.
+
+Usage:
+  git show origin/main:known_good.json > known_good.good.json
+  python3 scripts/bisect_known_good.py --good known_good.good.json --bad known_good.json \\
+      --targets "@score_baselibs//score/..."
+"""
+
+import argparse
+import copy
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+
+# known_good.models imports scripts/tooling from the repository root
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from integration_test import build_group
+from known_good.models.known_good import KnownGood, load_known_good
+from models.build_config import load_build_config
+
+repo_root = Path(__file__).parent.parent
+update_script = repo_root / "scripts" / "known_good" / "update_module_from_known_good.py"
+
+ModuleKey = tuple[str, str]  # (group name, module name)
+
+
+def changed_modules(good: KnownGood, bad: KnownGood) -> list[ModuleKey]:
+    """Return the modules of *bad* whose hash or version differs from *good*.
+
+    Args:
+        good: Known good configuration that builds
+        bad: Known good configuration that fails
+
+    Returns:
+        Changed modules in the order of *bad*, including modules added in *bad*
+    """
+    changes = []
+    for group_name, modules in bad.modules.items():
+        for name, module in modules.items():
+            old = good.modules.get(group_name, {}).get(name)
+            if old is None or (old.hash, old.version) != (module.hash, module.version):
+                changes.append((group_name, name))
+    return changes
+
+
+def apply_changes(good: KnownGood, bad: KnownGood, changes: list[ModuleKey]) -> KnownGood:
+    """Return a copy of *good* with the modules in *changes* taken from *bad*."""
+    result = copy.deepcopy(good)
+    for group_name, name in changes:
+        result.modules.setdefault(group_name, {})[name] = copy.deepcopy(bad.modules[group_name][name])
+    result.reindex()
+    return result
+
+
+def first_failing(count: int, fails: Callable[[int], bool]) -> int:
+    """Binary search for the smallest k in 1..count with fails(k).
+
+    Requires fails(0) to be False and fails(count) to be True; fails is assumed
+    to be monotonic, i.e. to keep failing once it failed.
+
+    Args:
+        count: Upper bound of the search
+        fails: Predicate over prefix lengths
+
+    Returns:
+        Smallest failing prefix length
+    """
+    lo, hi = 0, count
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if fails(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+def module_commits(repo_url: str, good_hash: str, bad_hash: str, mirror_dir: Path) -> list[str]:
+    """List the first-parent commits after *good_hash* up to and including *bad_hash*.
+
+    The repository is mirrored without file contents into *mirror_dir*, so the
+    history is available locally for later runs.
+
+    Args:
+        repo_url: Repository URL
+        good_hash: Last commit known to build
+        bad_hash: Commit known to break the build
+        mirror_dir: Directory for blobless repository mirrors
+
+    Returns:
+        Commits ordered from oldest to newest
+    """
+    mirror = mirror_dir / (repo_url.rstrip("/").split("/")[-1].removesuffix(".git") + ".git")
+    if mirror.exists():
+        subprocess.run(["git", "-C", str(mirror), "fetch", "--quiet", "origin"], check=True)
+    else:
+        mirror_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            ["git", "clone", "--quiet", "--mirror", "--filter=blob:none", repo_url, str(mirror)],
+            check=True,
+        )
+    result = subprocess.run(
+        ["git", "-C", str(mirror), "rev-list", "--first-parent", "--reverse", f"{good_hash}..{bad_hash}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+class Bisector:
+    """Builds known_good variants and remembers their results."""
+
+    def __init__(
+        self,
+        targets: dict[str, str],
+        config: str,
+        log_dir: Path,
+        bazel_args: list[str],
+        output_dir_modules: Path,
+    ) -> None:
+        self.targets = targets
+        self.config = config
+        self.log_dir = log_dir
+        self.bazel_args = bazel_args
+        self.output_dir_modules = output_dir_modules
+        self.steps = 0
+        self._results: dict[str, bool] = {}
+
+    def builds(self, known_good: KnownGood, label: str) -> bool:
+        """Check whether all build groups succeed with *known_good*.
+
+        Args:
+            known_good: Variant to check
+            label: Short description used in logs
+
+        Returns:
+            True if every build group succeeds
+        """
+        key = json.dumps(known_good.to_dict()["modules"], sort_keys=True)
+        if key in self._results:
+            return self._results[key]
+
+        self.steps += 1
+        print(f"=== Step {self.steps}: {label} ===")
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(known_good.to_dict(), f, indent=4)
+            variant_path = Path(f.name)
+        try:
+            generate_modules(variant_path, self.output_dir_modules)
+        finally:
+            variant_path.unlink()
+
+        ok = True
+        for group_name, targets in self.targets.items():
+            log_file = self.log_dir / f"bisect-{self.steps}-{group_name}.log"
+            exit_code, duration = build_group(group_name, targets, self.config, log_file, self.bazel_args)
+            print(f"{group_name}: {'ok' if exit_code == 0 else f'failed ({exit_code})'} in {duration}s")
+            if exit_code != 0:
+                ok = False
+                break
+        self._results[key] = ok
+        return ok
+
+
+def generate_modules(known_good_path: Path, output_dir_modules: Path) -> None:
+    """Regenerate the score_modules_*.MODULE.bazel files from *known_good_path*."""
+    subprocess.run(
+        [
+            sys.executable,
+            str(update_script),
+            "--known",
+            str(known_good_path),
+            "--output-dir-modules",
+            str(output_dir_modules),
+            "--output-dir-coverage",
+            str(output_dir_modules.parent / "rust_coverage"),
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def bisect(
+    good: KnownGood, bad: KnownGood, bisector: Bisector, mirror_dir: Path, *, skip_verify: bool = False
+) -> Optional[tuple[ModuleKey, Optional[str]]]:
+    """Find the module update, and the commit inside it, that breaks the build.
+
+    Args:
+        good: Known good configuration that builds
+        bad: Known good configuration that fails
+        bisector: Runs and caches the checks
+        mirror_dir: Directory for repository mirrors used for commit bisection
+        skip_verify: Trust that *good* builds and *bad* fails instead of checking both
+
+    Returns:
+        The culprit module and the first failing commit (None if the module is
+        not pinned by commit on both sides), or None if the endpoints do not
+        reproduce the failure
+    """
+    changes = changed_modules(good, bad)
+    if not changes:
+        print("The known_good files pin the same modules.")
+        return None
+    print(f"{len(changes)} changed module(s): {', '.join(name for _, name in changes)}")
+
+    if not skip_verify:
+        if not bisector.builds(good, "good known_good"):
+            print("::error::The good known_good does not build; cannot bisect.")
+            return None
+        if bisector.builds(bad, "bad known_good"):
+            print("::error::The bad known_good builds; nothing to bisect.")
+            return None
+
+    k = first_failing(
+        len(changes),
+        lambda n: not bisector.builds(apply_changes(good, bad, changes[:n]), f"first {n} module update(s)"),
+    )
+    culprit = changes[k - 1]
+    group_name, name = culprit
+    print(f"Culprit module: {name} (group {group_name})")
+
+    base = apply_changes(good, bad, changes[: k - 1])
+    old = good.modules.get(group_name, {}).get(name)
+    new = bad.modules[group_name][name]
+    if old is None or not old.hash or not new.hash or old.version or new.version:
+        return culprit, None
+
+    commits = module_commits(new.repo, old.hash, new.hash, mirror_dir)
+    if not commits:
+        return culprit, new.hash
+    print(f"Bisecting {len(commits)} commit(s) of {name}")
+
+    def fails_at(n: int) -> bool:
+        variant = copy.deepcopy(base)
+        variant.modules.setdefault(group_name, {})[name] = copy.deepcopy(new)
+        variant.modules[group_name][name].hash = commits[n - 1]
+        variant.reindex()
+        return not bisector.builds(variant, f"{name} at {commits[n - 1][:8]}")
+
+    # The last commit is the bad hash, known to fail from the module stage.
+    return culprit, commits[first_failing(len(commits), fails_at) - 1]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Bisect a broken known_good update to a module and commit",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--good", type=Path, required=True, help="known_good.json that builds")
+    parser.add_argument("--bad", type=Path, required=True, help="known_good.json that fails to build")
+    targets = parser.add_mutually_exclusive_group()
+    targets.add_argument("--targets", help="Bazel targets to check (default: all groups of the build config)")
+    targets.add_argument(
+        "--build-config",
+        type=Path,
+        default=repo_root / "build_config.json",
+        help="Path to build_config.json file (default: build_config.json in repo root)",
+    )
+    parser.add_argument(
+        "--config",
+        default=os.environ.get("CONFIG", "linux-x86_64"),
+        help="Bazel config to use (default: linux-x86_64, or from CONFIG env var)",
+    )
+    parser.add_argument(
+        "--full-build",
+        action="store_true",
+        help="Run full builds instead of loading and analysis only",
+    )
+    parser.add_argument(
+        "--disk-cache",
+        type=Path,
+        default=Path.home() / ".cache" / "bazel" / "disk",
+        help="Bazel disk cache shared by all steps (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--mirror-dir",
+        type=Path,
+        default=Path.home() / ".cache" / "score-tooling" / "bisect-mirrors",
+        help="Directory for blobless repository mirrors (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--skip-verify",
+        action="store_true",
+        help="Do not check that --good builds and --bad fails before bisecting",
+    )
+    args = parser.parse_args()
+
+    try:
+        good = load_known_good(args.good)
+        bad = load_known_good(args.bad)
+    except (FileNotFoundError, ValueError) as e:
+        raise SystemExit(f"ERROR: {e}") from e
+
+    if args.targets:
+        build_targets = {"targets": args.targets}
+    else:
+        build_targets = {name: cfg.build_targets for name, cfg in load_build_config(args.build_config).items()}
+
+    bazel_args = [f"--disk_cache={args.disk_cache}"]
+    if not args.full_build:
+        bazel_args.append("--nobuild")
+
+    log_dir = Path(os.environ.get("LOG_DIR", "_logs/logs"))
+    log_dir.mkdir(parents=True, exist_ok=True)
+    output_dir_modules = repo_root / "bazel_common"
+    bisector = Bisector(build_targets, args.config, log_dir, bazel_args, output_dir_modules)
+
+    try:
+        result = bisect(good, bad, bisector, args.mirror_dir, skip_verify=args.skip_verify)
+    finally:
+        # Restore the generated files of the checked-in known_good.json
+        generate_modules(repo_root / "known_good.json", output_dir_modules)
+
+    print(f"=== Bisection finished after {bisector.steps} step(s) ===")
+    if result is None:
+        sys.exit(1)
+    (group_name, name), commit = result
+    module = bad.modules[group_name][name]
+    if commit:
+        print(f"First failing commit: {name} {commit} ({module.repo.removesuffix('.git')}/commit/{commit})")
+    else:
+        print(f"First failing update: {name} (not pinned by commit, no commit bisection)")
+
+
+if __name__ == "__main__":
+    main()
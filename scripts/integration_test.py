@@ -25,7 +25,10 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# known_good.models imports scripts/tooling from the repository root
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from models.build_config import BuildModuleConfig, load_build_config
 from known_good.models import Module
@@ -153,7 +156,9 @@ def get_identifier_and_link(module: Optional[Module]) -> Tuple[Optional[str], st
     return identifier, link
 
 
-def build_group(group_name: str, targets: str, config: str, log_file: Path) -> Tuple[int, int]:
+def build_group(
+    group_name: str, targets: str, config: str, log_file: Path, extra_args: Optional[List[str]] = None
+) -> Tuple[int, int]:
     """Build a group of Bazel targets.
 
     Args:
@@ -161,16 +166,19 @@ def build_group(group_name: str, targets: str, config: str, log_file: Path) -> T
         targets: Bazel targets to build
         config: Bazel config to use
         log_file: Path to log file
+        extra_args: Additional bazel build options, e.g. --nobuild or --disk_cache
 
     Returns:
         Tuple of (exit_code, duration_seconds)
     """
     print(f"--- Building group: {group_name} ---")
 
+    extra_args = extra_args or []
+
     # Build command
-    cmd = ["bazel", "build", "--verbose_failures", f"--config={config}"] + targets.split()
+    cmd = ["bazel", "build", "--verbose_failures", f"--config={config}"] + extra_args + targets.split()
 
-    print(f"bazel build --verbose_failures --config {config} {targets}")
+    print(f"bazel build --verbose_failures --config {config} {' '.join(extra_args + [targets])}")
     print(f"::group::Bazel build ({group_name})")
 
     start_time = time.time()
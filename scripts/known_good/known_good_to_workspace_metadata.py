@@ -13,8 +13,12 @@
 # *******************************************************************************
 import argparse
 import csv
+import sys
 from pathlib import Path
 
+# models imports scripts/tooling from the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
 from models.known_good import load_known_good
 
 MODULES_CSV_HEADER = ["repo_url", "name", "workspace_path", "version", "hash", "branch"]
@@ -42,10 +46,8 @@ def main():
     except ValueError as e:
         raise SystemExit(f"ERROR: {e}")
 
-    modules = [module for group in known_good.modules.values() for module in group.values()]
-
     gita_metadata = []
-    for module in modules:
+    for module in known_good.all_modules:
         if not module.repo:
             raise RuntimeError(f"Module {module.name}: repo must not be empty")
 
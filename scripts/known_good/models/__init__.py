@@ -10,8 +10,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
-"""Models for score reference integration tools."""
+"""Models for score reference integration tools.
 
-from .module import Module, Metadata
+The implementation lives in scripts/tooling/lib/known_good, which is also
+built with Bazel; this package re-exports it for the standalone scripts,
+which put the repository root on sys.path.
+"""
 
-__all__ = ["Module", "Metadata"]
+from scripts.tooling.lib.known_good import KnownGood, Metadata, Module, load_known_good
+
+__all__ = ["KnownGood", "Metadata", "Module", "load_known_good"]
@@ -32,6 +32,10 @@ import datetime as dt
 from pathlib import Path
 from typing import Dict, List
 import logging
+import sys
+
+# models imports scripts/tooling from the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 from models import Module
 from models.known_good import KnownGood, load_known_good
@@ -143,7 +147,9 @@ def apply_overrides(known_good: KnownGood, repo_overrides: List[str]) -> KnownGo
         Updated KnownGood instance
     """
     # Parse and apply overrides
-    overrides_applied = parse_and_apply_overrides(known_good.modules, repo_overrides)
+    overrides_applied = parse_and_apply_overrides(known_good.by_name, repo_overrides)
+    # Overrides may change the repository of a module
+    known_good.reindex()
 
     if overrides_applied == 0:
         logging.warning("No overrides were applied to any modules")
@@ -227,7 +233,7 @@ Examples:
     overrides = args.module_overrides
 
     updated_known_good = apply_overrides(known_good, overrides)
-    updated_known_good.write(Path(output_path), args.dry_run)
+    updated_known_good.write(Path(output_path), dry_run=args.dry_run)
 
 
 if __name__ == "__main__":
@@ -23,6 +23,9 @@ Usage:
       --output-dir-coverage rust_coverage
 
 The generated score_modules_NAME_.MODULE.bazel file is included by MODULE.bazel.
+Files whose content only differs in the generation timestamp are left untouched,
+and the groups that did change are reported (also as `changed_groups` in
+$GITHUB_OUTPUT when set).
 
 Note: To override repository commits before generating the MODULE.bazel file,
 use scripts/known_good/override_known_good_repo.py first to create an updated known_good.json.
@@ -32,15 +35,21 @@ import argparse
 import logging
 import os
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# models imports scripts/tooling from the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
 from models import Module
-from models.known_good import load_known_good
+from models.known_good import load_known_good, normalize_repo_url
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
 
+GENERATED_AT_PATTERN = re.compile(r"^# Generated from known_good\.json at .*$", re.MULTILINE)
+
 
 def generate_git_override_blocks(modules: List[Module], repo_commit_dict: Dict[str, str]) -> List[str]:
     """Generate bazel_dep and git_override blocks for each module."""
@@ -49,9 +58,8 @@ def generate_git_override_blocks(modules: List[Module], repo_commit_dict: Dict[s
     for module in modules:
         commit = module.hash
 
-        # Allow overriding specific repos via command line
-        if module.repo in repo_commit_dict:
-            commit = repo_commit_dict[module.repo]
+        # Allow overriding specific repos via command line (keyed by normalized URL)
+        commit = repo_commit_dict.get(normalize_repo_url(module.repo), commit)
 
         # Generate patches lines if bazel_patches exist
         patches_lines = ""
@@ -207,6 +215,32 @@ def generate_file_content(
     return header + "\n".join(blocks)
 
 
+def semantic_content(content: str) -> str:
+    """Return *content* without the generation timestamp, which changes on every run."""
+    return GENERATED_AT_PATTERN.sub("", content)
+
+
+def write_if_changed(path: str | Path, content: str) -> bool:
+    """
+    Write *content* to *path* unless the file already has the same semantic content.
+
+    Leaving unchanged files untouched keeps their mtime, so Bazel does not
+    re-evaluate module resolution and the lockfile for a timestamp-only change.
+
+    Returns:
+        True if the file was written
+    """
+    path = Path(path)
+    try:
+        existing = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = None
+    if existing is not None and semantic_content(existing) == semantic_content(content):
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate score_modules.MODULE.bazel file(s) from known_good.json",
@@ -244,6 +278,7 @@ Note:
     )
     parser.add_argument(
         "--output-dir-coverage",
+        type=Path,
         default=Path(__file__).parents[2] / "rust_coverage",
         help="Output directory for BUILD coverage file (default: rust_coverage in repo root)",
     )
@@ -286,7 +321,7 @@ Note:
                     "Expected format: https://github.com/org/repo.git@<commit_sha>"
                 )
             repo_url, commit_hash = entry.split("@", 1)
-            repo_commit_dict[repo_url] = commit_hash
+            repo_commit_dict[normalize_repo_url(repo_url)] = commit_hash
 
     # Load known_good.json
     try:
@@ -299,11 +334,17 @@ Note:
     if not known_good.modules:
         raise SystemExit("No modules found in known_good.json")
 
+    for repo_url in repo_commit_dict:
+        if not known_good.modules_for_repo(repo_url):
+            logging.warning(f"--repo-override {repo_url} does not match any module in known_good.json")
+
     # Generate files based on structure (flat vs grouped)
     output_dir_modules = os.path.abspath(args.output_dir_modules)
     os.makedirs(output_dir_modules, exist_ok=True)
 
     generated_files = []
+    unchanged_files = []
+    changed_groups = []
     total_module_count = 0
 
     for group_name, group_modules in known_good.modules.items():
@@ -330,12 +371,14 @@ Note:
             print(content_module)
             print("---- END GENERATED CONTENT FOR MODULE ----")
             print(f"\nGenerated {len(modules)} {args.override_type}_override entries for group '{group_name}'")
-        else:
-            with open(output_path_modules, "w", encoding="utf-8") as f:
-                f.write(content_module)
+        elif write_if_changed(output_path_modules, content_module):
             generated_files.append(output_path_modules)
+            changed_groups.append(group_name)
             total_module_count += len(modules)
             print(f"Generated {output_path_modules} with {len(modules)} {args.override_type}_override entries")
+        else:
+            unchanged_files.append(output_path_modules)
+            print(f"Unchanged {output_path_modules}")
 
         # Generate file content of BUILD coverage files
         if "target_sw" not in group_name:
@@ -349,14 +392,29 @@ Note:
             print(content_build)
             print("---- END GENERATED CONTENT FOR BUILD ----")
             print(f"\nGenerated {len(modules)} {args.override_type}_override entries for group '{group_name}'")
-        else:
-            with open(output_path_coverage, "w", encoding="utf-8") as f:
-                f.write(content_build)
+        elif write_if_changed(output_path_coverage, content_build):
             generated_files.append(output_path_coverage)
+            if group_name not in changed_groups:
+                changed_groups.append(group_name)
             print(f"Generated {output_path_coverage}")
+        else:
+            unchanged_files.append(output_path_coverage)
+            print(f"Unchanged {output_path_coverage}")
+
+    if args.dry_run:
+        return
 
-    if not args.dry_run and generated_files:
+    if generated_files:
         print(f"\nSuccessfully generated {len(generated_files)} file(s) with {total_module_count} total modules")
+    if unchanged_files:
+        print(f"{len(unchanged_files)} file(s) unchanged")
+    print(f"Changed groups: {', '.join(changed_groups) if changed_groups else 'none'}")
+
+    # Let workflow steps skip work for groups that did not change
+    github_output = os.environ.get("GITHUB_OUTPUT")
+    if github_output:
+        with open(github_output, "a", encoding="utf-8") as f:
+            f.write(f"changed_groups={' '.join(changed_groups)}\n")
 
 
 if __name__ == "__main__":
@@ -25,6 +25,12 @@ Usage:
 	  --known-good score_reference_integration/known_good.json \
 	  [--branch main] [--output updated_known_good.json]
 
+With --trial, the updates are not accepted blindly: candidate known_good
+variants (the combined update plus one per updated module) are built in
+parallel, each in its own git worktree and Bazel output base but sharing the
+disk and repository caches, and only the largest subset of updates that builds
+is written to --output.
+
 Environment:
   Optionally set GITHUB_TOKEN to increase rate limits / access private repos.
 
@@ -37,14 +43,20 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import copy
 import shutil
 import subprocess
 import json
 import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from models.known_good import load_known_good
+# models imports scripts/tooling from the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from models.known_good import KnownGood, load_known_good
 
 try:
     from github import Github, GithubException
@@ -55,6 +67,11 @@ except ImportError:
     Github = None
     GithubException = None
 
+REPO_ROOT = Path(__file__).parents[2]
+UPDATE_MODULE_SCRIPT = Path(__file__).parent / "update_module_from_known_good.py"
+
+ModuleKey = tuple[str, str]  # (group name, module name)
+
 
 def fetch_latest_commit(owner_repo: str, branch: str, token: str | None) -> str:
     """Fetch latest commit sha for given owner_repo & branch using PyGithub."""
@@ -98,6 +115,136 @@ def fetch_latest_commit_gh(owner_repo: str, branch: str) -> str:
     return sha
 
 
+def apply_updates(original: KnownGood, updated: KnownGood, keys: list[ModuleKey]) -> KnownGood:
+    """Return a copy of *original* with the modules in *keys* taken from *updated*."""
+    result = copy.deepcopy(original)
+    for group_name, name in keys:
+        result.modules[group_name][name] = copy.deepcopy(updated.modules[group_name][name])
+    result.reindex()
+    return result
+
+
+def build_variant(known_good: KnownGood, label: str, work_dir: Path, args: argparse.Namespace) -> bool:
+    """Build *known_good* in a fresh worktree with its own Bazel output base.
+
+    All variants share the disk, repository and repository contents caches in
+    ``args.cache_dir``, so only what a variant changes is fetched and built.
+
+    Returns:
+        True if the build succeeds
+    """
+    variant_dir = work_dir / label
+    source_dir = variant_dir / "src"
+    output_base = variant_dir / "output_base"
+    variant_dir.mkdir(parents=True)
+    log_file = Path(args.trial_log_dir) / f"{label}.log"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        subprocess.run(
+            ["git", "-C", str(REPO_ROOT), "worktree", "add", "--detach", str(source_dir), "HEAD"],
+            check=True,
+            capture_output=True,
+        )
+        known_good_path = variant_dir / "known_good.json"
+        known_good_path.write_text(json.dumps(known_good.to_dict(), indent=4) + "\n", encoding="utf-8")
+        subprocess.run(
+            [
+                sys.executable,
+                str(UPDATE_MODULE_SCRIPT),
+                "--known",
+                str(known_good_path),
+                "--output-dir-modules",
+                str(source_dir / "bazel_common"),
+                "--output-dir-coverage",
+                str(source_dir / "rust_coverage"),
+            ],
+            check=True,
+            capture_output=True,
+        )
+        cache_dir = Path(args.cache_dir)
+        cmd = [
+            "bazel",
+            f"--output_base={output_base}",
+            "build",
+            f"--config={args.config}",
+            "--lockfile_mode=update",
+            f"--disk_cache={cache_dir / 'disk'}",
+            f"--repository_cache={cache_dir / 'repo'}",
+            f"--repo_contents_cache={cache_dir / 'repo_contents'}",
+            *args.targets.split(),
+        ]
+        print(f"[{label}] building ({log_file})")
+        with open(log_file, "w", encoding="utf-8") as f:
+            result = subprocess.run(cmd, cwd=source_dir, stdout=f, stderr=subprocess.STDOUT, check=False)
+        # Stop the server and delete the output base of this variant
+        subprocess.run(
+            ["bazel", f"--output_base={output_base}", "clean", "--expunge"],
+            cwd=source_dir,
+            capture_output=True,
+            check=False,
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"[{label}] could not be prepared: {e.stderr.decode(errors='replace').strip() or e}", file=sys.stderr)
+        return False
+    finally:
+        subprocess.run(
+            ["git", "-C", str(REPO_ROOT), "worktree", "remove", "--force", str(source_dir)],
+            capture_output=True,
+            check=False,
+        )
+    ok = result.returncode == 0
+    print(f"[{label}] {'ok' if ok else f'failed ({result.returncode})'}")
+    return ok
+
+
+def _label(key: ModuleKey) -> str:
+    group_name, name = key
+    return f"{group_name}-{name}"
+
+
+def trial_updates(
+    original: KnownGood, updated: KnownGood, keys: list[ModuleKey], args: argparse.Namespace
+) -> list[ModuleKey]:
+    """Find the largest subset of the module updates *keys* that builds.
+
+    The combined update and every single-module update are built in parallel.
+    If the combined update fails, the updates that build on their own are
+    combined; should they conflict with each other, they are added one by one
+    and kept only if the build still succeeds.
+
+    Returns:
+        Accepted updates
+    """
+    # Module names are only unique within their group.
+    variants: dict[str, list[ModuleKey]] = {_label(key): [key] for key in keys}
+    if len(keys) > 1:
+        variants["combined"] = keys
+
+    with tempfile.TemporaryDirectory(prefix="known-good-trials-") as tmp:
+        work_dir = Path(tmp)
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            futures = {
+                label: pool.submit(build_variant, apply_updates(original, updated, subset), label, work_dir, args)
+                for label, subset in variants.items()
+            }
+            results = {label: future.result() for label, future in futures.items()}
+
+        if results.get("combined"):
+            return keys
+        passing = [key for key in keys if results[_label(key)]]
+        if len(passing) <= 1 or build_variant(apply_updates(original, updated, passing), "passing", work_dir, args):
+            return passing
+
+        accepted: list[ModuleKey] = []
+        for i, key in enumerate(passing, start=1):
+            candidate = [*accepted, key]
+            label = f"passing-{i}"
+            if build_variant(apply_updates(original, updated, candidate), label, work_dir, args):
+                accepted = candidate
+        return accepted
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Update module hashes to latest commit on branch")
     p.add_argument(
@@ -113,6 +260,24 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Disable GitHub CLI usage even if installed; fall back to HTTP API; GITHUB_TOKEN has to be known in the environment",
     )
+    p.add_argument(
+        "--trial",
+        action="store_true",
+        help="Build update variants in parallel and keep only the largest subset of updates that builds",
+    )
+    p.add_argument("--targets", default="//...", help="Bazel targets built for each variant (default: //...)")
+    p.add_argument("--config", default="linux-x86_64", help="Bazel config for variant builds (default: linux-x86_64)")
+    p.add_argument("--jobs", type=int, default=2, help="Number of variants built in parallel (default: 2)")
+    p.add_argument(
+        "--cache-dir",
+        default=str(Path.home() / ".cache" / "bazel"),
+        help="Directory of the Bazel caches shared by all variants (default: ~/.cache/bazel)",
+    )
+    p.add_argument(
+        "--trial-log-dir",
+        default="_logs/trials",
+        help="Directory for the build log of each variant (default: _logs/trials)",
+    )
     return p.parse_args(argv)
 
 
@@ -150,7 +315,10 @@ def main(argv: list[str]) -> int:
     if args.no_gh and shutil.which("gh") is not None:
         print("INFO: --no-gh specified; ignoring installed 'gh' CLI", file=sys.stderr)
 
-    for mod in known_good.modules.values():
+    original = copy.deepcopy(known_good)
+    updated: list[ModuleKey] = []
+    group_modules = [(group_name, mod) for group_name, mods in known_good.modules.items() for mod in mods.values()]
+    for group_name, mod in group_modules:
         if mod.pin_version:
             print(f"{mod.name}: pinned, skipping")
             continue
@@ -170,6 +338,7 @@ def main(argv: list[str]) -> int:
                     print(f"{mod.name}: {mod.version} -> {latest[:8]} (branch {branch})")
                 else:
                     print(f"{mod.name}: {old_hash[:8]} -> {latest[:8]} (branch {branch})")
+                updated.append((group_name, mod.name))
             else:
                 print(f"{mod.name}: {old_hash[:8]} (no update)")
         except Exception as e:  # noqa: BLE001
@@ -178,6 +347,14 @@ def main(argv: list[str]) -> int:
             if args.fail_fast:
                 break
 
+    if args.trial and updated:
+        accepted = trial_updates(original, known_good, updated, args)
+        rejected = [_label(key) for key in updated if key not in accepted]
+        print(f"Accepted {len(accepted)} of {len(updated)} update(s)")
+        if rejected:
+            print(f"Rejected updates (build failed): {', '.join(rejected)}", file=sys.stderr)
+        known_good = apply_updates(original, known_good, accepted)
+
     if args.output:
         try:
             known_good.write(Path(args.output))
@@ -19,6 +19,9 @@ from pathlib import Path
 from pprint import pprint
 from subprocess import PIPE, Popen, run
 
+# known_good.models imports scripts/tooling from the repository root
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
 from known_good.models.known_good import load_known_good
 from known_good.models.module import Module
 
@@ -319,11 +322,17 @@ def main() -> bool:
     if args.modules_to_test:
         print_centered(f"QR: User requested tests only for specified modules: {', '.join(args.modules_to_test)}")
 
-    for module in known.modules["target_sw"].values():
-        if args.modules_to_test and module.name not in args.modules_to_test:
-            print_centered(f"QR: Skipping module {module.name}")
-            continue
+    target_sw = known.modules["target_sw"]
+    modules = list(target_sw.values())
+    if args.modules_to_test:
+        modules = []
+        for name in args.modules_to_test:
+            if name not in target_sw:
+                print_centered(f"QR: Skipping unknown module {name}")
+                continue
+            modules.append(target_sw[name])
 
+    for module in modules:
         print_centered(f"QR: Testing module: {module.name}")
         unit_tests_summary[module.name] = run_unit_test_with_coverage(module=module)
 
@@ -0,0 +1,344 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Benchmark the tooling on large synthetic inputs and compare against earlier runs.
+
+At --scale 1 the inputs are a known_good.json with 1500 modules, a 2 GiB Bazel
+log, 256 MiB unit test and coverage logs, a 500 MB SARIF file and 50k needs
+(see synthetic.py). Inputs are generated once into --inputs and reused.
+
+Every case runs in its own interpreter, as the scripts under test put
+different directories on sys.path, and its result is checked against the
+values the synthetic input was built with. Timings (best of --repeat) are
+appended to --results as one JSON line per run; each run is compared with the
+latest earlier run of the same host and scale, and --max-regression makes the
+run fail if a case got slower by more than that fraction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from scripts.tooling.benchmarks import synthetic
+from scripts.tooling.lib.cache import default_cache_dir
+
+_LOG = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Input sizes at --scale 1, and the smallest sizes used at any scale
+SIZES = {
+    "modules": (1500, 10),
+    "bazel_log": (2 * 1024**3, 64 * 1024),
+    "unit_test_log": (256 * 1024**2, 64 * 1024),
+    "coverage_log": (256 * 1024**2, 64 * 1024),
+    "sarif": (500 * 1000**2, 64 * 1024),
+    "needs": (50_000, 100),
+}
+
+
+def default_results_path() -> Path:
+    """Return the default location of the benchmark results."""
+    return default_cache_dir() / "benchmarks" / "results.jsonl"
+
+
+def default_inputs_path() -> Path:
+    """Return the default location of the generated inputs."""
+    return default_cache_dir() / "benchmarks" / "inputs"
+
+
+def _size(name: str, scale: float) -> int:
+    full, minimum = SIZES[name]
+    return max(minimum, int(full * scale))
+
+
+def _import_scripts(*directories: str) -> None:
+    """Make the modules of *directories* (relative to the repository root) importable like their scripts do."""
+    for directory in directories:
+        sys.path.insert(0, str(REPO_ROOT / directory))
+
+
+@dataclass
+class Benchmark:
+    """A prepared benchmark case: *run* is timed and must return *expected*."""
+
+    run: Callable[[], Any]
+    expected: Any
+    input_bytes: int
+
+
+def _bench_load_known_good(inputs: Path, scale: float) -> Benchmark:
+    from scripts.tooling.lib.known_good import load_known_good
+
+    path, expected = synthetic.known_good(inputs, _size("modules", scale))
+    return Benchmark(lambda: len(load_known_good(path).all_modules), expected["modules"], path.stat().st_size)
+
+
+def _bench_generate_git_override_blocks(inputs: Path, scale: float) -> Benchmark:
+    _import_scripts("scripts/known_good")
+    from models.known_good import load_known_good
+    from update_module_from_known_good import generate_git_override_blocks
+
+    path, expected = synthetic.known_good(inputs, _size("modules", scale))
+    modules = load_known_good(path).all_modules
+    overrides = {module.repo: "f" * 40 for module in modules[::50]}
+    return Benchmark(
+        lambda: len(generate_git_override_blocks(modules, overrides)), expected["modules"], path.stat().st_size
+    )
+
+
+def _bench_count_pattern(inputs: Path, scale: float) -> Benchmark:
+    _import_scripts("scripts")
+    from integration_test import count_pattern
+
+    path, expected = synthetic.bazel_log(inputs, _size("bazel_log", scale))
+    # The two patterns integration_test.py counts in every build log
+    return Benchmark(
+        lambda: {pattern: count_pattern(path, pattern) for pattern in expected}, expected, path.stat().st_size
+    )
+
+
+def _bench_extract_ut_summary(inputs: Path, scale: float) -> Benchmark:
+    _import_scripts("scripts")
+    from quality_runners import extract_ut_summary
+
+    path, expected = synthetic.unit_test_log(inputs, _size("unit_test_log", scale))
+    logs = path.read_text(encoding="utf-8")
+    return Benchmark(lambda: extract_ut_summary(logs), expected, path.stat().st_size)
+
+
+def _bench_extract_coverage_summary(inputs: Path, scale: float) -> Benchmark:
+    _import_scripts("scripts")
+    from quality_runners import extract_coverage_summary
+
+    path, expected = synthetic.coverage_log(inputs, _size("coverage_log", scale))
+    logs = path.read_text(encoding="utf-8")
+    return Benchmark(lambda: extract_coverage_summary(logs), expected, path.stat().st_size)
+
+
+def _bench_filter_sarif(inputs: Path, scale: float) -> Benchmark:
+    from scripts.tooling.cli.workflow.recategorize_guidelines import in_repos
+    from scripts.tooling.lib.sarif import filter_sarif
+
+    path, expected = synthetic.sarif(inputs, _size("sarif", scale))
+    dst = path.with_name(f"{path.stem}.filtered.sarif")
+
+    def run():
+        kept = sum(stats.kept for stats in filter_sarif(path, dst, in_repos))
+        dst.unlink()
+        return kept
+
+    return Benchmark(run, expected["kept"], path.stat().st_size)
+
+
+def _bench_needs_filters(inputs: Path, scale: float) -> Benchmark:
+    _import_scripts("docs")
+    import needs_filters
+
+    path, expected = synthetic.needs(inputs, _size("needs", scale))
+    needs = json.loads(path.read_text(encoding="utf-8"))
+
+    def run():
+        # The charts of a docs build: one index, then every chart over it
+        needs_filters.reset_needs_index()
+        total = 0
+        for area in expected["areas"]:
+            results = []
+            needs_filters.area_verification_status(needs, results, area)
+            needs_filters.std_req_status_for_area(needs, [], area)
+            total += sum(results)
+        for workflow in expected["workflows"]:
+            needs_filters.wp_tag_status(needs, [], workflow)
+            needs_filters.wp_done_automation_status(needs, [], workflow)
+        return total
+
+    return Benchmark(run, expected["gd_reqs"], path.stat().st_size)
+
+
+CASES: dict[str, Callable[[Path, float], Benchmark]] = {
+    "load_known_good": _bench_load_known_good,
+    "generate_git_override_blocks": _bench_generate_git_override_blocks,
+    "count_pattern": _bench_count_pattern,
+    "extract_ut_summary": _bench_extract_ut_summary,
+    "extract_coverage_summary": _bench_extract_coverage_summary,
+    "filter_sarif": _bench_filter_sarif,
+    "needs_filters": _bench_needs_filters,
+}
+
+
+def run_case(name: str, inputs: Path, scale: float, repeat: int) -> dict[str, Any]:
+    """Prepare and time one case in this process.
+
+    Raises:
+        AssertionError: If the case does not return the expected value
+    """
+    benchmark = CASES[name](inputs, scale)
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = benchmark.run()
+        runs.append(time.perf_counter() - start)
+        if value != benchmark.expected:
+            raise AssertionError(f"{name} returned {value!r}, expected {benchmark.expected!r}")
+    return {
+        "seconds": min(runs),
+        "median": statistics.median(runs),
+        "runs": runs,
+        "input_bytes": benchmark.input_bytes,
+    }
+
+
+def _run_case_process(name: str, inputs: Path, scale: float, repeat: int) -> dict[str, Any] | None:
+    """Run one case in a new interpreter; return its timings, None if it failed."""
+    command = [
+        sys.executable,
+        "-m",
+        "scripts.tooling.benchmarks.run_benchmarks",
+        f"--case={name}",
+        f"--inputs={inputs}",
+        f"--scale={scale}",
+        f"--repeat={repeat}",
+    ]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        _LOG.error(f"{name} failed:\n{result.stderr.strip()}")
+        return None
+    # The functions under test may print; the timings are the last line.
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _git_commit() -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=False
+    )
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def load_results(path: Path) -> list[dict[str, Any]]:
+    """Return the stored benchmark runs, oldest first."""
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_baseline(records: list[dict[str, Any]], host: str, scale: float) -> dict[str, Any] | None:
+    """Return the latest run of *host* at *scale*, None if there is none."""
+    for record in reversed(records):
+        if record.get("host") == host and record.get("scale") == scale:
+            return record
+    return None
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any] | None, max_regression: float | None) -> list[str]:
+    """Log the timings of *current* against *baseline*; return the cases slower than *max_regression* allows."""
+    regressions = []
+    base_cases = baseline["cases"] if baseline else {}
+    _LOG.info(f"{'case':<30} {'seconds':>10} {'baseline':>10} {'change':>8}")
+    for name, timing in current["cases"].items():
+        base = base_cases.get(name)
+        if base is None:
+            _LOG.info(f"{name:<30} {timing['seconds']:10.3f} {'-':>10} {'-':>8}")
+            continue
+        change = timing["seconds"] / base["seconds"] - 1 if base["seconds"] else 0.0
+        _LOG.info(f"{name:<30} {timing['seconds']:10.3f} {base['seconds']:10.3f} {change:+8.1%}")
+        if max_regression is not None and change > max_regression:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for standalone execution."""
+    parser = argparse.ArgumentParser(description="Benchmark the tooling on large synthetic inputs")
+    parser.add_argument("cases", nargs="*", metavar="CASE", help=f"Cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="Input size relative to the full size (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best counts (default: 3)")
+    parser.add_argument(
+        "--inputs",
+        type=Path,
+        default=default_inputs_path(),
+        help="Directory of the generated inputs (default: ~/.cache/score-tooling/benchmarks/inputs)",
+    )
+    parser.add_argument(
+        "--results",
+        type=Path,
+        default=default_results_path(),
+        help="JSON lines file the timings are appended to (default: ~/.cache/score-tooling/benchmarks/results.jsonl)",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        metavar="FRACTION",
+        help="Fail if a case is slower than the baseline by more than this fraction (e.g. 0.2)",
+    )
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.cases) - set(CASES))
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.inputs, args.scale, args.repeat)))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    record: dict[str, Any] = {
+        "time": dt.datetime.now(dt.UTC).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "scale": args.scale,
+        "cases": {},
+    }
+    failed = []
+    for name in args.cases or CASES:
+        _LOG.info(f"Running {name}")
+        timing = _run_case_process(name, args.inputs, args.scale, args.repeat)
+        if timing is None:
+            failed.append(name)
+        else:
+            record["cases"][name] = timing
+
+    baseline = find_baseline(load_results(args.results), record["host"], args.scale)
+    if baseline:
+        _LOG.info(f"Compared with {baseline['commit'] or 'unknown commit'} of {baseline['time']}")
+    regressions = compare(record, baseline, args.max_regression)
+
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.results, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    _LOG.info(f"Results appended to {args.results}")
+
+    if failed:
+        _LOG.error(f"Failed cases: {', '.join(failed)}")
+    if regressions:
+        _LOG.error(f"Slower than the baseline by more than {args.max_regression:.0%}: {', '.join(regressions)}")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
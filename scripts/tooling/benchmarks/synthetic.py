@@ -0,0 +1,230 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Deterministic synthetic inputs for the benchmarks, at a configurable size.
+
+Every generator takes the directory to write to and a size, writes its input
+once (file names contain the size and GENERATOR_VERSION, so multi-GB files are
+reused between runs) and returns the path together with the values the
+benchmarked function is expected to produce for it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+GENERATOR_VERSION = 1
+
+# Lines per block of the text logs; blocks are repeated up to the requested size
+_BLOCK_LINES = 1000
+
+
+def _hex(seed: str, length: int = 40) -> str:
+    return hashlib.sha1(seed.encode("utf-8")).hexdigest()[:length]
+
+
+def _write_once(path: Path, write: Callable[[Any], None]) -> None:
+    """Write *path* with *write(file)* unless it exists; atomically, so an interrupted run leaves no file."""
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        write(f)
+    tmp.replace(path)
+
+
+def _repeat_block(path: Path, block: str, size: int, tail: str = "") -> int:
+    """Write *block* until *path* has at least *size* bytes, then *tail*; return the number of blocks."""
+    count = max(1, math.ceil(size / len(block.encode("utf-8"))))
+
+    def write(f):
+        for _ in range(count):
+            f.write(block)
+        f.write(tail)
+
+    _write_once(path, write)
+    return count
+
+
+def known_good(directory: Path, modules: int) -> tuple[Path, dict[str, int]]:
+    """known_good.json with *modules* modules in two groups, some pinned by version and some with patches."""
+    path = directory / f"known_good-{modules}-v{GENERATOR_VERSION}.json"
+    groups: dict[str, dict[str, Any]] = {"target_sw": {}, "tooling": {}}
+    versions = 0
+    for i in range(modules):
+        name = f"score_module_{i:05d}"
+        module: dict[str, Any] = {"repo": f"https://github.com/eclipse-score/module-{i:05d}.git"}
+        if i % 10 == 0:
+            module["version"] = f"1.{i // 10}.0"
+            versions += 1
+        else:
+            module["hash"] = _hex(name)
+        if i % 7 == 0:
+            module["bazel_patches"] = [f"//patches/module_{i:05d}:{n:03d}-fix.patch" for n in range(3)]
+        module["metadata"] = {
+            "code_root_path": "//src/...",
+            "langs": ["cpp", "rust"] if i % 3 == 0 else ["cpp"],
+            "exclude_test_targets": [f"//src/slow:test_{n}" for n in range(i % 4)],
+        }
+        groups["tooling" if i % 5 == 0 else "target_sw"][name] = module
+
+    def write(f):
+        json.dump({"modules": groups, "timestamp": "2026-01-01T00:00:00+00:00Z"}, f, indent=4)
+
+    _write_once(path, write)
+    return path, {"modules": modules, "version_pinned": versions}
+
+
+def bazel_log(directory: Path, size: int) -> tuple[Path, dict[str, int]]:
+    """Bazel build log of about *size* bytes with compiler warnings and deprecation notices."""
+    path = directory / f"bazel-{size}-v{GENERATOR_VERSION}.log"
+    lines = []
+    warnings = deprecated = 0
+    for i in range(_BLOCK_LINES):
+        if i % 50 == 0:
+            lines.append(f"external/score_module/src/file_{i}.cpp:{i}:7: warning: unused variable 'x{i}' [-Wunused]")
+            warnings += 1
+        elif i % 125 == 0:
+            # Counted for both patterns, as Bazel's own warnings contain "WARNING:"
+            lines.append(f"WARNING: target //src:lib_{i} uses a DEPRECATED attribute; see the migration guide")
+            warnings += 1
+            deprecated += 1
+        elif i % 2 == 0:
+            lines.append(f"INFO: From Compiling src/module_{i}/impl.cpp: [{i} / {_BLOCK_LINES}] 12 actions running")
+        else:
+            lines.append(f"[{i:,} / 100,000] Compiling src/module_{i}/impl.cpp; 3s linux-sandbox ... (8 actions)")
+    count = _repeat_block(path, "\n".join(lines) + "\n", size)
+    return path, {"warning:": warnings * count, "deprecated": deprecated * count}
+
+
+def unit_test_log(directory: Path, size: int) -> tuple[Path, dict[str, int]]:
+    """Unit test run output of about *size* bytes ending with the summary line."""
+    path = directory / f"unit_tests-{size}-v{GENERATOR_VERSION}.log"
+    lines = [
+        f"[ RUN      ] Suite{i // 10}.Case{i}\n[       OK ] Suite{i // 10}.Case{i} (0 ms)"
+        for i in range(_BLOCK_LINES // 2)
+    ]
+    expected = {"passed": 9871, "failed": 12, "skipped": 117, "total": 10000}
+    tail = (
+        f"Test cases: finished with {expected['passed']} passing, {expected['skipped']} skipped "
+        f"and {expected['failed']} failing out of {expected['total']} test cases\n"
+    )
+    _repeat_block(path, "\n".join(lines) + "\n", size, tail)
+    return path, expected
+
+
+def coverage_log(directory: Path, size: int) -> tuple[Path, dict[str, str]]:
+    """genhtml output of about *size* bytes, as printed for a large LCOV tracefile."""
+    path = directory / f"coverage-{size}-v{GENERATOR_VERSION}.log"
+    lines = []
+    for i in range(_BLOCK_LINES // 4):
+        lines += [
+            f"Processing file src/module_{i % 40}/sub_{i}/impl_{i}.cpp",
+            f"  lines=120 hit={i % 120} functions=12 hit={i % 12}",
+            f"  branches=48 hit={i % 48}",
+            "Reading data file coverage.dat",
+        ]
+    expected = {"lines": "93.0%", "functions": "88.5%", "branches": "71.2%"}
+    tail = (
+        "Overall coverage rate:\n"
+        f"  lines......: {expected['lines']} (1234 of 1327 lines)\n"
+        f"  functions......: {expected['functions']} (177 of 200 functions)\n"
+        f"  branches......: {expected['branches']} (356 of 500 branches)\n"
+    )
+    _repeat_block(path, "\n".join(lines) + "\n", size, tail)
+    return path, expected
+
+
+def _sarif_result(i: int) -> dict[str, Any]:
+    uri = f"repos/score_module_{i % 40}/src/file_{i}.cpp" if i % 2 else f"bazel-out/k8-fastbuild/bin/gen_{i}.cpp"
+    return {
+        "ruleId": f"cpp/misra/rule-{i % 30}",
+        "ruleIndex": i % 30,
+        "message": {"text": f"Finding {i}: the value of the expression is never used in function f_{i}."},
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": uri, "uriBaseId": "%SRCROOT%"},
+                    "region": {"startLine": i % 900 + 1, "startColumn": 5, "endColumn": 17},
+                }
+            }
+        ],
+        "partialFingerprints": {"primaryLocationLineHash": _hex(f"result{i}", 16) + ":1"},
+    }
+
+
+def sarif(directory: Path, size: int) -> tuple[Path, dict[str, int]]:
+    """SARIF file of about *size* bytes in two runs; every second result is inside repos/."""
+    path = directory / f"results-{size}-v{GENERATOR_VERSION}.sarif"
+    result_size = len(json.dumps(_sarif_result(10**6)).encode("utf-8")) + 2
+    per_run = max(1, math.ceil(size / result_size / 2))
+    rules = [
+        {"id": f"cpp/misra/rule-{n}", "properties": {"tags": ["external/misra/obligation/required"]}} for n in range(30)
+    ]
+
+    def results(offset: int) -> Iterator[str]:
+        for i in range(offset, offset + per_run):
+            yield json.dumps(_sarif_result(i))
+
+    def write(f):
+        f.write('{"version": "2.1.0", "runs": [')
+        for run in range(2):
+            if run:
+                f.write(", ")
+            tool = {"driver": {"name": f"tool-{run}", "rules": rules}}
+            f.write(f'{{"tool": {json.dumps(tool)}, "results": [\n')
+            f.write(",\n".join(results(run * per_run)))
+            f.write("\n]}")
+        f.write("]}\n")
+
+    _write_once(path, write)
+    # Results with an odd index are inside repos/
+    return path, {"results": 2 * per_run, "kept": per_run}
+
+
+def needs(directory: Path, count: int) -> tuple[Path, dict[str, Any]]:
+    """sphinx-needs need list with *count* needs: gd_req needs of several areas and workflows, and std_req needs."""
+    path = directory / f"needs-{count}-v{GENERATOR_VERSION}.json"
+    areas = ["requirements_engineering", "architecture_design", "implementation", "verification", "safety_analysis"]
+    status_tags = ["done_automation", "prio_1_automation", "manual_prio_2", "draft"]
+    std_status = ["ok", "recommendation", "open", "action", "deviation", "n/a"]
+
+    def items() -> Iterator[dict[str, Any]]:
+        for i in range(count):
+            if i % 10 == 0:
+                yield {
+                    "id": f"std_req__iso26262__part{i % 12}_{i}",
+                    "type": "std_req",
+                    "tags": [std_status[i % len(std_status)]],
+                }
+                continue
+            yield {
+                "id": f"gd_req__{areas[i % len(areas)]}__{i}",
+                "type": "gd_req",
+                "tags": [areas[i % len(areas)], status_tags[i % len(status_tags)]],
+                "satisfies": [f"wf__{areas[i % len(areas)]}__{i % 20}"],
+                "complies": [f"std_req__iso26262__part{i % 12}_{(i // 10) * 10}"],
+                "is_external": i % 97 == 0,
+            }
+
+    def write(f):
+        json.dump(list(items()), f)
+
+    _write_once(path, write)
+    gd_reqs = sum(1 for i in range(count) if i % 10 and i % 97)
+    return path, {"gd_reqs": gd_reqs, "areas": areas, "workflows": [f"wf__{a}__{n}" for a in areas for n in range(20)]}
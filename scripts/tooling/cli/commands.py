@@ -0,0 +1,49 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Manifest of the tooling CLI commands.
+
+Command modules import heavy dependencies (PyGithub, Jinja2), so the CLI is
+built from this manifest and only the module of the invoked command is
+imported. That module's ``register(subparsers)`` adds the full parser of the
+command; the help texts here must match the ones it registers.
+"""
+
+# Group name -> help
+GROUPS = {
+    "misc": "Miscellaneous utilities",
+    "release": "Release utilities",
+}
+
+# Group name -> {command name: (module, help)}
+COMMANDS = {
+    "misc": {
+        "html_report": (
+            "scripts.tooling.cli.misc.html_report",
+            "Generate an HTML status report from known_good.json",
+        ),
+        "html_dashboard": (
+            "scripts.tooling.cli.misc.html_dashboard",
+            "Generate one HTML status matrix for several known_good.json files",
+        ),
+        "known_good_history": (
+            "scripts.tooling.cli.misc.known_good_history",
+            "Query the history of known_good.json (diff, log, blame, introduced)",
+        ),
+    },
+    "release": {
+        "check_approvals": (
+            "scripts.tooling.cli.release.check_approvals",
+            "Check release branch PR approvals against required maintainers",
+        ),
+    },
+}
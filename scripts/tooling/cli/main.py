@@ -11,21 +11,38 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import argparse
+import importlib
 import sys
+from typing import Optional
 
+from scripts.tooling.cli.commands import COMMANDS, GROUPS
 
-def main() -> None:
+
+def build_parser(argv: list[str]) -> argparse.ArgumentParser:
+    """Build the CLI parser, importing only the module of the command named in *argv*."""
     parser = argparse.ArgumentParser(prog="tooling")
     subparsers = parser.add_subparsers(dest="group", metavar="GROUP")
     subparsers.required = True
 
-    from scripts.tooling.cli.misc import register as _register_misc
-    from scripts.tooling.cli.release import register as _register_release
+    # Neither the main nor the group parsers take options besides --help, so
+    # the invoked group and command are the first two arguments.
+    invoked = tuple(argv[:2])
+    for group, group_help in GROUPS.items():
+        group_parser = subparsers.add_parser(group, help=group_help)
+        group_sub = group_parser.add_subparsers(dest="command", metavar="COMMAND")
+        group_sub.required = True
+        for command, (module, command_help) in COMMANDS[group].items():
+            if invoked == (group, command):
+                importlib.import_module(module).register(group_sub)
+            else:
+                # Placeholder listing the command in --help
+                group_sub.add_parser(command, help=command_help)
+    return parser
 
-    _register_misc(subparsers)
-    _register_release(subparsers)
 
-    args = parser.parse_args()
+def main(argv: Optional[list[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser(argv).parse_args(argv)
     sys.exit(args.func(args))
 
 
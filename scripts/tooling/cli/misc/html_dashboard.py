@@ -0,0 +1,141 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Combined status dashboard for several known_good.json files (e.g. main and release branches)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from scripts.tooling.cli.misc.html_report import (
+    DEFAULT_MAX_WORKERS,
+    TEMPLATE_DIR,
+    add_lookup_arguments,
+    collect_entries,
+    enrich_with_compare_data,
+    open_cache,
+    resolve_path_from_bazel,
+)
+from scripts.tooling.lib.known_good import KnownGood, load_known_good
+
+if TYPE_CHECKING:
+    from scripts.tooling.lib.drift_cache import DriftCache
+
+
+def parse_source(spec: str) -> tuple[str, Path]:
+    """Parse a ``[LABEL=]PATH`` source argument.
+
+    *PATH* is either a known_good.json file or a directory containing one. Without an
+    explicit label the directory name (for ``known_good.json``) or the file stem is used.
+    """
+    label, sep, path_str = spec.partition("=")
+    if not sep:
+        label, path_str = "", spec
+    path = resolve_path_from_bazel(Path(path_str))
+    if path.is_dir():
+        path = path / "known_good.json"
+    if not label:
+        label = path.parent.name if path.name == "known_good.json" else path.stem
+    return label, path
+
+
+def build_matrix(sources: list[tuple[str, KnownGood]], entries_per_source: list[list[dict[str, Any]]]) -> dict:
+    """Arrange per-source module entries into a module x source matrix.
+
+    Returns ``{"columns": [{"label", "timestamp"}], "rows": [{"name", "group", "repo",
+    "owner_repo", "cells": [entry | None, ...]}]}`` with one cell per column.
+    """
+    # Modules of the same name in different groups are different rows.
+    rows: dict[tuple[str, str], dict[str, Any]] = {}
+    for column, entries in enumerate(entries_per_source):
+        for entry in entries:
+            row = rows.setdefault(
+                (entry["group"], entry["name"]),
+                {
+                    "name": entry["name"],
+                    "group": entry["group"],
+                    "repo": entry["repo"],
+                    "owner_repo": entry["owner_repo"],
+                    "cells": [None] * len(sources),
+                },
+            )
+            row["cells"][column] = {
+                key: entry[key] for key in ("hash", "version", "branch", "current_hash", "behind_by", "compare_status")
+            }
+    return {
+        "columns": [{"label": label, "timestamp": known_good.timestamp} for label, known_good in sources],
+        "rows": sorted(rows.values(), key=lambda row: (row["group"], row["name"])),
+    }
+
+
+def generate_dashboard(
+    sources: list[tuple[str, KnownGood]],
+    token: Optional[str] = None,
+    cache: Optional[DriftCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> str:
+    entries_per_source = [collect_entries(known_good) for _, known_good in sources]
+    if token:
+        # One enrichment pass over all sources so shared (repo, ref) pairs are looked up once.
+        enrich_with_compare_data([e for entries in entries_per_source for e in entries], token, cache, max_workers)
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(["html"]),
+    )
+    tmpl = env.get_template("dashboard_template.html")
+    return tmpl.render(matrix_json=json.dumps(build_matrix(sources, entries_per_source), indent=2))
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "html_dashboard",
+        help="Generate one HTML status matrix for several known_good.json files",
+    )
+    parser.add_argument(
+        "sources",
+        metavar="[LABEL=]PATH",
+        nargs="+",
+        help="known_good.json file or directory containing one, optionally prefixed by a column label",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        default="dashboard.html",
+        help="Output HTML file path (default: dashboard.html)",
+    )
+    add_lookup_arguments(parser)
+    parser.set_defaults(func=_run)
+
+
+def _run(args: argparse.Namespace) -> int:
+    sources = []
+    for spec in args.sources:
+        label, path = parse_source(spec)
+        try:
+            sources.append((label, load_known_good(path)))
+        except (FileNotFoundError, ValueError) as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+
+    token = os.environ.get("GITHUB_TOKEN")
+    output = resolve_path_from_bazel(Path(args.output))
+    html = generate_dashboard(sources, token=token, cache=open_cache(args), max_workers=args.jobs)
+    output.write_text(html, encoding="utf-8")
+    print(f"Dashboard for {len(sources)} known_good file(s) written to {output}")
+    return 0
@@ -17,11 +17,13 @@ import json
 import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
+from scripts.tooling.lib.drift_cache import DriftCache, default_cache_path
+from scripts.tooling.lib.drift_history import DriftHistory, build_timeline
 from scripts.tooling.lib.github import fetch_compare, resolve_ref_sha
 from scripts.tooling.lib.known_good import KnownGood, load_known_good
 
@@ -29,6 +31,9 @@ _LOG = logging.getLogger(__name__)
 
 TEMPLATE_DIR = Path(__file__).parent / "assets"
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_HISTORY_WEEKS = 12
+
 
 def _find_repo_root() -> Path:
     candidate = Path(__file__).resolve()
@@ -38,7 +43,8 @@ def _find_repo_root() -> Path:
     return Path.cwd()
 
 
-def _resolve_path_from_bazel(path: Path) -> Path:
+def resolve_path_from_bazel(path: Path) -> Path:
+    """Resolve a relative *path* against the directory ``bazel run`` was started from."""
     if not path.is_absolute():
         build_working_dir = os.environ.get("BUILD_WORKING_DIRECTORY")
         if build_working_dir:
@@ -46,7 +52,8 @@ def _resolve_path_from_bazel(path: Path) -> Path:
     return path.resolve()
 
 
-def _collect_entries(known_good: KnownGood) -> list[dict[str, Any]]:
+def collect_entries(known_good: KnownGood) -> list[dict[str, Any]]:
+    """Return one report entry per module of *known_good*, without GitHub data."""
     entries = []
     for group_name, group_modules in known_good.modules.items():
         for module in group_modules.values():
@@ -71,36 +78,127 @@ def _collect_entries(known_good: KnownGood) -> list[dict[str, Any]]:
     return entries
 
 
-def _enrich_with_compare_data(entries: list[dict[str, Any]], token: str) -> None:
-    for entry in entries:
-        if not entry.get("owner_repo"):
-            continue
+def _resolve_version(owner_repo: str, version: str, token: str, cache: DriftCache) -> Optional[str]:
+    sha = cache.get_ref(owner_repo, version)
+    if not sha:
+        sha = resolve_ref_sha(owner_repo, version, token)
+        if sha:
+            cache.set_ref(owner_repo, version, sha)
+    return sha
+
+
+def _resolve_head(owner_repo: str, branch: str, token: str, cache: DriftCache) -> Optional[str]:
+    head = cache.get_head(owner_repo, branch)
+    if not head:
+        head = resolve_ref_sha(owner_repo, branch, token)
+        if head:
+            cache.set_head(owner_repo, branch, head)
+        else:
+            _LOG.warning("Could not resolve %s@%s", owner_repo, branch)
+    return head
+
+
+def _compare(owner_repo: str, base_sha: str, head_sha: str, token: str, cache: DriftCache) -> Optional[dict[str, Any]]:
+    # Both ends are commit SHAs, so a cached comparison never goes stale.
+    result = cache.get_compare(owner_repo, base_sha, head_sha)
+    if result is None:
+        compare = fetch_compare(owner_repo, base_sha, head_sha, token)
+        if not compare:
+            _LOG.warning("Could not fetch compare data for %s %s...%s", owner_repo, base_sha[:10], head_sha[:10])
+            return None
+        result = {"ahead_by": compare.ahead_by, "status": compare.status, "head_sha": head_sha}
+        cache.set_compare(owner_repo, base_sha, head_sha, result)
+    return result
+
+
+def _map_unique(pool: ThreadPoolExecutor, func, keys: list[tuple[str, ...]]) -> dict[tuple[str, ...], Any]:
+    """Run *func* once per unique key on *pool* and return ``{key: result}``."""
+    unique = list(dict.fromkeys(keys))
+    return dict(zip(unique, pool.map(lambda key: func(*key), unique), strict=True))
 
+
+def enrich_with_compare_data(
+    entries: list[dict[str, Any]],
+    token: str,
+    cache: Optional[DriftCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> None:
+    """Fill ``current_hash``, ``behind_by`` and ``compare_status`` of *entries* from GitHub.
+
+    Lookups run concurrently on a pool of *max_workers* threads. Entries may come
+    from several known_good files: each unique version, branch HEAD and comparison
+    is resolved only once, however many entries share it.
+    """
+    cache = cache if cache is not None else DriftCache()
+    candidates = [entry for entry in entries if entry.get("owner_repo")]
+    if not candidates:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
         # Modules are pinned either by commit hash or by release version. A version
         # pin (e.g. "0.2.9") is resolved to its tag's commit so it can be compared
         # against the branch HEAD just like a hash pin.
-        base_ref = entry.get("hash")
-        if not base_ref and entry.get("version"):
-            base_ref = resolve_ref_sha(entry["owner_repo"], entry["version"], token)
-            if base_ref:
+        versions = _map_unique(
+            pool,
+            lambda owner_repo, version: _resolve_version(owner_repo, version, token, cache),
+            [(e["owner_repo"], e["version"]) for e in candidates if not e.get("hash") and e.get("version")],
+        )
+        heads = _map_unique(
+            pool,
+            lambda owner_repo, branch: _resolve_head(owner_repo, branch, token, cache),
+            [(e["owner_repo"], e["branch"]) for e in candidates],
+        )
+
+        compare_keys: dict[int, tuple[str, str, str]] = {}
+        for i, entry in enumerate(candidates):
+            owner_repo = entry["owner_repo"]
+            if not entry.get("hash") and versions.get((owner_repo, entry.get("version"))):
                 # Surface the resolved commit as the pinned hash for display/linking.
-                entry["hash"] = base_ref
-        if not base_ref:
-            continue
+                entry["hash"] = versions[(owner_repo, entry["version"])]
+            head = heads.get((owner_repo, entry["branch"]))
+            if entry.get("hash") and head:
+                compare_keys[i] = (owner_repo, entry["hash"], head)
 
-        result = fetch_compare(entry["owner_repo"], base_ref, entry["branch"], token)
+        compares = _map_unique(
+            pool,
+            lambda owner_repo, base, head: _compare(owner_repo, base, head, token, cache),
+            list(compare_keys.values()),
+        )
+
+    for i, key in compare_keys.items():
+        result = compares.get(key)
         if result:
-            entry["current_hash"] = result.head_sha
-            entry["behind_by"] = result.ahead_by
-            entry["compare_status"] = result.status
-        else:
-            _LOG.warning("Could not fetch compare data for %s@%s", entry["owner_repo"], entry["branch"])
+            candidates[i]["current_hash"] = result["head_sha"]
+            candidates[i]["behind_by"] = result["ahead_by"]
+            candidates[i]["compare_status"] = result["status"]
+    _LOG.info(
+        "Enriched %d modules with %d unique comparisons (%d branch heads, %d versions)",
+        len(candidates),
+        len(compares),
+        len(heads),
+        len(versions),
+    )
+    cache.save()
 
 
-def generate_report(known_good: KnownGood, token: Optional[str] = None) -> str:
-    entries = _collect_entries(known_good)
+def generate_report(
+    known_good: KnownGood,
+    token: Optional[str] = None,
+    cache: Optional[DriftCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    history: Optional[DriftHistory] = None,
+    history_weeks: int = DEFAULT_HISTORY_WEEKS,
+) -> str:
+    entries = collect_entries(known_good)
     if token:
-        _enrich_with_compare_data(entries, token)
+        enrich_with_compare_data(entries, token, cache, max_workers)
+    timeline = None
+    if history is not None:
+        history.append(entries)
+        days = history_weeks * 7
+        timeline = build_timeline(history.read_since(time.time() - days * 24 * 60 * 60), days)
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
     env = Environment(
         loader=FileSystemLoader(TEMPLATE_DIR),
         autoescape=select_autoescape(["html"]),
@@ -108,12 +206,48 @@ def generate_report(known_good: KnownGood, token: Optional[str] = None) -> str:
     tmpl = env.get_template("report_template.html")
     return tmpl.render(
         modules_json=json.dumps(entries, indent=2),
+        history_json=json.dumps(timeline, separators=(",", ":")),
         timestamp=known_good.timestamp,
     )
 
 
-def write_report(known_good: KnownGood, output_path: Path, token: Optional[str] = None) -> None:
-    Path(output_path).write_text(generate_report(known_good, token), encoding="utf-8")
+def write_report(
+    known_good: KnownGood,
+    output_path: Path,
+    token: Optional[str] = None,
+    cache: Optional[DriftCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    history: Optional[DriftHistory] = None,
+    history_weeks: int = DEFAULT_HISTORY_WEEKS,
+) -> None:
+    html = generate_report(known_good, token, cache, max_workers, history, history_weeks)
+    Path(output_path).write_text(html, encoding="utf-8")
+
+
+def add_lookup_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the GitHub lookup options shared by the report commands."""
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        default=str(default_cache_path()),
+        help="Drift cache file reused across runs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the drift cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of concurrent GitHub lookups (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+
+def open_cache(args: argparse.Namespace) -> Optional[DriftCache]:
+    """Return the drift cache selected by the arguments of add_lookup_arguments()."""
+    return None if args.no_cache else DriftCache(resolve_path_from_bazel(Path(args.cache)))
 
 
 def register(subparsers: argparse._SubParsersAction) -> None:
@@ -130,6 +264,18 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default="report.html",
         help="Output HTML file path (default: report.html)",
     )
+    add_lookup_arguments(parser)
+    parser.add_argument(
+        "--history",
+        metavar="FILE",
+        help="Drift history file; each run appends a snapshot and the report shows drift trends",
+    )
+    parser.add_argument(
+        "--history-weeks",
+        type=int,
+        default=DEFAULT_HISTORY_WEEKS,
+        help=f"Number of weeks of drift history shown in the report (default: {DEFAULT_HISTORY_WEEKS})",
+    )
     parser.set_defaults(func=_run)
 
 
@@ -142,8 +288,18 @@ def _run(args: argparse.Namespace) -> int:
         return 1
 
     token = os.environ.get("GITHUB_TOKEN")
-    output = _resolve_path_from_bazel(Path(args.output))
-    write_report(known_good, output, token=token)
+    output = resolve_path_from_bazel(Path(args.output))
+    cache = open_cache(args)
+    history = DriftHistory(resolve_path_from_bazel(Path(args.history))) if args.history else None
+    write_report(
+        known_good,
+        output,
+        token=token,
+        cache=cache,
+        max_workers=args.jobs,
+        history=history,
+        history_weeks=args.history_weeks,
+    )
     if token:
         print(f"Report written to {output} (current hashes fetched from GitHub)")
     else:
@@ -0,0 +1,107 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Query the history of known_good.json: module diffs, blame and patch introductions."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+from scripts.tooling.cli.misc.html_report import resolve_path_from_bazel
+from scripts.tooling.lib.known_good_history import KnownGoodHistory, ModuleChange, ModuleEntry, default_store_path
+
+
+def _pin(entry: ModuleEntry | None) -> str:
+    if entry is None:
+        return "-"
+    return entry.get("version") or (entry.get("hash") or "")[:12] or "?"
+
+
+def format_change(change: ModuleChange) -> str:
+    """Return one line describing *change*."""
+    day = datetime.fromtimestamp(change.ts, tz=UTC).date().isoformat()
+    return f"{change.rev[:12]} {day} {change.name}: {_pin(change.old)} -> {_pin(change.new)}"
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "known_good_history",
+        help="Query the history of known_good.json (diff, log, blame, introduced)",
+    )
+    parser.add_argument(
+        "--store",
+        metavar="DIR",
+        default=str(default_store_path()),
+        help="History store directory (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repo",
+        metavar="DIR",
+        default=".",
+        help="Git repository whose known_good.json history is ingested before querying (default: .)",
+    )
+    parser.add_argument(
+        "--no-ingest",
+        action="store_true",
+        help="Only query the store, do not ingest new revisions from --repo",
+    )
+    actions = parser.add_subparsers(dest="action", metavar="ACTION")
+    actions.required = True
+    actions.add_parser("ingest", help="Only ingest new revisions")
+    diff = actions.add_parser("diff", help="Modules that differ between two revisions")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    log = actions.add_parser("log", help="Changes of a module")
+    log.add_argument("module")
+    log.add_argument("--since", metavar="REV", help="Only changes after this revision")
+    log.add_argument("--until", metavar="REV", help="Only changes up to and including this revision")
+    blame = actions.add_parser("blame", help="Revision that last changed a module")
+    blame.add_argument("module")
+    blame.add_argument("--rev", help="Revision to look at (default: latest)")
+    introduced = actions.add_parser("introduced", help="Revisions that added a patch to a module")
+    introduced.add_argument("patch", help="Patch label as listed in bazel_patches")
+    parser.set_defaults(func=_run)
+
+
+def _run(args: argparse.Namespace) -> int:
+    history = KnownGoodHistory(resolve_path_from_bazel(Path(args.store)))
+    if not args.no_ingest:
+        added = history.ingest_git(resolve_path_from_bazel(Path(args.repo)))
+        history.save()
+        if added or args.action == "ingest":
+            print(f"Ingested {added} new revision(s), {len(history)} in total", file=sys.stderr)
+
+    try:
+        if args.action == "ingest":
+            return 0
+        if args.action == "diff":
+            changes = history.diff(args.old, args.new)
+        elif args.action == "log":
+            changes = history.log(args.module, since=args.since, until=args.until)
+        elif args.action == "blame":
+            change = history.blame(args.module, rev=args.rev)
+            if change is None:
+                print(f"error: {args.module} is not in the history", file=sys.stderr)
+                return 1
+            changes = [change]
+        else:
+            changes = history.introduced(args.patch)
+    except KeyError as exc:
+        print(f"error: {exc.args[0]}", file=sys.stderr)
+        return 1
+
+    for change in changes:
+        print(format_change(change))
+    return 0
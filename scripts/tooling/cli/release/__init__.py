@@ -10,16 +10,3 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
-import argparse
-
-
-def register(subparsers: argparse._SubParsersAction) -> None:
-    release_parser = subparsers.add_parser("release", help="Release utilities")
-    release_sub = release_parser.add_subparsers(dest="command", metavar="COMMAND")
-    release_sub.required = True
-
-    from scripts.tooling.cli.release.check_approvals import (
-        register as _register_release_approvals,
-    )
-
-    _register_release_approvals(release_sub)
@@ -15,20 +15,35 @@
 """Check release branch PR approvals against required maintainers."""
 
 import argparse
+import hashlib
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
-from urllib.error import URLError
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 
-from github import Auth, Github  # type: ignore[import-untyped]
+from github import Auth, Github, UnknownObjectException  # type: ignore[import-untyped]
+from github.PullRequest import PullRequest  # type: ignore[import-untyped]
 from jinja2 import Template
 
+from scripts.tooling.lib.approval_state import ApprovalState, ApprovalStateStore, Review, load_review_events
+from scripts.tooling.lib.cache import default_cache_dir
 from scripts.tooling.lib.known_good import load_known_good
 
+REGISTRY_METADATA_URL = (
+    "https://raw.githubusercontent.com/eclipse-score/bazel_registry/main/modules/{module_name}/metadata.json"
+)
+DEFAULT_FETCH_TIMEOUT_S = 10.0
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
+DEFAULT_GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+RELEASE_BRANCH_PREFIX = "releases/"
+COMMENT_MARKER = "<!-- release-approval-check -->"
+
 # Jinja2 templates for markdown generation
 MODULE_STATUS_TEMPLATE = Template(
     """{% if status == 'disapproved' -%}
@@ -42,6 +57,43 @@ MODULE_STATUS_TEMPLATE = Template(
 """
 )
 
+# Open PRs with their reviews, a page of PRs per request. PRs with more reviews
+# than fit into the first page are completed with REVIEWS_QUERY.
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $prs: Int!, $reviews: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: $prs, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        baseRefName
+        reviews(first: $reviews) {
+          pageInfo { hasNextPage endCursor }
+          nodes { databaseId state submittedAt author { ... on User { databaseId } ... on Bot { databaseId } } }
+        }
+      }
+    }
+  }
+}
+"""
+
+REVIEWS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String, $reviews: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      reviews(first: $reviews, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { databaseId state submittedAt author { ... on User { databaseId } ... on Bot { databaseId } } }
+      }
+    }
+  }
+}
+"""
+
+GRAPHQL_PAGE_SIZE = 50
+GRAPHQL_REVIEWS_PAGE_SIZE = 100
+
 SUMMARY_TEMPLATE = Template(
     """### Release Approval Check Results
 
@@ -82,9 +134,96 @@ def _find_repo_root() -> Path:
     return Path.cwd()
 
 
-def fetch_maintainers(known_good_path: Path) -> dict[str, list[dict[str, Any]]]:
+def _read_cached_metadata(cache_file: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _download_module_metadata(module_name: str, cache_dir: Path | None, timeout: float) -> dict[str, Any]:
+    """Download a module's registry metadata, revalidating a cached copy via ETag/Last-Modified.
+
+    Raises:
+        URLError, json.JSONDecodeError: If the metadata cannot be fetched and no cached copy exists.
+    """
+    url = REGISTRY_METADATA_URL.format(module_name=module_name)
+    cache_file = cache_dir / f"{module_name}.json" if cache_dir else None
+    cached = _read_cached_metadata(cache_file) if cache_file else None
+    cached_data = cached.get("data") if isinstance(cached, dict) else None
+
+    request = Request(url)
+    if cached_data is not None:
+        if cached.get("etag"):
+            request.add_header("If-None-Match", cached["etag"])
+        if cached.get("last_modified"):
+            request.add_header("If-Modified-Since", cached["last_modified"])
+
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            data = json.loads(response.read())
+            headers = response.headers
+    except (URLError, TimeoutError) as error:
+        # HTTPError is a URLError: 304 confirms the cached copy, any other
+        # status (429, 5xx) falls back to it like a network error does.
+        if cached_data is None:
+            raise
+        if not (isinstance(error, HTTPError) and error.code == 304):
+            print(f"Warning: using cached metadata for {module_name}: {error}", file=sys.stderr)
+        return cached_data
+
+    if cache_file and (headers.get("ETag") or headers.get("Last-Modified")):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified"), "data": data}
+        tmp = cache_file.with_name(f"{cache_file.name}.tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        tmp.replace(cache_file)
+    return data
+
+
+def _fetch_module_maintainers(
+    module_name: str,
+    registry_dir: Path | None,
+    cache_dir: Path | None,
+    timeout: float,
+) -> list[dict[str, Any]]:
+    try:
+        if registry_dir:
+            metadata_file = registry_dir / "modules" / module_name / "metadata.json"
+            data = json.loads(metadata_file.read_text(encoding="utf-8"))
+        else:
+            data = _download_module_metadata(module_name, cache_dir, timeout)
+    except (OSError, URLError, json.JSONDecodeError) as error:
+        print(f"Error fetching {module_name}: {error}", file=sys.stderr)
+        return []
+
+    if "maintainers" in data and isinstance(data["maintainers"], list):
+        print(f"{module_name} maintainers: {data['maintainers']}", file=sys.stderr)
+        return data["maintainers"]
+    print(f"Warning: No maintainers found for {module_name}", file=sys.stderr)
+    return []
+
+
+def fetch_maintainers(
+    known_good_path: Path,
+    registry_dir: Path | None = None,
+    cache_dir: Path | None = None,
+    timeout: float = DEFAULT_FETCH_TIMEOUT_S,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+) -> dict[str, list[dict[str, Any]]]:
     """Fetch maintainers from module metadata files.
 
+    Metadata files are fetched concurrently. Downloads are revalidated against an
+    on-disk copy in *cache_dir* (if given) via ETag/Last-Modified, and the cached
+    copy is used when the registry cannot be reached.
+
+    Args:
+        known_good_path: Path to known_good.json
+        registry_dir: Local checkout of the bazel registry; when set, nothing is downloaded
+        cache_dir: Directory for cached metadata downloads
+        timeout: Timeout in seconds for each download
+        max_workers: Number of concurrent downloads
+
     Returns:
         Dictionary mapping module names to lists of maintainer information.
     """
@@ -99,23 +238,12 @@ def fetch_maintainers(known_good_path: Path) -> dict[str, list[dict[str, Any]]]:
         "score_test_scenarios",
     ]
 
-    modules_maintainers: dict[str, list[dict[str, Any]]] = {}
-
-    for module_name in modules:
-        try:
-            url = f"https://raw.githubusercontent.com/eclipse-score/bazel_registry/main/modules/{module_name}/metadata.json"
-            with urlopen(url) as response:
-                data = json.loads(response.read())
-
-            if "maintainers" in data and isinstance(data["maintainers"], list):
-                modules_maintainers[module_name] = data["maintainers"]
-                print(f"{module_name} maintainers: {data['maintainers']}", file=sys.stderr)
-            else:
-                print(f"Warning: No maintainers found for {module_name}", file=sys.stderr)
-                modules_maintainers[module_name] = []
-        except (URLError, json.JSONDecodeError) as error:
-            print(f"Error fetching {module_name}: {error}", file=sys.stderr)
-            modules_maintainers[module_name] = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        results = pool.map(
+            lambda module_name: _fetch_module_maintainers(module_name, registry_dir, cache_dir, timeout),
+            modules,
+        )
+        modules_maintainers: dict[str, list[dict[str, Any]]] = dict(zip(modules, results, strict=True))
 
     # Add extra maintainers
     # TODO: move it to single config file
@@ -161,6 +289,116 @@ def fetch_maintainers(known_good_path: Path) -> dict[str, list[dict[str, Any]]]:
     return modules_maintainers
 
 
+def _github_client(github_token: str) -> Github:
+    """Return a GitHub client for the API at ``GITHUB_API_URL`` (set by GitHub Actions)."""
+    return Github(auth=Auth.Token(github_token), base_url=os.environ.get("GITHUB_API_URL", DEFAULT_GITHUB_API_URL))
+
+
+def _evaluate_module(maintainers: list[Any], review_states: dict[int, str]) -> ModuleResult:
+    """Evaluate one module against the latest review state of each user.
+
+    Args:
+        maintainers: Maintainer dictionaries (or bare GitHub user IDs) of the module
+        review_states: Latest review state per GitHub user ID
+
+    Returns:
+        The module's approval result
+    """
+    approved_maintainer_ids: list[int] = []
+    approved_usernames: list[str] = []
+    disapproved_maintainer_ids: list[int] = []
+    disapproved_usernames: list[str] = []
+
+    for maintainer in maintainers:
+        if isinstance(maintainer, dict):
+            maintainer_id = maintainer["github_user_id"]
+            maintainer_username = maintainer["github"]
+        else:
+            maintainer_id = maintainer
+            maintainer_username = str(maintainer)
+
+        state = review_states.get(maintainer_id)
+        if state == "APPROVED":
+            approved_maintainer_ids.append(maintainer_id)
+            approved_usernames.append(maintainer_username)
+        elif state == "CHANGES_REQUESTED":
+            disapproved_maintainer_ids.append(maintainer_id)
+            disapproved_usernames.append(maintainer_username)
+
+    # If any maintainer disapproved, the module is disapproved
+    has_disapproval = len(disapproved_maintainer_ids) > 0
+    has_approval = len(approved_maintainer_ids) > 0
+
+    if has_disapproval:
+        status = "disapproved"
+    elif has_approval:
+        status = "approved"
+    else:
+        status = "pending"
+
+    return ModuleResult(
+        maintainers=maintainers,
+        approved_maintainers=approved_maintainer_ids,
+        approved_usernames=approved_usernames,
+        disapproved_maintainers=disapproved_maintainer_ids,
+        disapproved_usernames=disapproved_usernames,
+        has_approval=has_approval,
+        has_disapproval=has_disapproval,
+        status=status,
+    )
+
+
+def _module_result_to_dict(result: ModuleResult) -> dict[str, Any]:
+    """Convert a ModuleResult to a dict for JSON serialization."""
+    return {
+        "maintainers": result.maintainers,
+        "approvedMaintainers": result.approved_maintainers,
+        "approvedUsernames": result.approved_usernames,
+        "disapprovedMaintainers": result.disapproved_maintainers,
+        "disapprovedUsernames": result.disapproved_usernames,
+        "hasApproval": result.has_approval,
+        "hasDisapproval": result.has_disapproval,
+        "status": result.status,
+    }
+
+
+def _collect_results(module_results: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Group evaluated modules by status and report each of them.
+
+    Args:
+        module_results: Dictionary of module approval results
+
+    Returns:
+        Dictionary containing approval results for all modules
+    """
+    approved_modules: list[str] = []
+    not_approved_modules: list[str] = []
+    disapproved_modules: list[str] = []
+
+    for module_name, result in module_results.items():
+        if result["hasDisapproval"]:
+            disapproved_modules.append(module_name)
+            not_approved_modules.append(module_name)
+            disapproved = ", ".join(result["disapprovedUsernames"])
+            print(f"🚫 {module_name}: Changes requested by {disapproved}", file=sys.stderr)
+        elif result["hasApproval"]:
+            approved_modules.append(module_name)
+            print(f"✅ {module_name}: Approved by {', '.join(result['approvedUsernames'])}", file=sys.stderr)
+        else:
+            not_approved_modules.append(module_name)
+            maintainer_usernames = [m["github"] if isinstance(m, dict) else str(m) for m in result["maintainers"]]
+            required_str = f"requires one of: {', '.join(maintainer_usernames)}"
+            print(f"❌ {module_name}: No approvals ({required_str})", file=sys.stderr)
+
+    return {
+        "moduleResults": module_results,
+        "approvedModules": approved_modules,
+        "notApprovedModules": not_approved_modules,
+        "disapprovedModules": disapproved_modules,
+        "allApproved": len(not_approved_modules) == 0,
+    }
+
+
 def check_pr_reviews(
     repo_owner: str,
     repo_name: str,
@@ -181,8 +419,7 @@ def check_pr_reviews(
         Dictionary containing approval results for all modules
     """
     # Initialize GitHub client
-    auth = Auth.Token(github_token)
-    github = Github(auth=auth)
+    github = _github_client(github_token)
 
     # Get repository and pull request
     repo = github.get_repo(f"{repo_owner}/{repo_name}")
@@ -206,93 +443,231 @@ def check_pr_reviews(
     print(f"Reviews by user ID: {review_summary}", file=sys.stderr)
 
     # Check which modules have at least one approval and no disapprovals
-    module_results: dict[str, ModuleResult] = {}
-    approved_modules: list[str] = []
-    not_approved_modules: list[str] = []
-    disapproved_modules: list[str] = []
+    review_states = {user_id: review.state for user_id, review in latest_reviews_by_user.items()}
+    module_results = {
+        module_name: _module_result_to_dict(_evaluate_module(maintainers, review_states))
+        for module_name, maintainers in modules_maintainers.items()
+    }
+    return _collect_results(module_results)
 
-    for module_name, maintainers in modules_maintainers.items():
-        approved_maintainer_ids: list[int] = []
-        approved_usernames: list[str] = []
-        disapproved_maintainer_ids: list[int] = []
-        disapproved_usernames: list[str] = []
-
-        for maintainer in maintainers:
-            if isinstance(maintainer, dict):
-                maintainer_id = maintainer["github_user_id"]
-                maintainer_username = maintainer["github"]
-            else:
-                maintainer_id = maintainer
-                maintainer_username = str(maintainer)
-
-            if maintainer_id in latest_reviews_by_user:
-                user_review = latest_reviews_by_user[maintainer_id]
-                if user_review.state == "APPROVED":
-                    approved_maintainer_ids.append(maintainer_id)
-                    approved_usernames.append(maintainer_username)
-                elif user_review.state == "CHANGES_REQUESTED":
-                    disapproved_maintainer_ids.append(maintainer_id)
-                    disapproved_usernames.append(maintainer_username)
-
-        # If any maintainer disapproved, the module is disapproved
-        has_disapproval = len(disapproved_maintainer_ids) > 0
-        has_approval = len(approved_maintainer_ids) > 0
-
-        if has_disapproval:
-            status = "disapproved"
-        elif has_approval:
-            status = "approved"
-        else:
-            status = "pending"
-
-        module_results[module_name] = ModuleResult(
-            maintainers=maintainers,
-            approved_maintainers=approved_maintainer_ids,
-            approved_usernames=approved_usernames,
-            disapproved_maintainers=disapproved_maintainer_ids,
-            disapproved_usernames=disapproved_usernames,
-            has_approval=has_approval,
-            has_disapproval=has_disapproval,
-            status=status,
+
+def _graphql(query: str, variables: dict[str, Any], github_token: str) -> dict[str, Any]:
+    """Run a query against the GraphQL API at ``GITHUB_GRAPHQL_URL`` and return its data.
+
+    Raises:
+        RuntimeError: If the response contains errors.
+    """
+    url = os.environ.get("GITHUB_GRAPHQL_URL", DEFAULT_GITHUB_GRAPHQL_URL)
+    request = Request(
+        url,
+        data=json.dumps({"query": query, "variables": variables}).encode(),
+        headers={"Authorization": f"bearer {github_token}", "Content-Type": "application/json"},
+    )
+    with urlopen(request, timeout=DEFAULT_FETCH_TIMEOUT_S * 3) as response:
+        result = json.loads(response.read())
+    if result.get("errors"):
+        raise RuntimeError(f"GraphQL query failed: {result['errors']}")
+    return result["data"]
+
+
+def _reviews_from_graphql(nodes: list[dict[str, Any]]) -> list[Review]:
+    """Convert GraphQL review nodes, skipping pending reviews and deleted authors."""
+    return [
+        Review(
+            review_id=node["databaseId"],
+            user_id=node["author"]["databaseId"],
+            state=node["state"],
+            submitted_at=node["submittedAt"],
         )
+        for node in nodes
+        if node.get("submittedAt") and (node.get("author") or {}).get("databaseId") is not None
+    ]
 
-        if has_disapproval:
-            disapproved_modules.append(module_name)
-            not_approved_modules.append(module_name)
-            print(f"🚫 {module_name}: Changes requested by {', '.join(disapproved_usernames)}", file=sys.stderr)
-        elif has_approval:
-            approved_modules.append(module_name)
-            print(f"✅ {module_name}: Approved by {', '.join(approved_usernames)}", file=sys.stderr)
-        else:
-            not_approved_modules.append(module_name)
-            maintainer_usernames = [m["github"] if isinstance(m, dict) else str(m) for m in maintainers]
-            required_str = f"requires one of: {', '.join(maintainer_usernames)}"
-            print(f"❌ {module_name}: No approvals ({required_str})", file=sys.stderr)
 
-    all_approved = len(not_approved_modules) == 0
-
-    # Convert ModuleResult objects to dicts for JSON serialization
-    module_results_dict = {
-        name: {
-            "maintainers": result.maintainers,
-            "approvedMaintainers": result.approved_maintainers,
-            "approvedUsernames": result.approved_usernames,
-            "disapprovedMaintainers": result.disapproved_maintainers,
-            "disapprovedUsernames": result.disapproved_usernames,
-            "hasApproval": result.has_approval,
-            "hasDisapproval": result.has_disapproval,
-            "status": result.status,
-        }
-        for name, result in module_results.items()
+def fetch_release_pull_requests(
+    repo_owner: str,
+    repo_name: str,
+    github_token: str,
+    base_prefix: str = RELEASE_BRANCH_PREFIX,
+) -> list[dict[str, Any]]:
+    """Fetch all open PRs targeting branches starting with *base_prefix*, including their reviews.
+
+    Open PRs are listed a page at a time together with their first page of reviews,
+    so a handful of GraphQL requests cover all of them; only PRs with more reviews
+    than fit into one page need additional requests.
+
+    Args:
+        repo_owner: Repository owner (organization or user)
+        repo_name: Repository name
+        github_token: GitHub authentication token
+        base_prefix: Prefix of the targeted base branches
+
+    Returns:
+        List of ``{"number", "title", "baseRefName", "reviews": [Review, ...]}`` ordered by PR number
+    """
+    variables: dict[str, Any] = {
+        "owner": repo_owner,
+        "name": repo_name,
+        "prs": GRAPHQL_PAGE_SIZE,
+        "reviews": GRAPHQL_REVIEWS_PAGE_SIZE,
+        "cursor": None,
     }
+    pull_requests: list[dict[str, Any]] = []
+    while True:
+        page = _graphql(PULL_REQUESTS_QUERY, variables, github_token)["repository"]["pullRequests"]
+        for node in page["nodes"]:
+            if not node["baseRefName"].startswith(base_prefix):
+                continue
+            reviews = node["reviews"]
+            collected = _reviews_from_graphql(reviews["nodes"])
+            while reviews["pageInfo"]["hasNextPage"]:
+                reviews = _graphql(
+                    REVIEWS_QUERY,
+                    {
+                        "owner": repo_owner,
+                        "name": repo_name,
+                        "number": node["number"],
+                        "cursor": reviews["pageInfo"]["endCursor"],
+                        "reviews": GRAPHQL_REVIEWS_PAGE_SIZE,
+                    },
+                    github_token,
+                )["repository"]["pullRequest"]["reviews"]
+                collected.extend(_reviews_from_graphql(reviews["nodes"]))
+            pull_requests.append(
+                {
+                    "number": node["number"],
+                    "title": node["title"],
+                    "baseRefName": node["baseRefName"],
+                    "reviews": collected,
+                }
+            )
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        variables["cursor"] = page["pageInfo"]["endCursor"]
+    return sorted(pull_requests, key=lambda pr: pr["number"])
+
+
+def evaluate_reviews(reviews: list[Review], modules_maintainers: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+    """Evaluate already fetched *reviews* of a PR against required maintainers.
 
-    return {
-        "moduleResults": module_results_dict,
-        "approvedModules": approved_modules,
-        "notApprovedModules": not_approved_modules,
-        "disapprovedModules": disapproved_modules,
-        "allApproved": all_approved,
+    Args:
+        reviews: All submitted reviews of the PR
+        modules_maintainers: Dictionary mapping module names to maintainer lists
+
+    Returns:
+        Dictionary containing approval results for all modules (as returned by check_pr_reviews)
+    """
+    state = ApprovalState(pr_number=0)
+    for review in reviews:
+        state.apply(review)
+    review_states = state.review_states()
+    module_results = {
+        module_name: _module_result_to_dict(_evaluate_module(maintainers, review_states))
+        for module_name, maintainers in modules_maintainers.items()
+    }
+    return _collect_results(module_results)
+
+
+def _digest(data: Any) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _sync_reviews(state: ApprovalState, pr: PullRequest) -> None:
+    """Replace the reviews recorded in *state* with all reviews of *pr*."""
+    state.latest_reviews = {}
+    state.review_count = 0
+    state.max_review_id = 0
+    for review in pr.get_reviews():
+        state.review_count += 1
+        if review.user is not None and review.submitted_at is not None:
+            state.apply(Review(review.id, review.user.id, review.state, review.submitted_at.isoformat()))
+
+
+def _has_stale_reviews(state: ApprovalState, pr: PullRequest) -> bool:
+    """Return True if a stored approval or change request has another state on GitHub, e.g. was dismissed."""
+    for review in state.latest_reviews.values():
+        if review.state in ("APPROVED", "CHANGES_REQUESTED") and pr.get_review(review.review_id).state != review.state:
+            print(f"Review {review.review_id} is no longer {review.state}", file=sys.stderr)
+            return True
+    return False
+
+
+def check_pr_reviews_incremental(
+    repo_owner: str,
+    repo_name: str,
+    pr_number: int,
+    modules_maintainers: dict[str, list[dict[str, Any]]],
+    github_token: str,
+    state: ApprovalState | None,
+    events: list[Review],
+) -> tuple[dict[str, Any], ApprovalState]:
+    """Check PR reviews by applying new review events to stored approval state.
+
+    Without stored *state* all reviews of the PR are fetched once to build it. Afterwards
+    *events* are applied and only modules maintained by users whose latest review state
+    changed are re-evaluated. Events can be missed, e.g. runs dropped by the workflow's
+    concurrency group, so the stored state is checked against GitHub first: the number of
+    reviews of the PR must equal the stored count plus the new reviews among *events*, and
+    every stored approval or change request must still have its state (a missed dismissal
+    does not change the count). Otherwise all reviews are fetched again. All modules are
+    re-evaluated after such a full fetch and when the maintainer map differs from the one
+    the state was built with.
+
+    Args:
+        repo_owner: Repository owner (organization or user)
+        repo_name: Repository name
+        pr_number: Pull request number
+        modules_maintainers: Dictionary mapping module names to maintainer lists
+        github_token: GitHub authentication token
+        state: Stored approval state of the PR, or None
+        events: New reviews, e.g. from the ``pull_request_review`` event payload
+
+    Returns:
+        Tuple of the approval results (as returned by check_pr_reviews) and the updated state
+    """
+    changed_users: set[int] | None = None
+    pr = _github_client(github_token).get_repo(f"{repo_owner}/{repo_name}").get_pull(pr_number)
+    if state is None:
+        print("No stored approval state, fetching all reviews", file=sys.stderr)
+        state = ApprovalState(pr_number=pr_number)
+        _sync_reviews(state, pr)
+        for event in events:
+            state.apply(event)
+    else:
+        known_count = state.review_count + len({e.review_id for e in events if e.review_id > state.max_review_id})
+        review_count = pr.get_reviews().totalCount
+        if review_count != known_count or _has_stale_reviews(state, pr):
+            print(f"PR has {review_count} reviews, {known_count} known; fetching all reviews", file=sys.stderr)
+            _sync_reviews(state, pr)
+            for event in events:
+                state.apply(event)
+        else:
+            changed_users = {event.user_id for event in events if state.apply(event)}
+            state.review_count = review_count
+
+    maintainers_digest = _digest(modules_maintainers)
+    if changed_users is None or maintainers_digest != state.maintainers_digest:
+        affected = set(modules_maintainers)
+    else:
+        affected = {
+            module_name
+            for module_name, maintainers in modules_maintainers.items()
+            if module_name not in state.module_results
+            or any((m["github_user_id"] if isinstance(m, dict) else m) in changed_users for m in maintainers)
+        }
+    print(f"Re-evaluating {len(affected)} of {len(modules_maintainers)} modules", file=sys.stderr)
+
+    review_states = state.review_states()
+    state.module_results = {
+        module_name: (
+            _module_result_to_dict(_evaluate_module(maintainers, review_states))
+            if module_name in affected
+            else state.module_results[module_name]
+        )
+        for module_name, maintainers in modules_maintainers.items()
     }
+    state.maintainers_digest = maintainers_digest
+    return _collect_results(state.module_results), state
 
 
 def _format_module_status(module_name: str, result: dict[str, Any]) -> str:
@@ -334,7 +709,8 @@ def _post_pr_comment(
     repo_name: str,
     pr_number: int,
     github_token: str,
-) -> None:
+    comment_id: int | None = None,
+) -> int | None:
     """Post or update PR comment with approval summary.
 
     Args:
@@ -343,20 +719,32 @@ def _post_pr_comment(
         repo_name: Repository name
         pr_number: Pull request number
         github_token: GitHub authentication token
+        comment_id: ID of the comment to update, if known; avoids searching all PR comments
+
+    Returns:
+        ID of the posted comment, or None if posting failed
     """
     try:
-        auth = Auth.Token(github_token)
-        github = Github(auth=auth)
+        github = _github_client(github_token)
         repo = github.get_repo(f"{repo_owner}/{repo_name}")
         pr = repo.get_pull(pr_number)
 
-        comment_marker = "<!-- release-approval-check -->"
-        full_comment = f"{comment_marker}\n{summary}"
+        full_comment = f"{COMMENT_MARKER}\n{summary}"
+
+        # Update the known comment in place
+        if comment_id is not None:
+            try:
+                comment = pr.get_issue_comment(comment_id)
+                comment.edit(full_comment)
+                print("Updated existing PR comment", file=sys.stderr)
+                return comment.id
+            except UnknownObjectException:
+                print(f"PR comment {comment_id} no longer exists", file=sys.stderr)
 
         # Find existing comment from this workflow
         existing_comment = None
         for comment in pr.get_issue_comments():
-            if comment_marker in comment.body:
+            if COMMENT_MARKER in comment.body:
                 existing_comment = comment
                 break
 
@@ -364,11 +752,13 @@ def _post_pr_comment(
         if existing_comment:
             existing_comment.edit(full_comment)
             print("Updated existing PR comment", file=sys.stderr)
-        else:
-            pr.create_issue_comment(full_comment)
-            print("Created new PR comment", file=sys.stderr)
+            return existing_comment.id
+        comment = pr.create_issue_comment(full_comment)
+        print("Created new PR comment", file=sys.stderr)
+        return comment.id
     except Exception as e:
         print(f"Warning: Failed to post PR comment: {e}", file=sys.stderr)
+        return None
 
 
 def _build_summary_markdown(
@@ -428,15 +818,54 @@ def generate_summary(
     return summary
 
 
-def cmd_fetch_maintainers(known_good_path: Path) -> None:
+def cmd_fetch_maintainers(
+    known_good_path: Path,
+    registry_dir: Path | None = None,
+    cache_dir: Path | None = None,
+) -> None:
     """Command: Fetch maintainers."""
-    modules_maintainers = fetch_maintainers(known_good_path)
+    modules_maintainers = fetch_maintainers(known_good_path, registry_dir=registry_dir, cache_dir=cache_dir)
     print(json.dumps(modules_maintainers, indent=2))
 
 
-def cmd_check_all(known_good_path: Path) -> int:
+def _publish_incremental_summary(
+    summary: str,
+    repo_owner: str,
+    repo_name: str,
+    state: ApprovalState,
+    github_token: str,
+) -> None:
+    """Write the summary and update the PR comment recorded in *state*, unless it is unchanged."""
+    _write_github_actions_summary(summary)
+
+    summary_digest = _digest(summary)
+    if state.comment_id is not None and state.comment_digest == summary_digest:
+        print("PR comment is up to date", file=sys.stderr)
+        return
+    comment_id = _post_pr_comment(summary, repo_owner, repo_name, state.pr_number, github_token, state.comment_id)
+    if comment_id is not None:
+        state.comment_id = comment_id
+        state.comment_digest = summary_digest
+
+
+def cmd_check_all(
+    known_good_path: Path,
+    registry_dir: Path | None = None,
+    cache_dir: Path | None = None,
+    state_store: ApprovalStateStore | None = None,
+) -> int:
     """Command: Run all steps (fetch, check, summarize).
 
+    With a *state_store* the check is incremental: the review from the event payload at
+    ``GITHUB_EVENT_PATH`` is applied to the stored state of the PR and the PR comment
+    recorded there is edited in place.
+
+    Args:
+        known_good_path: Path to known_good.json
+        registry_dir: Optional local checkout of the bazel registry
+        cache_dir: Optional directory for cached registry metadata
+        state_store: Optional store of per-PR approval state
+
     Returns:
         Exit code: 0 if all approved, 1 otherwise
     """
@@ -455,29 +884,48 @@ def cmd_check_all(known_good_path: Path) -> int:
 
     # Step 1: Fetch maintainers
     print("=== Fetching maintainers ===", file=sys.stderr)
-    modules_maintainers = fetch_maintainers(known_good_path)
+    modules_maintainers = fetch_maintainers(known_good_path, registry_dir=registry_dir, cache_dir=cache_dir)
 
     # Step 2: Check PR reviews
     print("\n=== Checking PR reviews ===", file=sys.stderr)
-    results = check_pr_reviews(
-        repo_owner=repo_owner,
-        repo_name=repo_name,
-        pr_number=pr_number,
-        modules_maintainers=modules_maintainers,
-        github_token=github_token,
-    )
+    if state_store is not None:
+        owner_repo = f"{repo_owner}/{repo_name}"
+        event_path = os.environ.get("GITHUB_EVENT_PATH")
+        events = load_review_events(Path(event_path)) if event_path else []
+        results, state = check_pr_reviews_incremental(
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pr_number=pr_number,
+            modules_maintainers=modules_maintainers,
+            github_token=github_token,
+            state=state_store.load(owner_repo, pr_number),
+            events=events,
+        )
+    else:
+        results = check_pr_reviews(
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pr_number=pr_number,
+            modules_maintainers=modules_maintainers,
+            github_token=github_token,
+        )
 
     # Step 3: Generate summary
     print("\n=== Generating summary ===", file=sys.stderr)
-    summary = generate_summary(
-        module_results=results["moduleResults"],
-        all_approved=results["allApproved"],
-        base_branch=base_branch,
-        repo_owner=repo_owner,
-        repo_name=repo_name,
-        pr_number=pr_number,
-        github_token=github_token,
-    )
+    if state_store is not None:
+        summary = _build_summary_markdown(results["moduleResults"], results["allApproved"], base_branch)
+        _publish_incremental_summary(summary, repo_owner, repo_name, state, github_token)
+        state_store.save(owner_repo, state)
+    else:
+        summary = generate_summary(
+            module_results=results["moduleResults"],
+            all_approved=results["allApproved"],
+            base_branch=base_branch,
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pr_number=pr_number,
+            github_token=github_token,
+        )
 
     # Set GitHub Actions outputs if running in GitHub Actions
     if "GITHUB_OUTPUT" in os.environ:
@@ -496,6 +944,63 @@ def cmd_check_all(known_good_path: Path) -> int:
         return 0
 
 
+def cmd_check_open_prs(
+    known_good_path: Path,
+    registry_dir: Path | None = None,
+    cache_dir: Path | None = None,
+    *,
+    post_comments: bool = False,
+) -> int:
+    """Command: Check all open PRs targeting release branches in one run.
+
+    Maintainers are fetched once and the reviews of all PRs are collected with a few
+    GraphQL requests. One summary per PR is written to the job summary and stdout.
+
+    Args:
+        known_good_path: Path to known_good.json
+        registry_dir: Optional local checkout of the bazel registry
+        cache_dir: Optional directory for cached registry metadata
+        post_comments: Also post or update the approval comment on every PR
+
+    Returns:
+        Exit code: 0 if all PRs are approved, 1 otherwise
+    """
+    repo_owner = os.environ.get("REPO_OWNER", "")
+    repo_name = os.environ.get("REPO_NAME", "")
+    github_token = os.environ.get("GITHUB_TOKEN", "")
+
+    if not all([repo_owner, repo_name, github_token]):
+        print("Error: Missing required environment variables", file=sys.stderr)
+        print("Required: REPO_OWNER, REPO_NAME, GITHUB_TOKEN", file=sys.stderr)
+        return 1
+
+    print("=== Fetching maintainers ===", file=sys.stderr)
+    modules_maintainers = fetch_maintainers(known_good_path, registry_dir=registry_dir, cache_dir=cache_dir)
+
+    print("\n=== Fetching open release PRs ===", file=sys.stderr)
+    pull_requests = fetch_release_pull_requests(repo_owner, repo_name, github_token)
+    print(f"Found {len(pull_requests)} open PR(s) targeting release branches", file=sys.stderr)
+
+    approved_prs: list[int] = []
+    not_approved_prs: list[int] = []
+    for pr in pull_requests:
+        print(f"\n=== PR #{pr['number']}: {pr['title']} ===", file=sys.stderr)
+        results = evaluate_reviews(pr["reviews"], modules_maintainers)
+        summary = _build_summary_markdown(results["moduleResults"], results["allApproved"], pr["baseRefName"])
+        _write_github_actions_summary(f"## PR #{pr['number']}: {pr['title']}\n\n{summary}")
+        if post_comments:
+            _post_pr_comment(summary, repo_owner, repo_name, pr["number"], github_token)
+        print(f"## PR #{pr['number']}: {pr['title']}\n\n{summary}")
+        (approved_prs if results["allApproved"] else not_approved_prs).append(pr["number"])
+
+    if "GITHUB_OUTPUT" in os.environ:
+        with open(os.environ["GITHUB_OUTPUT"], "a") as f:
+            f.write(f"approved-prs={', '.join(map(str, approved_prs))}\n")
+            f.write(f"not-approved-prs={', '.join(map(str, not_approved_prs))}\n")
+
+    return 1 if not_approved_prs else 0
+
+
 def register(subparsers: argparse._SubParsersAction) -> None:
     """Register this command as a subparser."""
     parser = subparsers.add_parser(
@@ -508,6 +1013,37 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default=str(_find_repo_root()),
         help="Directory containing known_good.json (default: repo root)",
     )
+    parser.add_argument(
+        "--registry",
+        metavar="PATH",
+        help="Local checkout of the bazel registry to read maintainers from instead of downloading them",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="PATH",
+        default=str(default_cache_dir() / "registry"),
+        help="Directory for cached registry metadata (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not cache downloaded registry metadata",
+    )
+    parser.add_argument(
+        "--state-dir",
+        metavar="PATH",
+        help="Keep per-PR approval state here and only apply the review from the current event",
+    )
+    parser.add_argument(
+        "--all-open",
+        action="store_true",
+        help=f"Check all open PRs targeting {RELEASE_BRANCH_PREFIX}* branches instead of PR_NUMBER",
+    )
+    parser.add_argument(
+        "--post-comments",
+        action="store_true",
+        help="With --all-open, also post or update the approval comment on every PR",
+    )
     parser.set_defaults(func=_run)
 
 
@@ -518,10 +1054,18 @@ def _run(args: argparse.Namespace) -> int:
         Exit code: 0 on success, 1 on failure
     """
     known_good_path = Path(args.known_good) / "known_good.json"
+    registry_dir = Path(args.registry) if args.registry else None
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
+    state_store = ApprovalStateStore(Path(args.state_dir)) if args.state_dir else None
+
+    if args.all_open:
+        return cmd_check_open_prs(
+            known_good_path, registry_dir=registry_dir, cache_dir=cache_dir, post_comments=args.post_comments
+        )
 
     # Check if running in GitHub Actions (primary use case)
     if all(var in os.environ for var in ["REPO_OWNER", "REPO_NAME", "PR_NUMBER", "GITHUB_TOKEN"]):
-        return cmd_check_all(known_good_path)
+        return cmd_check_all(known_good_path, registry_dir=registry_dir, cache_dir=cache_dir, state_store=state_store)
     else:
         print("Error: Missing required environment variables", file=sys.stderr)
         print("Required: REPO_OWNER, REPO_NAME, PR_NUMBER, GITHUB_TOKEN", file=sys.stderr)
@@ -0,0 +1,160 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Check that the bazel_patches in known_good.json apply to the pinned commits.
+
+Bazel applies patches only when it fetches a module, so a stale patch would
+otherwise surface as a fetch failure in the middle of a build. All modules are
+checked concurrently against local mirrors in a persistent object store, and
+results are cached by (commit, patches digest), so unchanged modules are not
+checked again.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import git
+
+from scripts.tooling.lib.cache import default_cache_dir
+from scripts.tooling.lib.git_operations import mirror_commit
+from scripts.tooling.lib.known_good import Module, load_known_good
+from scripts.tooling.lib.patch_check import PatchCheckCache, apply_patches, default_cache_path, patches_digest
+
+_LOG = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+DEFAULT_JOBS = 8
+
+
+@dataclass
+class PatchCheckResult:
+    """Outcome of checking the patches of one module."""
+
+    name: str
+    ok: bool
+    duration_s: float
+    cached: bool = False
+    error: Optional[str] = None
+
+
+def check_module(
+    module: Module,
+    workspace_root: Path,
+    object_store: Path,
+    cache: PatchCheckCache,
+) -> PatchCheckResult:
+    """Apply the patches of *module* to its pinned commit, using *cache* for known results."""
+    start = time.monotonic()
+    patches = module.patch_paths(workspace_root)
+    missing = [str(p) for p in patches if not p.is_file()]
+    if missing:
+        return PatchCheckResult(module.name, ok=False, duration_s=0.0, error=f"missing {', '.join(missing)}")
+
+    digest = patches_digest(patches)
+    cached = cache.get(module.hash, digest)
+    if cached is not None:
+        return PatchCheckResult(
+            module.name, ok=cached["ok"], duration_s=time.monotonic() - start, cached=True, error=cached["error"]
+        )
+
+    try:
+        mirror = mirror_commit(object_store, module.repo, module.hash)
+        error = apply_patches(mirror, module.hash, patches)
+    except git.exc.GitCommandError as e:
+        # Fetch failures say nothing about the patches, so they are not cached.
+        return PatchCheckResult(module.name, ok=False, duration_s=time.monotonic() - start, error=str(e))
+    cache.set(module.hash, digest, error)
+    return PatchCheckResult(module.name, ok=error is None, duration_s=time.monotonic() - start, error=error)
+
+
+def check_all(
+    modules: list[Module],
+    workspace_root: Path,
+    object_store: Path,
+    cache: PatchCheckCache,
+    jobs: int = DEFAULT_JOBS,
+) -> list[PatchCheckResult]:
+    """Check the patches of all *modules* concurrently."""
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(lambda m: check_module(m, workspace_root, object_store, cache), modules))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point for standalone execution."""
+    parser = argparse.ArgumentParser(description="Check that bazel_patches in known_good.json still apply")
+    parser.add_argument(
+        "--known",
+        type=Path,
+        help="Path to known_good.json (default: known_good.json in the workspace root)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of modules checked concurrently (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--object-store",
+        metavar="DIR",
+        type=Path,
+        default=default_cache_dir() / "git-objects",
+        help="Persistent directory of local repository mirrors (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=default_cache_path(),
+        help="Result cache file (default: %(default)s)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Check all modules and do not store results")
+    args = parser.parse_args(argv)
+
+    # When running with bazel, use BUILD_WORKING_DIRECTORY to find workspace root
+    workspace_root = Path(os.environ.get("BUILD_WORKING_DIRECTORY", "."))
+    known_good_path = args.known or workspace_root / "known_good.json"
+
+    try:
+        known_good = load_known_good(known_good_path)
+    except (FileNotFoundError, ValueError) as e:
+        _LOG.error(f"Failed to load known_good.json: {e}")
+        return 1
+
+    modules = [m for m in known_good.all_modules if m.bazel_patches and m.hash and not m.version]
+    cache = PatchCheckCache(None if args.no_cache else args.cache)
+    _LOG.info(f"Checking patches of {len(modules)} modules ({args.jobs} parallel)...")
+    results = check_all(modules, workspace_root, args.object_store, cache, jobs=args.jobs)
+    cache.save()
+
+    for result in results:
+        status = "ok" if result.ok else f"FAILED: {result.error}"
+        source = " (cached)" if result.cached else ""
+        _LOG.info(f"  {result.name:<30} {result.duration_s:6.2f}s{source}  {status}")
+
+    failed = [result.name for result in results if not result.ok]
+    if failed:
+        _LOG.error(f"Patches do not apply for: {', '.join(failed)}")
+        return 1
+    _LOG.info("All patches apply")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
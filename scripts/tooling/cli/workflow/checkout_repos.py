@@ -15,22 +15,54 @@
 Checkout all pinned repositories for CodeQL analysis.
 
 Clones repositories directly from known_good.json using GitPython library
-with GitHub token authentication to avoid rate limits.
+with GitHub token authentication to avoid rate limits. Repositories are
+checked out concurrently; failed checkouts are retried with jittered
+exponential backoff.
 """
 
+import argparse
 import logging
 import os
+import random
+import shutil
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
-from scripts.tooling.lib.git_operations import shallow_clone_repository
+from scripts.tooling.lib.git_operations import shallow_clone_repository, sparse_paths_from_code_root
 from scripts.tooling.lib.known_good import load_known_good
 
 _LOG = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+DEFAULT_JOBS = 8
+DEFAULT_ATTEMPTS = 3
+DEFAULT_BACKOFF_S = 2.0
 
-def checkout_repo(name: str, url: str, ref: str, path: Path) -> None:
+
+@dataclass
+class CheckoutResult:
+    """Outcome of checking out one repository."""
+
+    name: str
+    path: Path
+    ok: bool
+    attempts: int
+    duration_s: float
+    error: Optional[str] = None
+
+
+def checkout_repo(
+    name: str,
+    url: str,
+    ref: str,
+    path: Path,
+    sparse_paths: Optional[list[str]] = None,
+    object_store: Optional[Path] = None,
+) -> None:
     """
     Checkout a single repository using git_operations library.
 
@@ -39,17 +71,141 @@ def checkout_repo(name: str, url: str, ref: str, path: Path) -> None:
         url: Repository URL
         ref: Git reference (branch, tag, or commit hash)
         path: Local path to checkout into
+        sparse_paths: Optional directories to limit a commit checkout to
+        object_store: Optional directory of persistent reference repositories
 
     Raises:
         Exception: If checkout fails
     """
     _LOG.info(f"Checking out {name} ({ref}) to {path}")
 
-    shallow_clone_repository(url=url, path=path, ref=ref)
+    shallow_clone_repository(url=url, path=path, ref=ref, sparse_paths=sparse_paths, object_store=object_store)
+
+
+def checkout_repo_with_retries(
+    name: str,
+    url: str,
+    ref: str,
+    path: Path,
+    sparse_paths: Optional[list[str]] = None,
+    object_store: Optional[Path] = None,
+    attempts: int = DEFAULT_ATTEMPTS,
+    backoff_s: float = DEFAULT_BACKOFF_S,
+) -> CheckoutResult:
+    """
+    Checkout a single repository, retrying failed attempts.
+
+    Before each retry the partial checkout is removed and the worker sleeps for
+    ``backoff_s * 2**(attempt - 1)`` seconds, scaled by a random factor between
+    0.5 and 1.5 so that concurrent retries do not hit the server in lockstep.
+
+    Args:
+        name: Repository name
+        url: Repository URL
+        ref: Git reference (branch, tag, or commit hash)
+        path: Local path to checkout into
+        sparse_paths: Optional directories to limit a commit checkout to
+        object_store: Optional directory of persistent reference repositories
+        attempts: Maximum number of attempts
+        backoff_s: Base delay before the first retry
+
+    Returns:
+        CheckoutResult describing the outcome; never raises for checkout errors
+    """
+    start = time.monotonic()
+    error = None
+    for attempt in range(1, attempts + 1):
+        try:
+            checkout_repo(name, url, ref, path, sparse_paths, object_store)
+            return CheckoutResult(name, path, ok=True, attempts=attempt, duration_s=time.monotonic() - start)
+        except Exception as e:
+            error = str(e).strip().splitlines()[-1] if str(e).strip() else type(e).__name__
+            if attempt == attempts:
+                break
+            delay = backoff_s * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+            _LOG.warning(f"Checkout of {name} failed (attempt {attempt}/{attempts}), retrying in {delay:.1f}s: {error}")
+            shutil.rmtree(path, ignore_errors=True)
+            time.sleep(delay)
+    return CheckoutResult(name, path, ok=False, attempts=attempts, duration_s=time.monotonic() - start, error=error)
 
 
-def main() -> int:
+def checkout_all(
+    repos: list[tuple[str, str, str, Path, Optional[list[str]]]],
+    jobs: int = DEFAULT_JOBS,
+    attempts: int = DEFAULT_ATTEMPTS,
+    backoff_s: float = DEFAULT_BACKOFF_S,
+    object_store: Optional[Path] = None,
+) -> list[CheckoutResult]:
+    """
+    Checkout repositories concurrently with a bounded pool of workers.
+
+    Args:
+        repos: (name, url, ref, path, sparse_paths) of each repository
+        jobs: Maximum number of concurrent checkouts
+        attempts: Maximum number of attempts per repository
+        backoff_s: Base delay before the first retry
+        object_store: Optional directory of persistent reference repositories
+
+    Returns:
+        One CheckoutResult per repository, in the order of *repos*
+    """
+    results: dict[str, CheckoutResult] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos) or 1))) as pool:
+        futures = [
+            pool.submit(
+                checkout_repo_with_retries, name, url, ref, path, sparse_paths, object_store, attempts, backoff_s
+            )
+            for name, url, ref, path, sparse_paths in repos
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results[result.name] = result
+            status = "done" if result.ok else "FAILED"
+            retries = f", {result.attempts} attempts" if result.attempts > 1 else ""
+            _LOG.info(f"[{done}/{len(repos)}] {result.name} {status} in {result.duration_s:.1f}s{retries}")
+    return [results[repo[0]] for repo in repos]
+
+
+def _log_summary(results: list[CheckoutResult]) -> None:
+    _LOG.info("Checkout timings:")
+    for result in sorted(results, key=lambda r: r.duration_s, reverse=True):
+        status = "ok" if result.ok else f"failed: {result.error}"
+        _LOG.info(f"  {result.name:<30} {result.duration_s:7.1f}s  {status}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point for standalone execution."""
+    parser = argparse.ArgumentParser(description="Checkout all pinned repositories from known_good.json")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of concurrent checkouts (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--attempts",
+        type=int,
+        default=DEFAULT_ATTEMPTS,
+        help=f"Attempts per repository before giving up (default: {DEFAULT_ATTEMPTS})",
+    )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="Only check out each module's metadata.code_root_path (for commit-pinned modules)",
+    )
+    parser.add_argument(
+        "--object-store",
+        metavar="DIR",
+        type=Path,
+        help="Persistent directory of reference repositories that checkouts borrow objects from",
+    )
+    parser.add_argument(
+        "--allow-partial",
+        action="store_true",
+        help="Exit successfully if at least one repository was checked out",
+    )
+    args = parser.parse_args(argv)
+
     # When running with bazel, use BUILD_WORKING_DIRECTORY to find workspace root
     workspace_root = Path(os.environ.get("BUILD_WORKING_DIRECTORY", "."))
     known_good_path = workspace_root / "known_good.json"
@@ -68,25 +224,26 @@ def main() -> int:
     modules = known_good.modules.get("target_sw", {})
     repo_count = len(modules)
 
-    _LOG.info(f"Checking out {repo_count} repositories from known_good.json...")
-
-    # Track successfully checked out repositories
-    repo_paths = []
+    _LOG.info(f"Checking out {repo_count} repositories from known_good.json ({args.jobs} parallel)...")
 
-    # Checkout each repository
-    for name, module in modules.items():
-        url = module.repo
-        # Prioritize hash and version over branch to ensure pinned commits
-        ref = module.hash or module.version or module.branch
-        # Use workspace-relative path
-        path = workspace_root / "repos" / name
+    repos = [
+        (
+            name,
+            module.repo,
+            # Prioritize hash and version over branch to ensure pinned commits
+            module.hash or module.version or module.branch,
+            # Use workspace-relative path
+            workspace_root / "repos" / name,
+            sparse_paths_from_code_root(module.metadata.code_root_path) if args.sparse else None,
+        )
+        for name, module in modules.items()
+    ]
+    results = checkout_all(repos, jobs=args.jobs, attempts=args.attempts, object_store=args.object_store)
+    _log_summary(results)
 
-        try:
-            checkout_repo(name, url, ref, path)
-            repo_paths.append(str(path))
-        except Exception as e:
-            _LOG.error(f"Failed to checkout {name}: {e}")
-            return 1
+    # Track successfully checked out repositories
+    repo_paths = [str(result.path) for result in results if result.ok]
+    failed = [result.name for result in results if not result.ok]
 
     # Output all paths (comma-separated for GitHub Actions compatibility)
     repo_paths_output = ",".join(repo_paths)
@@ -97,11 +254,16 @@ def main() -> int:
         try:
             with open(github_output, "a") as f:
                 f.write(f"repo_paths={repo_paths_output}\n")
+                f.write(f"failed_repos={','.join(failed)}\n")
         except IOError as e:
             _LOG.warning(f"Failed to write GITHUB_OUTPUT: {e}")
 
     # Log summary
     _LOG.info(f"Successfully checked out {len(repo_paths)} of {repo_count} repositories")
+    if failed:
+        _LOG.error(f"Failed to checkout: {', '.join(failed)}")
+        if not (args.allow_partial and repo_paths):
+            return 1
 
     return 0
 
@@ -0,0 +1,203 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Analyze the pinned repositories with CodeQL, reusing results of unchanged modules.
+
+Every target_sw module of known_good.json checked out below repos/ is analyzed
+as its own CodeQL database. Databases and SARIF are cached per module under its
+pinned hash, the CodeQL version and the analysis configuration, so only modules
+whose pin (or the configuration) changed are analyzed again. Modules pinned only
+by a branch are cached under the commit checked out for them. The SARIF of all
+modules is merged into one file with URIs relative to the workspace root, as a
+single multi-repo analysis would produce.
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from scripts.tooling.lib.codeql_cache import (
+    CodeQLCache,
+    cache_key,
+    codeql_version,
+    default_cache_path,
+    module_config,
+)
+from scripts.tooling.lib.known_good import Module, load_known_good
+from scripts.tooling.lib.sarif import merge_sarif
+
+_LOG = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+CODEQL_CONFIG = ".github/codeql/codeql-config.yml"
+SARIF_FILE = "sarif-results/cpp.sarif"
+DEFAULT_CATEGORY = "multi-repo-scan"
+
+
+def load_codeql_config(path: Path) -> dict:
+    """Load a CodeQL code scanning config file.
+
+    Raises:
+        ImportError: If PyYAML is not installed (it is locked in requirements.txt)
+        ValueError: If the file is not valid YAML or not a mapping
+    """
+    import yaml
+
+    with open(path, encoding="utf-8") as f:
+        try:
+            config = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: {e}") from e
+    if not isinstance(config, dict):
+        raise ValueError(f"{path}: expected a mapping at the top level")
+    return config
+
+
+def pinned_revision(module: Module, source_root: Path) -> str:
+    """Return the revision the results of *module* are cached under.
+
+    A branch moves, so a module pinned only by a branch is keyed on the commit
+    checked out for it at *source_root*.
+
+    Raises:
+        ValueError: If the module is pinned only by a branch and not checked out
+    """
+    if module.hash or module.version:
+        return module.hash or module.version
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(source_root), "rev-parse", "--verify", "HEAD^{commit}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, OSError) as e:
+        raise ValueError(f"branch {module.branch} is not checked out at {source_root}") from e
+    return result.stdout.strip()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for standalone execution."""
+    parser = argparse.ArgumentParser(description="Analyze pinned repositories with per-module CodeQL caching")
+    parser.add_argument("--codeql", default="codeql", help="CodeQL CLI executable (default: codeql from PATH)")
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=default_cache_path(),
+        help="Cache directory of databases and SARIF (default: ~/.cache/score-tooling/codeql)",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path(CODEQL_CONFIG),
+        help=f"Code scanning config of the multi-repo scan (default: {CODEQL_CONFIG})",
+    )
+    parser.add_argument("--packs", nargs="*", default=[], help="Query packs to run, as for codeql-action/init")
+    parser.add_argument("--category", default=DEFAULT_CATEGORY, help=f"SARIF category (default: {DEFAULT_CATEGORY})")
+    parser.add_argument("--output", type=Path, default=Path(SARIF_FILE), help=f"Merged SARIF (default: {SARIF_FILE})")
+    parser.add_argument("--threads", type=int, default=0, help="Threads per CodeQL command (default: 0, all cores)")
+    args = parser.parse_args(argv)
+
+    # When running with bazel, use BUILD_WORKING_DIRECTORY to find workspace root
+    workspace_root = Path(os.environ.get("BUILD_WORKING_DIRECTORY", "."))
+    known_good_path = workspace_root / "known_good.json"
+    config_path = workspace_root / args.config
+    output = workspace_root / args.output
+
+    try:
+        known_good = load_known_good(known_good_path)
+        base_config = load_codeql_config(config_path)
+        version = codeql_version(args.codeql)
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        _LOG.error(f"Failed to prepare the scan: {e}")
+        return 1
+    except ImportError as e:
+        _LOG.error(f"PyYAML is required to read {config_path}: {e}")
+        return 1
+
+    config = module_config(base_config, args.packs)
+    cache = CodeQLCache(args.cache)
+    cache.path.mkdir(parents=True, exist_ok=True)
+    # JSON is valid YAML, so CodeQL reads the derived config as is.
+    config_file = cache.path / "module-config.json"
+    config_file.write_text(json.dumps(config, indent=2, sort_keys=True), encoding="utf-8")
+
+    modules = known_good.modules.get("target_sw", {})
+    _LOG.info(f"Scanning {len(modules)} modules with CodeQL {version}")
+
+    parts = []
+    reused, analyzed, failed = [], [], []
+    for name, module in modules.items():
+        source_root = workspace_root / "repos" / name
+        try:
+            key = cache_key(pinned_revision(module, source_root), version, config)
+        except ValueError as e:
+            _LOG.error(f"  {name:<30} {e}")
+            failed.append(name)
+            continue
+        sarif = cache.sarif(name, key)
+        if sarif is not None:
+            _LOG.info(f"  {name:<30} unchanged, reusing cached results")
+            reused.append(name)
+            parts.append((sarif, f"repos/{name}/"))
+            continue
+
+        if not source_root.is_dir():
+            _LOG.error(f"  {name:<30} changed but not checked out at {source_root}")
+            failed.append(name)
+            continue
+
+        start = time.monotonic()
+        try:
+            sarif = cache.analyze(
+                args.codeql,
+                name,
+                key,
+                source_root.resolve(),
+                config_file,
+                category=args.category,
+                threads=args.threads,
+            )
+        except (subprocess.CalledProcessError, OSError) as e:
+            _LOG.error(f"  {name:<30} analysis failed: {e}")
+            failed.append(name)
+            continue
+        _LOG.info(f"  {name:<30} analyzed in {time.monotonic() - start:.1f}s")
+        analyzed.append(name)
+        parts.append((sarif, f"repos/{name}/"))
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        runs = merge_sarif(parts, output)
+    except (ValueError, OSError) as e:
+        _LOG.error(f"Failed to merge SARIF: {e}")
+        return 1
+
+    _LOG.info(
+        f"Reused {len(reused)}, analyzed {len(analyzed)}, failed {len(failed)} modules; "
+        f"wrote {sum(run.kept for run in runs)} results to {output}"
+    )
+    if failed:
+        _LOG.error(f"Failed to analyze: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
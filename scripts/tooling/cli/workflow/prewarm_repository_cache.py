@@ -0,0 +1,286 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Prewarm Bazel's repository caches before a build.
+
+Registry modules selected in MODULE.bazel.lock are downloaded (source archives,
+registry patches and overlay files) concurrently into the content-addressable
+layout of a shared ``--repository_cache``, so any output base finds them there.
+
+Modules pinned by commit in known_good.json are fetched by Bazel's
+``git_repository`` rule, which cannot be fed from outside Bazel. With
+``--bazel-fetch`` they are fetched with one ``bazel fetch`` invocation into a
+shared ``--repo_contents_cache``, from where further output bases (e.g. the
+per-platform ones used by score_starter) reuse them.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from scripts.tooling.lib.known_good import load_known_good
+
+_LOG = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+DEFAULT_JOBS = 16
+DEFAULT_TIMEOUT_S = 60.0
+
+
+@dataclass
+class Download:
+    """A file Bazel will download, identified by its SHA-256."""
+
+    urls: list[str]
+    sha256: str
+
+
+def integrity_to_sha256(integrity: str) -> Optional[str]:
+    """
+    Convert an SRI ``sha256-<base64>`` integrity string into a hex digest.
+
+    Returns:
+        Hex digest, or None for other hash algorithms (Bazel keys its cache by SHA-256)
+    """
+    algorithm, _, digest = integrity.partition("-")
+    if algorithm != "sha256":
+        return None
+    return base64.b64decode(digest).hex()
+
+
+def cache_path(repository_cache: Path, sha256: str) -> Path:
+    """Return where Bazel's repository cache stores a file with the given SHA-256."""
+    return repository_cache / "content_addressable" / "sha256" / sha256 / "file"
+
+
+def registry_source_files(lockfile: Path) -> dict[str, str]:
+    """
+    Return the source.json URLs of all registry modules selected in MODULE.bazel.lock.
+
+    Returns:
+        Mapping of source.json URL to its expected SHA-256 hex digest
+    """
+    data = json.loads(lockfile.read_text(encoding="utf-8"))
+    return {
+        url: digest
+        for url, digest in data.get("registryFileHashes", {}).items()
+        if url.endswith("/source.json") and digest
+    }
+
+
+def _fetch_url(url: str, timeout: float) -> bytes:
+    with urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+def source_downloads(source_url: str, expected_sha256: str, timeout: float) -> list[Download]:
+    """
+    Read a registry source.json and list the archive, patches and overlay files it refers to.
+
+    Raises:
+        URLError, ValueError: If source.json cannot be fetched, does not match the
+            lockfile or is not valid JSON
+    """
+    content = _fetch_url(source_url, timeout)
+    if hashlib.sha256(content).hexdigest() != expected_sha256:
+        raise ValueError(f"{source_url} does not match the hash recorded in MODULE.bazel.lock")
+    source = json.loads(content)
+    if source.get("type", "archive") != "archive":
+        return []
+
+    base_url = source_url.rsplit("/", 1)[0]
+    downloads = []
+    sha256 = integrity_to_sha256(source.get("integrity", ""))
+    if sha256:
+        downloads.append(Download([source["url"], *source.get("mirror_urls", [])], sha256))
+    for subdir, files in (("patches", source.get("patches", {})), ("overlay", source.get("overlay", {}))):
+        for name, integrity in files.items():
+            sha256 = integrity_to_sha256(integrity)
+            if sha256:
+                downloads.append(Download([f"{base_url}/{subdir}/{name}"], sha256))
+    return downloads
+
+
+def download_into_cache(download: Download, repository_cache: Path, timeout: float) -> str:
+    """
+    Store *download* in the repository cache unless it is already there.
+
+    Returns:
+        "cached", "downloaded" or "failed"
+    """
+    target = cache_path(repository_cache, download.sha256)
+    if target.exists():
+        return "cached"
+    for url in download.urls:
+        try:
+            content = _fetch_url(url, timeout)
+        except (URLError, OSError) as e:
+            _LOG.warning(f"Failed to download {url}: {e}")
+            continue
+        if hashlib.sha256(content).hexdigest() != download.sha256:
+            _LOG.warning(f"Checksum mismatch for {url}")
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"file.tmp{os.getpid()}")
+        tmp.write_bytes(content)
+        tmp.replace(target)
+        return "downloaded"
+    return "failed"
+
+
+def prewarm_registry_modules(lockfile: Path, repository_cache: Path, jobs: int, timeout: float) -> dict[str, int]:
+    """
+    Download all registry files of the modules selected in *lockfile* into *repository_cache*.
+
+    Returns:
+        Number of files per outcome ("cached", "downloaded", "failed")
+    """
+    sources = registry_source_files(lockfile)
+    _LOG.info(f"Resolving {len(sources)} registry modules from {lockfile.name}...")
+    counts = {"cached": 0, "downloaded": 0, "failed": 0}
+
+    def resolve(item: tuple[str, str]) -> Optional[list[Download]]:
+        try:
+            return source_downloads(item[0], item[1], timeout)
+        except (URLError, OSError, ValueError) as e:
+            _LOG.warning(f"Skipping {item[0]}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        resolved = list(pool.map(resolve, sources.items()))
+        counts["failed"] += resolved.count(None)
+        downloads = [d for ds in resolved if ds for d in ds]
+        unique = list({d.sha256: d for d in downloads}.values())
+        _LOG.info(f"Prewarming {len(unique)} files into {repository_cache}...")
+        for outcome in pool.map(lambda d: download_into_cache(d, repository_cache, timeout), unique):
+            counts[outcome] += 1
+    return counts
+
+
+def bazel_fetch(
+    module_names: list[str],
+    repository_cache: Path,
+    repo_contents_cache: Path,
+    workspace_root: Path,
+    output_base: Optional[Path] = None,
+) -> int:
+    """
+    Fetch *module_names* with a single ``bazel fetch`` into shared caches.
+
+    Bazel fetches the requested repositories concurrently; the shared
+    ``--repo_contents_cache`` makes the results available to other output bases.
+
+    Returns:
+        Exit code of bazel
+    """
+    cmd = ["bazel"]
+    if output_base:
+        cmd.append(f"--output_base={output_base}")
+    cmd += [
+        "fetch",
+        f"--repository_cache={repository_cache}",
+        f"--repo_contents_cache={repo_contents_cache}",
+        *[f"--repo=@{name}" for name in module_names],
+    ]
+    _LOG.info(f"Fetching {len(module_names)} git_override modules with bazel...")
+    return subprocess.run(cmd, cwd=workspace_root, check=False).returncode
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point for standalone execution."""
+    parser = argparse.ArgumentParser(description="Prewarm Bazel repository caches for known_good.json")
+    parser.add_argument(
+        "--repository-cache",
+        type=Path,
+        default=Path.home() / ".cache" / "bazel" / "repo",
+        help="Shared Bazel --repository_cache directory (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repo-contents-cache",
+        type=Path,
+        default=Path.home() / ".cache" / "bazel" / "repo_contents",
+        help="Shared Bazel --repo_contents_cache directory used with --bazel-fetch (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--bazel-fetch",
+        action="store_true",
+        help="Also fetch the git_override modules of known_good.json with bazel",
+    )
+    parser.add_argument(
+        "--output-base",
+        type=Path,
+        help="Bazel --output_base used for --bazel-fetch",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of concurrent downloads (default: {DEFAULT_JOBS})",
+    )
+    args = parser.parse_args(argv)
+
+    # When running with bazel, use BUILD_WORKING_DIRECTORY to find workspace root
+    workspace_root = Path(os.environ.get("BUILD_WORKING_DIRECTORY", "."))
+    known_good_path = workspace_root / "known_good.json"
+    lockfile = workspace_root / "MODULE.bazel.lock"
+
+    try:
+        known_good = load_known_good(known_good_path)
+    except (FileNotFoundError, ValueError) as e:
+        _LOG.error(f"Failed to load known_good.json: {e}")
+        return 1
+
+    git_modules = [m for m in known_good.all_modules if m.hash and not m.version]
+    missing_patches = [
+        str(path) for module in git_modules for path in module.patch_paths(workspace_root) if not path.is_file()
+    ]
+    if missing_patches:
+        _LOG.error(f"Patches referenced in known_good.json not found: {', '.join(missing_patches)}")
+        return 1
+
+    exit_code = 0
+    if lockfile.exists():
+        counts = prewarm_registry_modules(lockfile, args.repository_cache, args.jobs, DEFAULT_TIMEOUT_S)
+        _LOG.info(
+            f"Repository cache: {counts['downloaded']} downloaded, {counts['cached']} already cached, "
+            f"{counts['failed']} failed"
+        )
+        # Failed downloads are not fatal: bazel fetches them itself during the build.
+    else:
+        _LOG.warning(f"{lockfile} not found, skipping registry modules")
+
+    if args.bazel_fetch and git_modules:
+        exit_code = bazel_fetch(
+            [m.name for m in git_modules],
+            args.repository_cache,
+            args.repo_contents_cache,
+            workspace_root,
+            args.output_base,
+        )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
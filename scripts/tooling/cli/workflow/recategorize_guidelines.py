@@ -13,138 +13,108 @@
 
 """
 Recategorize CodeQL SARIF results according to coding standards.
+
+Recategorization and the repos/ filter are applied in one streaming pass, so
+the SARIF file is read and written only once.
 """
 
-import json
+import argparse
+import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 
+from scripts.tooling.lib.coding_standards import (
+    Recategorizer,
+    get_recategorizations,
+    load_config,
+    validate_config,
+    validate_sarif,
+)
+from scripts.tooling.lib.sarif import filter_sarif
 
 # Configuration paths
-RECATEGORIZE_SCRIPT = "codeql-coding-standards-repo/scripts/guideline_recategorization/recategorize.py"
 CODING_STANDARDS_CONFIG = "./.github/codeql/coding-standards.yml"
 CODING_STANDARDS_SCHEMA = "codeql-coding-standards-repo/schemas/coding-standards-schema-1.0.0.json"
 SARIF_SCHEMA = "codeql-coding-standards-repo/schemas/sarif-schema-2.1.0.json"
 SARIF_FILE = "sarif-results/cpp.sarif"
-OUTPUT_DIR = "sarif-results-recategorized"
+
+# Matches repos/ at the start of a URI or after a /
+REPOS_URI_PATTERN = re.compile(r"(^|/)repos/")
 
 
-def validate_paths():
+def validate_paths(*, validate=False):
     """
     Validate that required files exist.
 
-    Note: Only validates files needed for recategorization if SARIF exists.
+    Args:
+        validate: Whether the schema files are needed as well
     Returns:
-        True if validation passes or SARIF doesn't exist, False on critical errors
+        True if validation passes, False if a required file is missing
     """
-    # First check if SARIF file exists - if not, nothing to recategorize
-    if not Path(SARIF_FILE).exists():
-        print(f"Info: SARIF file not found at {SARIF_FILE}", file=sys.stderr)
-        return False  # Signal to skip recategorization
-
-    # SARIF exists, check for recategorization dependencies
-    optional_files = [
-        RECATEGORIZE_SCRIPT,
-        CODING_STANDARDS_SCHEMA,
-        SARIF_SCHEMA,
-    ]
+    required_files = [CODING_STANDARDS_CONFIG]
+    if validate:
+        required_files += [CODING_STANDARDS_SCHEMA, SARIF_SCHEMA]
 
-    required_files = [
-        CODING_STANDARDS_CONFIG,
-    ]
-
-    # Check required files (fail if missing)
     for file_path in required_files:
         if not Path(file_path).exists():
             print(f"Error: Required file not found: {file_path}", file=sys.stderr)
             return False
 
-    # Warn about optional files but don't fail
-    missing_optional = []
-    for file_path in optional_files:
-        if not Path(file_path).exists():
-            missing_optional.append(file_path)
-
-    if missing_optional:
-        print(f"Warning: Some recategorization files not found: {missing_optional}", file=sys.stderr)
-        print("Recategorization will be skipped, but filtering will still be applied.", file=sys.stderr)
-
     return True
 
 
-def recategorize_sarif():
+def load_recategorizer(*, validate=False):
     """
-    Run the CodeQL recategorization script on SARIF results.
+    Load the guideline recategorizations from the coding standards config.
 
+    Args:
+        validate: Whether to validate the config against its schema
     Returns:
-        True if successful or skipped, False on critical errors
+        A Recategorizer, None if recategorization has to be skipped
     """
-    # Check if recategorization script exists
-    if not Path(RECATEGORIZE_SCRIPT).exists():
-        print(f"Info: Recategorization script not found at {RECATEGORIZE_SCRIPT}", file=sys.stderr)
-        print("Skipping recategorization step (will apply filtering only).", file=sys.stderr)
-        return True  # Not a failure, just skip this step
+    try:
+        config = load_config(Path(CODING_STANDARDS_CONFIG))
+        if validate:
+            validate_config(config, Path(CODING_STANDARDS_SCHEMA))
+        recategorizations = get_recategorizations(config)
+    except ImportError as e:
+        print(f"Warning: Recategorization dependencies not available: {e}", file=sys.stderr)
+        print("Recategorization will be skipped, but filtering will still be applied.", file=sys.stderr)
+        return None
+    except Exception as e:  # yaml, jsonschema and malformed entries raise their own types
+        print(f"Warning: Invalid coding standards config {CODING_STANDARDS_CONFIG}: {e}", file=sys.stderr)
+        print("Recategorization will be skipped, but filtering will still be applied.", file=sys.stderr)
+        return None
 
-    # Create output directory
-    output_path = Path(OUTPUT_DIR)
-    output_path.mkdir(parents=True, exist_ok=True)
+    print(f"Loaded {len(recategorizations)} guideline recategorization(s) from {CODING_STANDARDS_CONFIG}")
+    return Recategorizer(recategorizations)
 
-    output_file = output_path / Path(SARIF_FILE).name
 
-    print(f"Processing {SARIF_FILE} for recategorization...")
+def in_repos(result):
+    """
+    Check whether the first location of a SARIF result is inside repos/.
 
-    try:
-        # Run recategorization script
-        result = subprocess.run(
-            [
-                sys.executable,
-                RECATEGORIZE_SCRIPT,
-                "--coding-standards-schema-file",
-                CODING_STANDARDS_SCHEMA,
-                "--sarif-schema-file",
-                SARIF_SCHEMA,
-                CODING_STANDARDS_CONFIG,
-                SARIF_FILE,
-                str(output_file),
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-
-        print("Recategorization completed successfully")
-        if result.stdout:
-            print("Output:", result.stdout)
-
-        # Replace original SARIF file with recategorized version
-        sarif_path = Path(SARIF_FILE)
-
-        if sarif_path.exists():
-            sarif_path.unlink()
-            print(f"Removed original {SARIF_FILE}")
-
-        # Move recategorized file to original location
-        output_file.replace(sarif_path)
-        print(f"Moved recategorized SARIF to {SARIF_FILE}")
-
-        return True
-
-    except subprocess.CalledProcessError as e:
-        print(f"Error: Recategorization script failed: {e}", file=sys.stderr)
-        if e.stderr:
-            print(f"Error output: {e.stderr}", file=sys.stderr)
-        return False
-    except (FileNotFoundError, OSError) as e:
-        print(f"Error: File operation failed: {e}", file=sys.stderr)
+    Returns:
+        True if the artifact URI matches (^|/)repos/
+    """
+    locations = result.get("locations", [])
+    if not locations:
         return False
+    first_location = locations[0].get("physicalLocation", {})
+    artifact_uri = first_location.get("artifactLocation", {}).get("uri", "")
+    return bool(artifact_uri and REPOS_URI_PATTERN.search(artifact_uri))
 
 
-def filter_sarif_results():
+def process_sarif(recategorizer=None, *, validate=False):
     """
-    Filter SARIF results to only include entries with paths matching repos/*.
+    Recategorize SARIF results and keep only entries with paths matching repos/*.
 
+    The file is streamed, so memory use does not grow with the number of results.
+
+    Args:
+        recategorizer: Applied to the tool object of each run, if given
+        validate: Whether to validate the result against the SARIF schema
     Returns:
         True if successful, False otherwise
     """
@@ -154,69 +124,66 @@ def filter_sarif_results():
         print(f"Warning: SARIF file not found: {SARIF_FILE}", file=sys.stderr)
         return False
 
+    print(f"Processing {SARIF_FILE}: recategorizing and keeping only entries with paths matching repos/* ...")
     try:
-        # Load SARIF file
-        with open(sarif_path, "r") as f:
-            sarif_data = json.load(f)
-
-        print("Filtering SARIF results to only include entries with paths matching repos/* ...")
-
-        # Filter runs and results
-        if "runs" in sarif_data:
-            for run in sarif_data["runs"]:
-                if "results" in run:
-                    filtered_results = []
-
-                    for result in run["results"]:
-                        # Check if result has locations
-                        locations = result.get("locations", [])
-                        if not locations:
-                            continue
-
-                        # Check if first location URI matches repos/ pattern
-                        first_location = locations[0].get("physicalLocation", {})
-                        artifact_uri = first_location.get("artifactLocation", {}).get("uri", "")
-
-                        # Pattern: (^|/)repos/ - matches repos/ at start or after a /
-                        if artifact_uri and re.search(r"(^|/)repos/", artifact_uri):
-                            filtered_results.append(result)
-
-                    # Update results with filtered list
-                    run["results"] = filtered_results
-                    print(
-                        f"Run '{run.get('tool', {}).get('driver', {}).get('name', 'unknown')}' "
-                        f"now has {len(filtered_results)} results"
-                    )
-
-        # Write filtered SARIF back to file
-        with open(sarif_path, "w") as f:
-            json.dump(sarif_data, f, indent=2)
-
-        print(f"Filtered SARIF written to {SARIF_FILE}")
-        return True
-
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Error: Failed to filter SARIF file: {e}", file=sys.stderr)
+        runs = filter_sarif(sarif_path, sarif_path, in_repos, rewrite_tool=recategorizer)
+    except (ValueError, OSError) as e:
+        print(f"Error: Failed to process SARIF file: {e}", file=sys.stderr)
         return False
 
+    if recategorizer is not None:
+        for recategorization, category in recategorizer.invalid:
+            print(
+                f"Warning: Skipping invalid recategorization of {recategorization.rule_id} "
+                f"from {category} to {recategorization.category}",
+                file=sys.stderr,
+            )
+        print(f"Recategorized {recategorizer.applied} rule(s)")
+    for run in runs:
+        print(f"Run '{run.tool}' now has {run.kept} results ({run.dropped} outside repos/ removed)")
+
+    if validate:
+        try:
+            validate_sarif(sarif_path, Path(SARIF_SCHEMA))
+        except Exception as e:  # ImportError or jsonschema.ValidationError
+            print(f"Error: {SARIF_FILE} does not match the SARIF schema: {e}", file=sys.stderr)
+            return False
+        print(f"{SARIF_FILE} matches the SARIF schema")
+
+    print(f"Processed SARIF written to {SARIF_FILE}")
+    return True
+
 
 def main():
     """Main entry point."""
-    # Validate required files exist
-    has_sarif = validate_paths()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Validate the config and the result against the schemas of codeql-coding-standards-repo/",
+    )
+    args = parser.parse_args()
+
+    # When running with bazel, the paths above are relative to the workspace root
+    build_working_dir = os.environ.get("BUILD_WORKING_DIRECTORY")
+    if build_working_dir:
+        os.chdir(build_working_dir)
 
-    if not has_sarif:
+    # First check if SARIF file exists - if not, nothing to recategorize
+    if not Path(SARIF_FILE).exists():
         # No SARIF file to process - this is normal before CodeQL analysis runs
+        print(f"Info: SARIF file not found at {SARIF_FILE}", file=sys.stderr)
         print("No SARIF file found - skipping recategorization.")
         print("This is expected if CodeQL analysis hasn't completed yet.")
         sys.exit(0)
 
-    # Run recategorization (will skip gracefully if script not available)
-    if not recategorize_sarif():
-        print("Warning: Recategorization failed, continuing with filtering...", file=sys.stderr)
+    # Validate required files exist
+    if not validate_paths(validate=args.validate):
+        sys.exit(1)
 
-    # Filter SARIF results to only include repos/*
-    if not filter_sarif_results():
+    # Recategorize and filter in one pass (recategorization is skipped if the config cannot be loaded)
+    recategorizer = load_recategorizer(validate=args.validate)
+    if not process_sarif(recategorizer, validate=args.validate):
         sys.exit(1)
 
     print("Recategorization workflow completed successfully")
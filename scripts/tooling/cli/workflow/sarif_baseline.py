@@ -0,0 +1,128 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Record SARIF findings as a baseline and report only new or fixed findings.
+
+``record`` stores the findings of each target_sw module of known_good.json under
+its pinned hash. ``diff`` writes a delta SARIF holding only the findings that
+are new (``baselineState: new``) or fixed (``baselineState: absent``) compared to
+the latest recorded baseline of each module, or to the baselines of the hashes
+pinned in ``--base-known-good``.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+from scripts.tooling.lib.known_good import load_known_good
+from scripts.tooling.lib.sarif_baseline import BaselineStore, default_store_path
+
+_LOG = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+SARIF_FILE = "sarif-results/cpp.sarif"
+DELTA_FILE = "sarif-results/cpp.delta.sarif"
+
+
+def module_hashes(known_good_path: Path) -> dict[str, str]:
+    """Return ``{module: pinned hash or version}`` of the target_sw modules of a known_good.json."""
+    known_good = load_known_good(known_good_path)
+    return {
+        name: module.hash or module.version
+        for name, module in known_good.modules.get("target_sw", {}).items()
+        if module.hash or module.version
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point for standalone execution."""
+    parser = argparse.ArgumentParser(description="Record SARIF baselines and write new/fixed-only deltas")
+    parser.add_argument("command", choices=["record", "diff"])
+    parser.add_argument("--sarif", type=Path, default=Path(SARIF_FILE), help=f"SARIF file (default: {SARIF_FILE})")
+    parser.add_argument(
+        "--known-good",
+        type=Path,
+        default=Path("known_good.json"),
+        help="known_good.json the SARIF was produced from (default: known_good.json)",
+    )
+    parser.add_argument(
+        "--base-known-good",
+        type=Path,
+        help="diff: compare against the baselines of this known_good.json instead of the latest recorded ones",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=default_store_path(),
+        help="Baseline store directory (default: ~/.cache/score-tooling/sarif_baseline)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(DELTA_FILE),
+        help=f"diff: delta SARIF to write (default: {DELTA_FILE})",
+    )
+    args = parser.parse_args(argv)
+
+    # When running with bazel, the paths above are relative to the workspace root
+    build_working_dir = os.environ.get("BUILD_WORKING_DIRECTORY")
+    if build_working_dir:
+        os.chdir(build_working_dir)
+
+    if not args.sarif.exists():
+        _LOG.error(f"SARIF file not found at {args.sarif}")
+        return 1
+
+    try:
+        current = module_hashes(args.known_good)
+        base = module_hashes(args.base_known_good) if args.base_known_good else None
+    except Exception as e:
+        _LOG.error(f"Failed to parse known_good.json: {e}")
+        return 1
+
+    store = BaselineStore(args.store)
+    try:
+        if args.command == "record":
+            counts = store.record(args.sarif, current)
+            for module, count in sorted(counts.items()):
+                _LOG.info(f"  {module:<30} {current[module][:12]:<12} {count:7} findings")
+            _LOG.info(f"Recorded baselines of {len(counts)} modules in {args.store}")
+            return 0
+
+        if base is None:
+            base = {module: module_hash for module, module_hash in store.latest().items() if module in current}
+        deltas, _ = store.diff(args.sarif, args.output, base)
+    except (ValueError, OSError) as e:
+        _LOG.error(f"Failed to process {args.sarif}: {e}")
+        return 1
+
+    for delta in deltas:
+        _LOG.info(
+            f"  {delta.module:<30} {delta.base_hash[:12]:<12} "
+            f"{delta.new:6} new {delta.fixed:6} fixed {delta.unchanged:7} unchanged"
+        )
+    missing = sorted(set(current) - {delta.module for delta in deltas})
+    if missing:
+        _LOG.warning(f"No baseline for {', '.join(missing)}; their findings are not in the delta")
+    _LOG.info(
+        f"Wrote {sum(d.new for d in deltas)} new and {sum(d.fixed for d in deltas)} fixed findings to {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Persistent per-PR state for incremental release approval checks.
+
+The state remembers the latest review of every user, the evaluated status of
+every module and the ID of the approval comment, so a new review event only
+touches the modules its author maintains and the comment is edited in place.
+It also remembers the number of reviews and the highest review ID seen, so a
+check can tell when new reviews were missed and the reviews must be fetched
+again; missed dismissals are found by re-reading the stored latest reviews.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+_LOG = logging.getLogger(__name__)
+
+STATE_FORMAT_VERSION = 1
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+@dataclass
+class Review:
+    """A single pull request review, reduced to what the approval check needs."""
+
+    review_id: int
+    user_id: int
+    state: str
+    """REST API review state: ``APPROVED``, ``CHANGES_REQUESTED``, ``COMMENTED`` or ``DISMISSED``."""
+    submitted_at: str
+    """ISO 8601 submission time."""
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Review:
+        """Create a review from REST or webhook JSON (webhook states are lower case)."""
+        return cls(
+            review_id=int(data["id"]),
+            user_id=int(data["user"]["id"]),
+            state=str(data["state"]).upper(),
+            submitted_at=_parse_timestamp(data["submitted_at"]).isoformat(),
+        )
+
+    def is_newer_than(self, other: Review) -> bool:
+        return _parse_timestamp(self.submitted_at) > _parse_timestamp(other.submitted_at)
+
+
+@dataclass
+class ApprovalState:
+    """Approval state of one pull request."""
+
+    pr_number: int
+    latest_reviews: dict[int, Review] = field(default_factory=dict)
+    """Latest review per user ID."""
+    module_results: dict[str, dict[str, Any]] = field(default_factory=dict)
+    """Per-module results in the ``moduleResults`` format of ``check_pr_reviews``."""
+    maintainers_digest: str = ""
+    """Digest of the maintainer map the module results were evaluated against."""
+    comment_id: int | None = None
+    comment_digest: str = ""
+    """Digest of the summary last written to the comment."""
+    review_count: int = 0
+    """Number of reviews the PR had when the state was last checked against GitHub."""
+    max_review_id: int = 0
+    """Highest review ID seen."""
+
+    def apply(self, review: Review) -> bool:
+        """Record *review*; return ``True`` if the latest review state of its author changed.
+
+        A review replaces the author's latest review if it is newer, or if it is the same
+        review with a new state (a dismissal). Older reviews and replays are ignored.
+        """
+        self.max_review_id = max(self.max_review_id, review.review_id)
+        current = self.latest_reviews.get(review.user_id)
+        if current is not None:
+            if current.review_id == review.review_id:
+                if current.state == review.state:
+                    return False
+            elif not review.is_newer_than(current):
+                return False
+        changed = current is None or current.state != review.state
+        self.latest_reviews[review.user_id] = review
+        return changed
+
+    def review_states(self) -> dict[int, str]:
+        return {user_id: review.state for user_id, review in self.latest_reviews.items()}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": STATE_FORMAT_VERSION,
+            "pr_number": self.pr_number,
+            "latest_reviews": [asdict(review) for review in self.latest_reviews.values()],
+            "module_results": self.module_results,
+            "maintainers_digest": self.maintainers_digest,
+            "comment_id": self.comment_id,
+            "comment_digest": self.comment_digest,
+            "review_count": self.review_count,
+            "max_review_id": self.max_review_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ApprovalState:
+        reviews = [Review(**item) for item in data.get("latest_reviews", [])]
+        return cls(
+            pr_number=int(data["pr_number"]),
+            latest_reviews={review.user_id: review for review in reviews},
+            module_results=data.get("module_results", {}),
+            maintainers_digest=data.get("maintainers_digest", ""),
+            comment_id=data.get("comment_id"),
+            comment_digest=data.get("comment_digest", ""),
+            review_count=int(data.get("review_count", 0)),
+            max_review_id=int(data.get("max_review_id", 0)),
+        )
+
+
+class ApprovalStateStore:
+    """Approval states stored as one JSON file per pull request in *directory*."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, owner_repo: str, pr_number: int) -> Path:
+        return self.directory / f"{owner_repo.replace('/', '__')}__{pr_number}.json"
+
+    def load(self, owner_repo: str, pr_number: int) -> ApprovalState | None:
+        """Return the stored state, or ``None`` if there is none or it cannot be read."""
+        path = self._path(owner_repo, pr_number)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            _LOG.warning("Ignoring unreadable approval state %s: %s", path, exc)
+            return None
+        if not isinstance(data, dict) or data.get("version") != STATE_FORMAT_VERSION:
+            _LOG.info("Discarding approval state %s with unknown format", path)
+            return None
+        try:
+            return ApprovalState.from_dict(data)
+        except (KeyError, TypeError, ValueError) as exc:
+            _LOG.warning("Ignoring malformed approval state %s: %s", path, exc)
+            return None
+
+    def save(self, owner_repo: str, state: ApprovalState) -> None:
+        path = self._path(owner_repo, state.pr_number)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(state.to_dict(), separators=(",", ":"), sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
+
+
+def load_review_events(event_path: Path) -> list[Review]:
+    """Return the review carried by a ``pull_request_review`` webhook payload at *event_path*.
+
+    Payloads of other events yield an empty list.
+    """
+    payload = json.loads(Path(event_path).read_text(encoding="utf-8"))
+    review = payload.get("review")
+    if not isinstance(review, dict) or not review.get("submitted_at"):
+        return []
+    return [Review.from_api(review)]
@@ -0,0 +1,168 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Per-module cache of CodeQL databases and SARIF results.
+
+Each module is analyzed on its own, with its checkout as source root. The
+database and SARIF of a module are stored under a key derived from the pinned
+commit, the CodeQL CLI version and the analysis configuration::
+
+    <cache>/<module>/<key>/db/          CodeQL database
+    <cache>/<module>/<key>/db.done      marks a completely created database
+    <cache>/<module>/<key>/results.sarif
+
+``results.sarif`` is written last and atomically, so its presence marks a
+complete entry. Older entries of a module are removed once a new one is
+complete, so the cache holds one entry per module.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from .cache import default_cache_dir
+
+_LOG = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_path() -> Path:
+    """Return the default on-disk location of the CodeQL cache."""
+    return default_cache_dir() / "codeql"
+
+
+def module_config(base_config: dict[str, Any], packs: list[str]) -> dict[str, Any]:
+    """Derive the code scanning config of a single-module analysis from the multi-repo one.
+
+    The multi-repo config limits ``paths`` to ``repos``; with the module checkout
+    as source root every file is below the module, so ``paths`` is dropped.
+    *packs* are added like the ``packs`` input of ``codeql-action/init`` does.
+    """
+    config = {key: value for key, value in base_config.items() if key != "paths"}
+    if packs:
+        config["packs"] = sorted(set(config.get("packs") or []) | set(packs))
+    return config
+
+
+def cache_key(commit: str, codeql_version: str, config: dict[str, Any]) -> str:
+    """Return the cache key of a module analysis."""
+    canonical = json.dumps(
+        {"format": CACHE_FORMAT_VERSION, "commit": commit, "codeql": codeql_version, "config": config},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:20]
+
+
+def codeql_version(codeql: str) -> str:
+    """Return the version of the CodeQL CLI *codeql*."""
+    result = subprocess.run([codeql, "version", "--format=terse"], check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@dataclass
+class CodeQLCache:
+    """Directory of per-module CodeQL databases and SARIF files."""
+
+    path: Path = field(default_factory=default_cache_path)
+
+    def entry(self, module: str, key: str) -> Path:
+        return self.path / module / key
+
+    def sarif(self, module: str, key: str) -> Optional[Path]:
+        """Return the cached SARIF of a module analysis, None if there is none."""
+        sarif = self.entry(module, key) / "results.sarif"
+        return sarif if sarif.exists() else None
+
+    def prune(self, module: str, keep: str) -> None:
+        """Remove all entries of *module* except *keep*."""
+        module_dir = self.path / module
+        if not module_dir.is_dir():
+            return
+        for entry in module_dir.iterdir():
+            if entry.name != keep:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def analyze(
+        self,
+        codeql: str,
+        module: str,
+        key: str,
+        source_root: Path,
+        config_file: Path,
+        language: str = "cpp",
+        category: Optional[str] = None,
+        threads: int = 0,
+    ) -> Path:
+        """
+        Create the database of a module and analyze it, storing both under *key*.
+
+        A database completed by an earlier run whose analysis failed is reused.
+
+        Returns:
+            Path of the SARIF file
+
+        Raises:
+            subprocess.CalledProcessError: If a CodeQL command fails
+        """
+        entry = self.entry(module, key)
+        entry.mkdir(parents=True, exist_ok=True)
+        database = entry / "db"
+        database_done = entry / "db.done"
+
+        if not database_done.exists():
+            _LOG.info(f"Creating CodeQL database of {module}")
+            subprocess.run(
+                [
+                    codeql,
+                    "database",
+                    "create",
+                    str(database),
+                    f"--language={language}",
+                    "--build-mode=none",
+                    f"--source-root={source_root}",
+                    f"--codescanning-config={config_file}",
+                    f"--threads={threads}",
+                    "--overwrite",
+                ],
+                check=True,
+            )
+            database_done.touch()
+
+        _LOG.info(f"Analyzing CodeQL database of {module}")
+        tmp = entry / "results.sarif.tmp"
+        command = [
+            codeql,
+            "database",
+            "analyze",
+            str(database),
+            "--format=sarif-latest",
+            f"--output={tmp}",
+            "--download",
+            f"--threads={threads}",
+        ]
+        if category:
+            command.append(f"--sarif-category={category}")
+        subprocess.run(command, check=True)
+
+        sarif = entry / "results.sarif"
+        tmp.replace(sarif)
+        self.prune(module, keep=key)
+        return sarif
@@ -0,0 +1,156 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Guideline recategorization of CodeQL Coding Standards SARIF output.
+
+This is the in-process equivalent of ``recategorize.py`` from
+github/codeql-coding-standards. A recategorization in ``coding-standards.yml``
+changes the obligation of one guideline, e.g. an advisory MISRA rule that the
+project treats as required. In SARIF the obligation is a tag of the rule
+descriptor (``external/<standard>/obligation/<category>``), so only the ``tool``
+object of each run changes; results refer to their rule by ID or index and are
+left untouched. :class:`Recategorizer` is meant to be passed as ``rewrite_tool``
+to :func:`lib.sarif.filter_sarif`.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Recategorizations allowed by MISRA Compliance:2020; anything else is ignored.
+VALID_RECATEGORIZATIONS = {
+    "advisory": {"required", "mandatory", "disapplied"},
+    "required": {"mandatory"},
+    "mandatory": set(),
+}
+
+_OBLIGATION_TAG = re.compile(r"external/(?P<standard>[^/]+)/obligation/(?P<category>[^/]+)")
+_ID_TAG = re.compile(r"external/[^/]+/id/(?P<rule_id>[^/]+)")
+
+
+@dataclass(frozen=True)
+class GuidelineRecategorization:
+    """New category of one guideline."""
+
+    rule_id: str
+    category: str
+
+
+def load_config(path: Path) -> dict[str, Any]:
+    """Load a ``coding-standards.yml`` file.
+
+    Raises:
+        ImportError: If PyYAML is not installed
+        ValueError: If the file is not a YAML mapping
+    """
+    import yaml
+
+    with open(path, encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    if not isinstance(config, dict):
+        raise ValueError(f"{path}: expected a mapping at the top level")
+    return config
+
+
+def get_recategorizations(config: dict[str, Any]) -> list[GuidelineRecategorization]:
+    """Return the guideline recategorizations of a coding standards config."""
+    return [
+        GuidelineRecategorization(spec["rule-id"], spec["category"])
+        for spec in config.get("guideline-recategorizations") or []
+    ]
+
+
+def validate_config(config: dict[str, Any], schema_path: Path) -> None:
+    """Validate a coding standards config against its JSON schema.
+
+    Raises:
+        ImportError: If jsonschema is not installed
+        jsonschema.ValidationError: If the config does not match the schema
+    """
+    import jsonschema
+
+    with open(schema_path, encoding="utf-8") as f:
+        jsonschema.validate(config, json.load(f))
+
+
+def validate_sarif(sarif_path: Path, schema_path: Path) -> None:
+    """Validate a SARIF file against the SARIF JSON schema.
+
+    This loads the whole file, so it is only done on request.
+
+    Raises:
+        ImportError: If jsonschema is not installed
+        jsonschema.ValidationError: If the file does not match the schema
+    """
+    import jsonschema
+
+    with open(schema_path, encoding="utf-8") as f:
+        schema = json.load(f)
+    with open(sarif_path, encoding="utf-8") as f:
+        jsonschema.validate(json.load(f), schema)
+
+
+@dataclass
+class Recategorizer:
+    """Apply guideline recategorizations to the rule descriptors of a SARIF ``tool`` object.
+
+    The obligation tag of every matching rule is replaced and the previous
+    obligation is kept as ``external/<standard>/original-obligation/<category>``.
+    Rules of the driver and of all extensions (query packs) are considered.
+    """
+
+    recategorizations: list[GuidelineRecategorization]
+    applied: int = 0
+    invalid: list[tuple[GuidelineRecategorization, str]] = field(default_factory=list)
+    _by_rule_id: dict[str, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._by_rule_id = {r.rule_id.lower(): r.category for r in self.recategorizations}
+
+    def __call__(self, tool: Any) -> Any:
+        if not self._by_rule_id or not isinstance(tool, dict):
+            return tool
+        components = [tool.get("driver")] + list(tool.get("extensions") or [])
+        for component in components:
+            if isinstance(component, dict):
+                for rule in component.get("rules") or []:
+                    self._recategorize_rule(rule)
+        return tool
+
+    def _recategorize_rule(self, rule: dict[str, Any]) -> None:
+        tags = rule.get("properties", {}).get("tags")
+        if not tags:
+            return
+        category = None
+        for tag in tags:
+            match = _ID_TAG.fullmatch(tag)
+            if match and match["rule_id"].lower() in self._by_rule_id:
+                rule_id = match["rule_id"]
+                category = self._by_rule_id[rule_id.lower()]
+                break
+        if category is None:
+            return
+        for index, tag in enumerate(tags):
+            match = _OBLIGATION_TAG.fullmatch(tag)
+            if not match or match["category"] == category:
+                continue
+            if category not in VALID_RECATEGORIZATIONS.get(match["category"], set()):
+                self.invalid.append((GuidelineRecategorization(rule_id, category), match["category"]))
+                continue
+            tags[index] = f"external/{match['standard']}/obligation/{category}"
+            tags.append(f"external/{match['standard']}/original-obligation/{match['category']}")
+            self.applied += 1
+            return
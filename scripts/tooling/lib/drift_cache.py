@@ -0,0 +1,148 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Persistent cache for module drift (pinned commit vs. branch HEAD) lookups."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from .cache import default_cache_dir
+
+_LOG = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_HEAD_TTL_S = 10 * 60
+"""How long a resolved branch HEAD is trusted before it is looked up again."""
+
+DEFAULT_MAX_AGE_S = 30 * 24 * 60 * 60
+"""Compare results not used for this long are dropped when the cache is saved."""
+
+
+def default_cache_path() -> Path:
+    """Return the default on-disk location of the drift cache."""
+    return default_cache_dir() / "drift_cache.json"
+
+
+class DriftCache:
+    """Thread-safe cache of GitHub lookups used to compute module drift.
+
+    Three kinds of lookups are cached:
+
+    * ``refs``: version/tag -> commit SHA. Release tags are treated as immutable.
+    * ``heads``: branch -> HEAD SHA. Branches move, so these expire after *head_ttl* seconds.
+    * ``compares``: (owner_repo, base SHA, HEAD SHA) -> compare result. Both ends are
+      commits, so the result never changes and only ages out when it stops being used.
+
+    When *path* is ``None`` the cache lives in memory only.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        head_ttl: float = DEFAULT_HEAD_TTL_S,
+        max_age: float = DEFAULT_MAX_AGE_S,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.head_ttl = head_ttl
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._refs: dict[str, str] = {}
+        self._heads: dict[str, dict[str, Any]] = {}
+        self._compares: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        if self.path:
+            self._load()
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return "|".join(parts)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            _LOG.warning("Ignoring unreadable drift cache %s: %s", self.path, exc)
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            _LOG.info("Discarding drift cache %s with unknown format", self.path)
+            return
+        self._refs = data.get("refs", {})
+        self._heads = data.get("heads", {})
+        self._compares = data.get("compares", {})
+
+    def save(self) -> None:
+        """Write the cache back to :attr:`path` (no-op for in-memory caches or when unchanged)."""
+        if not self.path or not self._dirty:
+            return
+        now = time.time()
+        with self._lock:
+            compares = {k: v for k, v in self._compares.items() if now - v.get("used_at", 0) <= self.max_age}
+            heads = {k: v for k, v in self._heads.items() if now - v.get("fetched_at", 0) <= self.max_age}
+            data = {
+                "version": CACHE_FORMAT_VERSION,
+                "refs": self._refs,
+                "heads": heads,
+                "compares": compares,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            tmp.replace(self.path)
+            self._dirty = False
+
+    def get_ref(self, owner_repo: str, ref: str) -> Optional[str]:
+        with self._lock:
+            return self._refs.get(self._key(owner_repo, ref))
+
+    def set_ref(self, owner_repo: str, ref: str, sha: str) -> None:
+        with self._lock:
+            self._refs[self._key(owner_repo, ref)] = sha
+            self._dirty = True
+
+    def get_head(self, owner_repo: str, branch: str) -> Optional[str]:
+        """Return the cached HEAD SHA of *branch*, or ``None`` if unknown or older than :attr:`head_ttl`."""
+        with self._lock:
+            item = self._heads.get(self._key(owner_repo, branch))
+        if not item or time.time() - item.get("fetched_at", 0) > self.head_ttl:
+            return None
+        return item.get("sha")
+
+    def set_head(self, owner_repo: str, branch: str, sha: str) -> None:
+        with self._lock:
+            self._heads[self._key(owner_repo, branch)] = {"sha": sha, "fetched_at": time.time()}
+            self._dirty = True
+
+    def get_compare(self, owner_repo: str, base_sha: str, head_sha: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            item = self._compares.get(self._key(owner_repo, base_sha, head_sha))
+            if item is None:
+                return None
+            now = time.time()
+            # Refreshing the usage stamp once a day is enough to keep live entries from ageing out.
+            if now - item.get("used_at", 0) > 24 * 60 * 60:
+                item["used_at"] = now
+                self._dirty = True
+            return {k: v for k, v in item.items() if k != "used_at"}
+
+    def set_compare(self, owner_repo: str, base_sha: str, head_sha: str, result: dict[str, Any]) -> None:
+        with self._lock:
+            self._compares[self._key(owner_repo, base_sha, head_sha)] = {**result, "used_at": time.time()}
+            self._dirty = True
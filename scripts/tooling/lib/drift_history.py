@@ -0,0 +1,139 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Append-only time series of module drift (commits behind branch HEAD).
+
+Every snapshot is one compact JSON line
+``{"ts": <epoch>, "behind": {"<group>/<module>": <n>, ...}}``; modules of the
+same name in different groups are different series. Snapshots recorded before
+modules were keyed by group use the plain module name; they count towards the
+totals but belong to no module.
+
+Lines are only ever appended with increasing timestamps, so the start of a time
+window is located by bisecting over byte offsets and reading the history stays
+proportional to the window, not to the total number of stored snapshots.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import IO, Any
+
+Snapshot = tuple[float, dict[str, int]]
+
+
+def module_key(group: str, name: str) -> str:
+    """Return the key of the module *name* of *group* in snapshots and timelines."""
+    return f"{group}/{name}"
+
+
+class DriftHistory:
+    """Drift snapshots stored in the file at *path*."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    def append(self, entries: list[dict[str, Any]], ts: float | None = None) -> bool:
+        """Append the ``behind_by`` values of *entries* as one snapshot.
+
+        Entries without compare data are skipped. Returns ``False`` if nothing was recorded.
+        """
+        behind = {module_key(e["group"], e["name"]): e["behind_by"] for e in entries if e.get("behind_by") is not None}
+        if not behind:
+            return False
+        ts = time.time() if ts is None else ts
+        line = json.dumps({"ts": int(ts), "behind": behind}, separators=(",", ":"), sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        return True
+
+    def read_since(self, since: float) -> list[Snapshot]:
+        """Return all snapshots with a timestamp of at least *since*, oldest first."""
+        if not self.path.exists():
+            return []
+        with open(self.path, "rb") as f:
+            _seek_to_timestamp(f, since)
+            snapshots = []
+            for raw in f:
+                snapshot = _parse_line(raw)
+                if snapshot and snapshot[0] >= since:
+                    snapshots.append(snapshot)
+            return snapshots
+
+
+def _parse_line(raw: bytes) -> Snapshot | None:
+    try:
+        data = json.loads(raw)
+        return float(data["ts"]), data["behind"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _seek_to_timestamp(f: IO[bytes], since: float) -> None:
+    """Position *f* at the start of a line at or before the first snapshot newer than *since*.
+
+    *lo* is always a line start that is older than *since*, so reading forward from it
+    never misses a snapshot; the bisection only shortens the part that is read.
+    """
+    f.seek(0, 2)
+    lo, hi = 0, f.tell()
+    while hi - lo > 4096:
+        mid = (lo + hi) // 2
+        f.seek(mid)
+        f.readline()  # skip the partial line
+        line_start = f.tell()
+        snapshot = _parse_line(f.readline())
+        if snapshot is None or snapshot[0] >= since:
+            hi = mid
+        else:
+            lo = line_start
+    f.seek(lo)
+
+
+def build_timeline(snapshots: list[Snapshot], days: int, now: float | None = None) -> dict[str, Any]:
+    """Downsample *snapshots* to one value per day over the last *days* days.
+
+    The last snapshot of each day wins. The result is columnar so it embeds compactly
+    into the report regardless of how many snapshots were recorded::
+
+        {"days": ["2026-01-01", ...], "modules": {"target_sw/score_baselibs": [3, null, ...]},
+         "total": [12, null, ...], "behind_count": [2, null, ...]}
+
+    ``total`` is the summed integration lag over all modules and ``behind_count`` the
+    number of modules that are not up to date. Days without a snapshot are ``null``.
+    """
+    now = time.time() if now is None else now
+    end = datetime.fromtimestamp(now, tz=UTC).date()
+    day_keys = [date.fromordinal(end.toordinal() - offset).isoformat() for offset in range(days - 1, -1, -1)]
+    index = {day: i for i, day in enumerate(day_keys)}
+
+    per_day: dict[int, dict[str, int]] = {}
+    for ts, behind in snapshots:
+        i = index.get(datetime.fromtimestamp(ts, tz=UTC).date().isoformat())
+        if i is not None:
+            per_day[i] = behind
+
+    names = sorted({name for behind in per_day.values() for name in behind})
+    modules: dict[str, list[int | None]] = {name: [None] * days for name in names}
+    total: list[int | None] = [None] * days
+    behind_count: list[int | None] = [None] * days
+    for i, behind in per_day.items():
+        for name, value in behind.items():
+            modules[name][i] = value
+        total[i] = sum(behind.values())
+        behind_count[i] = sum(1 for value in behind.values() if value > 0)
+
+    return {"days": day_keys, "modules": modules, "total": total, "behind_count": behind_count}
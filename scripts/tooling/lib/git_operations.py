@@ -20,14 +20,20 @@ authentication to avoid rate limits.
 import logging
 import os
 import re
+import shutil
+import threading
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 
 import git
 from git import Repo
 
 _LOG = logging.getLogger(__name__)
 
+_object_store_locks: dict[Path, threading.Lock] = {}
+_object_store_locks_guard = threading.Lock()
+
 
 def is_commit_hash(ref: str) -> bool:
     """
@@ -62,17 +68,153 @@ def get_authenticated_url(url: str, token: Optional[str] = None) -> str:
     return url
 
 
-def shallow_clone_repository(url: str, path: Path, ref: Optional[str] = None, token: Optional[str] = None) -> None:
+def sparse_paths_from_code_root(code_root_path: str) -> list[str]:
+    """
+    Convert a Bazel target pattern such as ``//score/...`` into sparse checkout paths.
+
+    Args:
+        code_root_path: Bazel package pattern from module metadata
+
+    Returns:
+        Directories to check out, or an empty list if the pattern covers the whole repository
+    """
+    path = code_root_path.removeprefix("//").split(":")[0]
+    path = path.removesuffix("...").strip("/")
+    return [path] if path else []
+
+
+def _pinned_ref(ref: str) -> str:
+    return f"refs/pinned/{ref}"
+
+
+def _has_commit(repo: Repo, ref: str) -> bool:
+    """
+    Check whether commit *ref* was fetched before.
+
+    Fetched commits are recorded under ``refs/pinned/``. Only refs are inspected: looking
+    up a missing object in a partial clone would make git fetch it from the remote.
+    """
+    try:
+        repo.git.show_ref("--verify", "--quiet", _pinned_ref(ref))
+        return True
+    except git.exc.GitCommandError:
+        return False
+
+
+def _fetch_commit(repo: Repo, url: str, ref: str) -> None:
+    """
+    Fetch exactly one commit without blobs; blobs are fetched lazily on checkout.
+
+    Falls back to fetching all branches without blobs for servers that do not allow
+    fetching a commit by its SHA.
+    """
+    try:
+        repo.git.fetch("--depth", "1", "--filter=blob:none", "origin", f"+{ref}:{_pinned_ref(ref)}")
+    except git.exc.GitCommandError:
+        _LOG.info(f"Fetching {ref[:8]} by SHA is not supported by {url}, fetching all branches")
+        repo.git.fetch("--filter=blob:none", "origin")
+        repo.git.update_ref(_pinned_ref(ref), ref)
+
+
+def object_store_path(store_dir: Path, url: str) -> Path:
+    """
+    Return the bare repository inside *store_dir* that holds the objects of *url*.
+
+    Args:
+        store_dir: Directory of the persistent object store
+        url: Repository URL (without credentials)
+
+    Returns:
+        Path of the bare reference repository for *url*
+    """
+    name = urlparse(url).path.strip("/").removesuffix(".git")
+    return store_dir / (re.sub(r"[^A-Za-z0-9._-]+", "__", name) + ".git")
+
+
+def _fetch_into_object_store(store: Path, url: str, auth_url: str, ref: str) -> None:
+    """
+    Make sure the bare reference repository *store* contains commit *ref*.
+
+    Every fetched commit is kept under ``refs/pinned/`` so later fetches negotiate
+    against it and only transfer objects that changed since.
+    """
+    if not store.exists():
+        Repo.init(str(store), bare=True)
+    repo = Repo(str(store))
+    if _has_commit(repo, ref):
+        _LOG.info(f"Commit {ref[:8]} of {url} found in object store")
+        return
+    _LOG.info(f"Fetching commit {ref[:8]} of {url} into object store {store}")
+    repo.git.fetch("--depth", "1", auth_url, f"+{ref}:{_pinned_ref(ref)}")
+
+
+def mirror_commit(store_dir: Path, url: str, ref: str, token: Optional[str] = None) -> Path:
+    """
+    Make commit *ref* of *url* available in the persistent object store in *store_dir*.
+
+    Args:
+        store_dir: Directory of the persistent object store
+        url: Repository URL
+        ref: Commit hash
+        token: Optional GitHub token (uses GITHUB_TOKEN env if not provided)
+
+    Returns:
+        Path of the bare reference repository that contains *ref*
+
+    Raises:
+        git.exc.GitCommandError: If the fetch fails
+    """
+    store = object_store_path(store_dir, url)
+    store.parent.mkdir(parents=True, exist_ok=True)
+    # Several modules may live in the same repository; fetch into each mirror one at a time.
+    with _object_store_locks_guard:
+        lock = _object_store_locks.setdefault(store, threading.Lock())
+    with lock:
+        _fetch_into_object_store(store, url, get_authenticated_url(url, token), ref)
+    return store
+
+
+def _link_object_store(repo: Repo, store: Path) -> None:
+    """Borrow objects of the reference repository *store* via git alternates."""
+    git_dir = Path(repo.git_dir)
+    alternates = git_dir / "objects" / "info" / "alternates"
+    alternates.parent.mkdir(parents=True, exist_ok=True)
+    alternates.write_text(f"{(store / 'objects').resolve()}\n")
+    # The store is shallow; without its boundary commits history walks would fail.
+    if (store / "shallow").exists():
+        shutil.copyfile(store / "shallow", git_dir / "shallow")
+
+
+def shallow_clone_repository(
+    url: str,
+    path: Path,
+    ref: Optional[str] = None,
+    token: Optional[str] = None,
+    sparse_paths: Optional[list[str]] = None,
+    object_store: Optional[Path] = None,
+) -> None:
     """
     Perform a shallow clone of a repository using GitPython library.
 
-    Uses GitPython with GitHub token authentication to avoid rate limits.
+    Uses GitPython with GitHub token authentication to avoid rate limits. Commit
+    hashes are fetched on their own as a blobless partial clone, so neither other
+    branches nor files outside *sparse_paths* are downloaded.
+
+    For commit hashes an existing checkout at *path* is updated in place, fetching
+    only what it does not have yet. With *object_store*, objects are fetched into a
+    persistent bare reference repository per upstream URL instead, and the checkout
+    borrows them through git alternates, so commits fetched by earlier runs cost no
+    network transfer at all.
 
     Args:
         url: Repository URL
         path: Local path to clone into
         ref: Optional git reference (branch, tag, or commit hash)
         token: Optional GitHub token (uses GITHUB_TOKEN env if not provided)
+        sparse_paths: Optional directories to limit a commit checkout to (cone mode);
+            files in the repository root are always checked out
+        object_store: Optional directory of persistent reference repositories used
+            for commit checkouts
 
     Raises:
         git.exc.GitCommandError: If git clone/fetch/checkout fails
@@ -82,16 +224,26 @@ def shallow_clone_repository(url: str, path: Path, ref: Optional[str] = None, to
     auth_url = get_authenticated_url(url, token)
 
     if ref and is_commit_hash(ref):
-        # For commit hashes, clone with depth 1 then fetch specific commit
-        _LOG.info(f"Cloning {url} with shallow depth (commit hash: {ref[:8]}...)")
+        # For commit hashes, fetch only that commit into a new or the existing repository
+        if (path / ".git").exists():
+            _LOG.info(f"Updating existing checkout of {url} to commit {ref[:8]}...")
+            repo = Repo(str(path))
+            repo.remotes.origin.set_url(auth_url)
+        else:
+            _LOG.info(f"Fetching {url} at commit {ref[:8]}...")
+            repo = Repo.init(str(path))
+            repo.create_remote("origin", auth_url)
 
-        # Clone with depth 1 and all branches
-        repo = Repo.clone_from(auth_url, str(path), depth=1, no_single_branch=True)
+        if sparse_paths:
+            _LOG.info(f"Limiting checkout to {', '.join(sparse_paths)}")
+            repo.git.sparse_checkout("set", "--cone", *sparse_paths)
+        elif repo.config_reader().get_value("core", "sparseCheckout", default=False):
+            repo.git.sparse_checkout("disable")
 
-        # Fetch the specific commit
-        _LOG.info(f"Fetching specific commit {ref[:8]}...")
-        origin = repo.remotes.origin
-        origin.fetch(ref, depth=1)
+        if object_store is not None:
+            _link_object_store(repo, mirror_commit(object_store, url, ref, token))
+        elif not _has_commit(repo, ref):
+            _fetch_commit(repo, url, ref)
 
         # Checkout the commit
         repo.git.checkout(ref)
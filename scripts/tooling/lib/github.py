@@ -18,13 +18,13 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-from github import Github, GithubException
-
 _LOG = logging.getLogger(__name__)
 
 
 def _get_repo(owner_repo: str, token: Optional[str]):
     """Return the PyGithub ``Repository`` for *owner_repo*, authenticated if *token* is set."""
+    from github import Github
+
     gh = Github(token) if token else Github()
     return gh.get_repo(owner_repo)
 
@@ -59,6 +59,8 @@ def fetch_compare(
         token: Optional GitHub PAT or ``GITHUB_TOKEN``.
                Without a token requests are unauthenticated (60 req/h rate limit).
     """
+    from github import GithubException
+
     try:
         repo = _get_repo(owner_repo, token)
         comparison = repo.compare(base_hash, branch)
@@ -95,6 +97,8 @@ def resolve_ref_sha(
     Returns:
         The resolved commit SHA, or ``None`` if no candidate ref could be resolved.
     """
+    from github import GithubException
+
     candidates = [ref]
     if not ref.startswith("v"):
         candidates.append(f"v{ref}")
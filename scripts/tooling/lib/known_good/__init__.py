@@ -12,7 +12,7 @@
 # *******************************************************************************
 """known_good parsing utilities."""
 
-from .known_good import KnownGood, load_known_good
+from .known_good import KnownGood, load_known_good, normalize_repo_url
 from .module import Metadata, Module
 
-__all__ = ["KnownGood", "load_known_good", "Module", "Metadata"]
+__all__ = ["KnownGood", "load_known_good", "normalize_repo_url", "Module", "Metadata"]
@@ -14,23 +14,40 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from .module import Module
 
 
+def normalize_repo_url(url: str) -> str:
+    """Return *url* in a canonical form for comparisons (no trailing slash or ``.git``, lower case)."""
+    return url.strip().rstrip("/").removesuffix(".git").lower()
+
+
 @dataclass
 class KnownGood:
     """Parsed contents of known_good.json.
 
     modules: {"group_name": {"module_name": Module, ...}, ...}
+
+    Lookups by module name and repository URL, and the group of a module, are
+    answered from indexes built on construction. Call :meth:`reindex` after
+    adding or removing modules or changing their ``repo``.
     """
 
     modules: Dict[str, Dict[str, Module]]
     timestamp: str
+    _all: List[Module] = field(init=False, repr=False, compare=False)
+    _by_name: Dict[str, Module] = field(init=False, repr=False, compare=False)
+    _group_of: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _by_repo: Dict[str, List[Module]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> KnownGood:
@@ -40,6 +57,66 @@ class KnownGood:
                 parsed[group_name] = {m.name: m for m in Module.parse_modules(group_modules)}
         return cls(modules=parsed, timestamp=data.get("timestamp", ""))
 
+    def reindex(self) -> None:
+        """Rebuild the lookup indexes from :attr:`modules`."""
+        self._all = []
+        self._by_name = {}
+        self._group_of = {}
+        self._by_repo = {}
+        for group_name, group_modules in self.modules.items():
+            for name, module in group_modules.items():
+                self._all.append(module)
+                self._by_name.setdefault(name, module)
+                self._group_of.setdefault(name, group_name)
+                if module.repo:
+                    self._by_repo.setdefault(normalize_repo_url(module.repo), []).append(module)
+
+    @property
+    def all_modules(self) -> List[Module]:
+        """All modules of all groups, in file order."""
+        return self._all
+
+    @property
+    def by_name(self) -> Dict[str, Module]:
+        """Modules by name; the first group wins if a name appears in several groups."""
+        return self._by_name
+
+    def get(self, name: str) -> Optional[Module]:
+        """Return the module called *name*, or None."""
+        return self._by_name.get(name)
+
+    def group_of(self, name: str) -> Optional[str]:
+        """Return the group of the module called *name*, or None."""
+        return self._group_of.get(name)
+
+    def modules_for_repo(self, url: str) -> List[Module]:
+        """Return the modules hosted in repository *url* (compared without ``.git`` and case)."""
+        return self._by_repo.get(normalize_repo_url(url), [])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the known_good.json structure."""
+        modules_output = {
+            group_name: {name: module.to_dict() for name, module in group_modules.items()}
+            for group_name, group_modules in self.modules.items()
+        }
+        return {"modules": modules_output, "timestamp": self.timestamp}
+
+    def write(self, output_path: Path, *, dry_run: bool = False) -> None:
+        """Write known_good.json to *output_path* with a fresh timestamp, or print it for a dry run."""
+        self.timestamp = dt.datetime.now(dt.UTC).replace(microsecond=0).isoformat() + "Z"
+
+        output_json = json.dumps(self.to_dict(), indent=4, sort_keys=False) + "\n"
+
+        if dry_run:
+            print(f"\nDry run: would write to {output_path}\n")
+            print("---- BEGIN UPDATED JSON ----")
+            print(output_json, end="")
+            print("---- END UPDATED JSON ----")
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(output_json)
+            print(f"Successfully wrote updated known_good.json to {output_path}")
+
 
 def load_known_good(path: Path) -> KnownGood:
     """Parse known_good.json at *path* and return a typed :class:`KnownGood`.
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Dict, List
 from urllib.parse import urlparse
 
@@ -28,6 +29,7 @@ class Metadata:
     extra_test_config: list[str] = field(default_factory=list)
     exclude_test_targets: list[str] = field(default_factory=list)
     langs: list[str] = field(default_factory=lambda: ["cpp", "rust"])
+    rust_coverage_config: str | None = "ferrocene-coverage"
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Metadata:
@@ -36,6 +38,7 @@ class Metadata:
             extra_test_config=data.get("extra_test_config", []),
             exclude_test_targets=data.get("exclude_test_targets", []),
             langs=data.get("langs", ["cpp", "rust"]),
+            rust_coverage_config=data.get("rust_coverage_config", "ferrocene-coverage"),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -44,6 +47,7 @@ class Metadata:
             "extra_test_config": self.extra_test_config,
             "exclude_test_targets": self.exclude_test_targets,
             "langs": self.langs,
+            "rust_coverage_config": self.rust_coverage_config,
         }
 
 
@@ -111,6 +115,17 @@ class Module:
             raise ValueError(f"Cannot parse owner/repo from: {self.repo}")
         return f"{parts[0]}/{parts[1]}"
 
+    def patch_paths(self, workspace_root: Path) -> list[Path]:
+        """Return the files of ``bazel_patches``, resolving ``//pkg:file`` labels against *workspace_root*."""
+        paths = []
+        for patch in self.bazel_patches or []:
+            if patch.startswith("//"):
+                package, _, name = patch[2:].partition(":")
+                paths.append(workspace_root / package / name)
+            else:
+                paths.append(workspace_root / patch)
+        return paths
+
     def to_dict(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {"repo": self.repo}
         if self.version:
@@ -0,0 +1,347 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Content-addressed history of known_good.json revisions.
+
+The store is a directory with two append-only files:
+
+``objects.jsonl``
+    One line ``{"id": <hash>, "module": {...}}`` per distinct module entry. The
+    id is a hash of the canonical JSON of the entry (including its group), so an
+    entry that stays the same over many revisions is stored once.
+``revisions.jsonl``
+    One line ``{"rev": <commit>, "ts": <epoch>, "set": {"<module>": <id>}, "del": [...]}``
+    per ingested revision, holding only the modules that changed.
+
+The store follows one branch: revisions are ingested from the first-parent
+history of a repository, so the revisions form a single line.
+
+On load the revisions are turned into a per-module list of changes, so the state
+of a module at any revision is a bisection over its own changes and diff, blame
+and range queries do not depend on the total number of revisions.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .cache import default_cache_dir
+
+ModuleEntry = dict[str, Any]
+
+
+def default_store_path() -> Path:
+    """Return the default on-disk location of the known_good history store."""
+    return default_cache_dir() / "known_good_history"
+
+
+def module_id(entry: ModuleEntry) -> str:
+    """Return the content hash of a module *entry*."""
+    canonical = json.dumps(entry, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:20]
+
+
+def flatten_modules(data: dict[str, Any]) -> dict[str, ModuleEntry]:
+    """Return ``{name: entry}`` for all modules of a parsed known_good.json.
+
+    Each entry is the module's JSON object with its group added as ``"group"``.
+    Old revisions without groups (modules directly below ``"modules"``) get the
+    group ``""``.
+    """
+    result: dict[str, ModuleEntry] = {}
+    for key, value in (data.get("modules") or {}).items():
+        if not isinstance(value, dict):
+            continue
+        if {"repo", "hash", "version"} & value.keys():
+            result[key] = {"group": "", **value}
+            continue
+        for name, module in value.items():
+            if isinstance(module, dict):
+                result.setdefault(name, {"group": key, **module})
+    return result
+
+
+@dataclass(frozen=True)
+class ModuleChange:
+    """A module entry changing between two revisions (``old``/``new`` are None when absent)."""
+
+    name: str
+    rev: str
+    ts: int
+    old: Optional[ModuleEntry]
+    new: Optional[ModuleEntry]
+
+
+class KnownGoodHistory:
+    """History of known_good.json revisions stored in the directory *path*.
+
+    Revisions must be ingested oldest first. Ingested data is kept in memory
+    until :meth:`save` appends it to the store.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._objects: dict[str, ModuleEntry] = {}
+        self._revs: list[tuple[str, int]] = []
+        self._rev_index: dict[str, int] = {}
+        # module name -> ([revision index, ...], [object id or None, ...]), in revision order
+        self._changes: dict[str, tuple[list[int], list[Optional[str]]]] = {}
+        self._head: dict[str, str] = {}
+        self._pending_objects: list[str] = []
+        self._pending_revisions: list[str] = []
+        self._load()
+
+    # -- storage ---------------------------------------------------------------
+
+    def _load(self) -> None:
+        for data in _read_jsonl(self.path / "objects.jsonl"):
+            self._objects[data["id"]] = data["module"]
+        for data in _read_jsonl(self.path / "revisions.jsonl"):
+            self._apply(data["rev"], data["ts"], data.get("set", {}), data.get("del", []))
+
+    def _apply(self, rev: str, ts: int, changed: dict[str, str], deleted: list[str]) -> None:
+        index = len(self._revs)
+        self._revs.append((rev, ts))
+        self._rev_index[rev] = index
+        for name, object_id in changed.items():
+            self._record(name, index, object_id)
+            self._head[name] = object_id
+        for name in deleted:
+            self._record(name, index, None)
+            self._head.pop(name, None)
+
+    def _record(self, name: str, index: int, object_id: Optional[str]) -> None:
+        indices, ids = self._changes.setdefault(name, ([], []))
+        indices.append(index)
+        ids.append(object_id)
+
+    def save(self) -> None:
+        """Append the revisions ingested since the last save to the store."""
+        if not self._pending_revisions:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Objects first, so a revision never refers to an object that was not written.
+        for name, lines in (("objects.jsonl", self._pending_objects), ("revisions.jsonl", self._pending_revisions)):
+            if lines:
+                with open(self.path / name, "a", encoding="utf-8") as f:
+                    f.write("".join(line + "\n" for line in lines))
+        self._pending_objects = []
+        self._pending_revisions = []
+
+    # -- ingestion -------------------------------------------------------------
+
+    def __contains__(self, rev: str) -> bool:
+        return rev in self._rev_index
+
+    def __len__(self) -> int:
+        return len(self._revs)
+
+    def ingest(self, rev: str, ts: int, data: dict[str, Any]) -> bool:
+        """Add revision *rev* with the parsed known_good.json *data*.
+
+        Returns ``False`` if *rev* was already ingested.
+        """
+        if rev in self._rev_index:
+            return False
+        modules = flatten_modules(data)
+        changed: dict[str, str] = {}
+        for name, entry in modules.items():
+            object_id = module_id(entry)
+            if object_id not in self._objects:
+                self._objects[object_id] = entry
+                self._pending_objects.append(
+                    json.dumps({"id": object_id, "module": entry}, sort_keys=True, separators=(",", ":"))
+                )
+            if self._head.get(name) != object_id:
+                changed[name] = object_id
+        deleted = sorted(name for name in self._head if name not in modules)
+        self._apply(rev, ts, changed, deleted)
+        self._pending_revisions.append(
+            json.dumps({"rev": rev, "ts": ts, "set": changed, "del": deleted}, sort_keys=True, separators=(",", ":"))
+        )
+        return True
+
+    def ingest_git(self, repo: Path, path: str = "known_good.json") -> int:
+        """Ingest the commits of *repo* that changed *path* and are not in the store yet.
+
+        Only the first-parent history of HEAD is followed: a merge is ingested with
+        the contents it gives *path*, and the commits of merged branches are skipped,
+        so their possibly older states do not appear between the branch's revisions.
+        The file contents are read with one ``git cat-file --batch`` call, so
+        ingesting thousands of revisions takes a few seconds.
+
+        Returns:
+            Number of newly ingested revisions
+        """
+        log = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(repo),
+                "log",
+                "--reverse",
+                "--first-parent",
+                "--diff-merges=first-parent",
+                "--raw",
+                "--no-abbrev",
+                "--format=%x00%H %ct",
+                "--",
+                path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        commits: list[tuple[str, int, str]] = []
+        for record in log.split("\0")[1:]:
+            header, _, raw = record.partition("\n")
+            rev, ts = header.split()
+            blob = next((line.split()[3] for line in raw.splitlines() if line.startswith(":")), None)
+            if rev not in self._rev_index and blob and set(blob) != {"0"}:
+                commits.append((rev, int(ts), blob))
+
+        contents = _read_blobs(repo, sorted({blob for _, _, blob in commits}))
+        ingested = 0
+        for rev, ts, blob in commits:
+            try:
+                data = json.loads(contents[blob])
+            except ValueError:
+                continue  # a revision with broken JSON never built; skip it
+            if isinstance(data, dict):
+                ingested += self.ingest(rev, ts, data)
+        return ingested
+
+    # -- queries ---------------------------------------------------------------
+
+    @property
+    def revisions(self) -> list[tuple[str, int]]:
+        """All ingested ``(revision, timestamp)`` pairs, oldest first."""
+        return list(self._revs)
+
+    def resolve(self, rev: str) -> int:
+        """Return the index of revision *rev*, which may be an unambiguous prefix.
+
+        Raises:
+            KeyError: If *rev* is unknown or ambiguous.
+        """
+        if rev in self._rev_index:
+            return self._rev_index[rev]
+        matches = [index for full, index in self._rev_index.items() if full.startswith(rev)] if len(rev) >= 4 else []
+        if len(matches) != 1:
+            raise KeyError(f"{'Ambiguous' if matches else 'Unknown'} revision: {rev}")
+        return matches[0]
+
+    def _id_at(self, name: str, index: int) -> Optional[str]:
+        indices, ids = self._changes.get(name, ([], []))
+        pos = bisect.bisect_right(indices, index)
+        return ids[pos - 1] if pos else None
+
+    def _entry(self, object_id: Optional[str]) -> Optional[ModuleEntry]:
+        return None if object_id is None else self._objects[object_id]
+
+    def modules_at(self, rev: str) -> dict[str, ModuleEntry]:
+        """Return ``{name: entry}`` of all modules at revision *rev*."""
+        index = self.resolve(rev)
+        result = {}
+        for name in self._changes:
+            object_id = self._id_at(name, index)
+            if object_id is not None:
+                result[name] = self._objects[object_id]
+        return result
+
+    def diff(self, old_rev: str, new_rev: str) -> list[ModuleChange]:
+        """Return the modules that differ between *old_rev* and *new_rev*, by name."""
+        old_index, new_index = self.resolve(old_rev), self.resolve(new_rev)
+        rev, ts = self._revs[new_index]
+        changes = []
+        for name in sorted(self._changes):
+            old_id, new_id = self._id_at(name, old_index), self._id_at(name, new_index)
+            if old_id != new_id:
+                changes.append(ModuleChange(name, rev, ts, self._entry(old_id), self._entry(new_id)))
+        return changes
+
+    def _module_changes(self, name: str, start: int, stop: int) -> Iterator[ModuleChange]:
+        """Yield the changes of *name* at revision indexes in ``[start, stop)``."""
+        indices, ids = self._changes.get(name, ([], []))
+        lo = bisect.bisect_left(indices, start)
+        hi = bisect.bisect_left(indices, stop)
+        for pos in range(lo, hi):
+            rev, ts = self._revs[indices[pos]]
+            old = self._entry(ids[pos - 1]) if pos else None
+            yield ModuleChange(name, rev, ts, old, self._entry(ids[pos]))
+
+    def log(self, name: str, since: Optional[str] = None, until: Optional[str] = None) -> list[ModuleChange]:
+        """Return the changes of module *name* after *since* up to and including *until*, oldest first."""
+        start = self.resolve(since) + 1 if since else 0
+        stop = self.resolve(until) + 1 if until else len(self._revs)
+        return list(self._module_changes(name, start, stop))
+
+    def blame(self, name: str, rev: Optional[str] = None) -> Optional[ModuleChange]:
+        """Return the change that gave module *name* its entry at *rev* (default: the latest revision)."""
+        stop = self.resolve(rev) + 1 if rev else len(self._revs)
+        indices, _ = self._changes.get(name, ([], []))
+        pos = bisect.bisect_left(indices, stop)
+        if not pos:
+            return None
+        index = indices[pos - 1]
+        return next(self._module_changes(name, index, index + 1))
+
+    def introduced(self, patch: str) -> list[ModuleChange]:
+        """Return the changes that added *patch* to the ``bazel_patches`` of a module, oldest first."""
+        with_patch = {object_id for object_id, entry in self._objects.items() if patch in _patches(entry)}
+        changes = []
+        for name, (indices, ids) in self._changes.items():
+            for pos, object_id in enumerate(ids):
+                if object_id in with_patch and (pos == 0 or ids[pos - 1] not in with_patch):
+                    changes.extend(self._module_changes(name, indices[pos], indices[pos] + 1))
+        return sorted(changes, key=lambda change: self._rev_index[change.rev])
+
+
+def _patches(entry: Optional[ModuleEntry]) -> list[str]:
+    return (entry or {}).get("bazel_patches") or []
+
+
+def _read_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue  # truncated last line of an interrupted save
+
+
+def _read_blobs(repo: Path, blobs: list[str]) -> dict[str, bytes]:
+    """Read the contents of *blobs* from *repo* with a single ``git cat-file --batch``."""
+    if not blobs:
+        return {}
+    out = subprocess.run(
+        ["git", "-C", str(repo), "cat-file", "--batch"],
+        input="".join(blob + "\n" for blob in blobs).encode(),
+        capture_output=True,
+        check=True,
+    ).stdout
+    contents: dict[str, bytes] = {}
+    pos = 0
+    for blob in blobs:
+        header_end = out.index(b"\n", pos)
+        size = int(out[pos:header_end].split()[2])
+        contents[blob] = out[header_end + 1 : header_end + 1 + size]
+        pos = header_end + 1 + size + 1
+    return contents
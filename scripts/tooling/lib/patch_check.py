@@ -0,0 +1,135 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Check that the ``bazel_patches`` of a module still apply to its pinned commit.
+
+Patches are applied in order, like Bazel does with ``patch_strip = 1``, to the
+index of a temporary worktree of a local mirror. No files are written to disk,
+so a check takes well under a second even for large repositories.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import git
+from git import Repo
+
+from .cache import default_cache_dir
+
+_LOG = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_path() -> Path:
+    """Return the default on-disk location of the patch check cache."""
+    return default_cache_dir() / "patch_check.json"
+
+
+def patches_digest(patches: list[Path]) -> str:
+    """Return a digest of the contents of *patches* in application order."""
+    digest = hashlib.sha256()
+    for patch in patches:
+        digest.update(hashlib.sha256(patch.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def apply_patches(mirror: Path, ref: str, patches: list[Path]) -> Optional[str]:
+    """
+    Apply *patches* in order to commit *ref* of the repository *mirror*.
+
+    Args:
+        mirror: Repository containing *ref*, e.g. a bare object store mirror
+        ref: Commit hash to apply the patches to
+        patches: Patch files with paths prefixed by one directory level
+
+    Returns:
+        None if all patches apply, otherwise a description of the first failing patch
+    """
+    repo = Repo(str(mirror))
+    with tempfile.TemporaryDirectory(prefix="patch-check-") as tmp:
+        # A unique name keeps concurrent checks of the same mirror apart.
+        worktree = Path(tmp) / Path(tmp).name
+        repo.git.worktree("add", "--detach", "--no-checkout", str(worktree), ref)
+        try:
+            checkout = Repo(str(worktree))
+            checkout.git.read_tree(ref)
+            for patch in patches:
+                try:
+                    checkout.git.apply("--cached", "-p1", str(patch.resolve()))
+                except git.exc.GitCommandError as e:
+                    return f"{patch.name} does not apply: {e.stderr.strip()}"
+        finally:
+            repo.git.worktree("remove", "--force", str(worktree))
+    return None
+
+
+class PatchCheckCache:
+    """Thread-safe cache of patch check results keyed by (commit, patches digest).
+
+    Both inputs are immutable, so results never expire. When *path* is ``None``
+    the cache lives in memory only.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._results: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        if self.path:
+            self._load()
+
+    @staticmethod
+    def _key(ref: str, digest: str) -> str:
+        return f"{ref}|{digest}"
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            _LOG.warning("Ignoring unreadable patch check cache %s: %s", self.path, exc)
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            _LOG.info("Discarding patch check cache %s with unknown format", self.path)
+            return
+        self._results = data.get("results", {})
+
+    def save(self) -> None:
+        """Write the cache back to :attr:`path` (no-op for in-memory caches or when unchanged)."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            data = {"version": CACHE_FORMAT_VERSION, "results": self._results}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            tmp.replace(self.path)
+            self._dirty = False
+
+    def get(self, ref: str, digest: str) -> Optional[dict[str, Any]]:
+        """Return ``{"ok": bool, "error": str | None}`` for a checked combination, or ``None``."""
+        with self._lock:
+            return self._results.get(self._key(ref, digest))
+
+    def set(self, ref: str, digest: str, error: Optional[str]) -> None:
+        with self._lock:
+            self._results[self._key(ref, digest)] = {"ok": error is None, "error": error}
+            self._dirty = True
@@ -0,0 +1,372 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Streaming rewrite of SARIF files.
+
+SARIF files of multi-repository CodeQL scans reach hundreds of megabytes, almost
+all of it in ``runs[].results[]``. :func:`rewrite_sarif` (and :func:`filter_sarif`
+and :func:`iter_results` built on the same reader) walk the top-level object and
+each run incrementally and decode one result at a time, so memory use is
+bounded by the read buffer and the largest single value (usually ``tool``), not
+by the number of results. Output is written compactly. ``rewrite_tool`` may
+change the ``tool`` object of each run in the same pass, so recategorization and
+filtering need to read and write the file only once. :func:`merge_sarif`
+combines the SARIF files of separately analyzed modules.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Reader:
+    """Incremental JSON tokenizer over a text stream."""
+
+    def __init__(self, stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, at_least: int = 0) -> None:
+        self._buf = self._buf[self._pos :]
+        self._pos = 0
+        data = self._stream.read(max(self._chunk_size, at_least))
+        if not data:
+            self._eof = True
+        self._buf += data
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at the end)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                return ""
+            self._fill()
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of *chars*."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} but found {char or 'end of file'!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A number at the end of the buffer may continue in the next chunk.
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Grow the buffer geometrically, so a large value is decoded in O(size).
+            self._fill(len(self._buf) - self._pos)
+
+    def members(self) -> Iterator[tuple[int, str]]:
+        """Yield ``(index, key)`` of an object; the caller consumes each member value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield index, key
+            if self.expect(",}") == "}":
+                return
+            index += 1
+
+    def elements(self) -> Iterator[int]:
+        """Yield the index of each element of an array; the caller consumes each element."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            if self.expect(",]") == "]":
+                return
+            index += 1
+
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass
+class RunStats:
+    """Number of results kept and dropped in one SARIF run."""
+
+    tool: str = "unknown"
+    kept: int = 0
+    dropped: int = 0
+
+
+ResultRewriter = Callable[[RunStats, Iterator[dict[str, Any]]], Iterable[dict[str, Any]]]
+
+
+def _rewrite_run(
+    reader: _Reader,
+    out: IO[str],
+    rewrite_results: ResultRewriter,
+    rewrite_tool: Callable[[Any], Any] | None,
+) -> RunStats:
+    stats = RunStats()
+    if reader.peek() != "{":
+        out.write(_dump(reader.value()))
+        return stats
+    out.write("{")
+    for index, key in reader.members():
+        out.write(("," if index else "") + _dump(key) + ":")
+        if key == "results" and reader.peek() == "[":
+            out.write("[")
+            results = (reader.value() for _ in reader.elements())
+            for result in rewrite_results(stats, results):
+                out.write(("," if stats.kept else "") + _dump(result))
+                stats.kept += 1
+            # Consume whatever the rewriter did not read.
+            for _ in results:
+                pass
+            out.write("]")
+        else:
+            value = reader.value()
+            if key == "tool" and rewrite_tool is not None:
+                value = rewrite_tool(value)
+            if key == "tool" and isinstance(value, dict):
+                stats.tool = value.get("driver", {}).get("name", stats.tool)
+            out.write(_dump(value))
+    out.write("}")
+    return stats
+
+
+def rewrite_sarif(
+    src: Path,
+    dst: Path,
+    rewrite_results: ResultRewriter,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rewrite_tool: Callable[[Any], Any] | None = None,
+) -> list[RunStats]:
+    """Copy the SARIF file *src* to *dst*, replacing the results of each run.
+
+    *rewrite_results* is called once per run with the run's statistics and an
+    iterator over its results, and yields the results to write. ``kept`` counts
+    the written results; the rewriter may update the other statistics. The
+    ``tool`` object of a run precedes its results in SARIF written by CodeQL, so
+    ``stats.tool`` is usually known when the rewriter is called.
+
+    If given, *rewrite_tool* is called with the ``tool`` object of each run and
+    its return value is written instead. *dst* is replaced atomically, so it may
+    be the same file as *src*.
+
+    Returns:
+        Statistics for each run, in file order
+
+    Raises:
+        ValueError: If *src* is not valid JSON
+        OSError: If a file cannot be read or written
+    """
+    dst = Path(dst)
+    tmp = dst.with_name(dst.name + ".tmp")
+    stats: list[RunStats] = []
+    try:
+        with open(src, encoding="utf-8") as fin, open(tmp, "w", encoding="utf-8") as out:
+            reader = _Reader(fin, chunk_size)
+            out.write("{")
+            for index, key in reader.members():
+                out.write(("," if index else "") + _dump(key) + ":")
+                if key == "runs" and reader.peek() == "[":
+                    out.write("[")
+                    for run_index in reader.elements():
+                        out.write("," if run_index else "")
+                        stats.append(_rewrite_run(reader, out, rewrite_results, rewrite_tool))
+                    out.write("]")
+                else:
+                    out.write(_dump(reader.value()))
+            out.write("}\n")
+            if reader.peek():
+                raise ValueError("Unexpected data after the SARIF object")
+        tmp.replace(dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return stats
+
+
+def filter_sarif(
+    src: Path,
+    dst: Path,
+    keep: Callable[[dict[str, Any]], bool],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rewrite_tool: Callable[[Any], Any] | None = None,
+) -> list[RunStats]:
+    """Copy the SARIF file *src* to *dst*, keeping only the results for which *keep* is true.
+
+    If given, *rewrite_tool* is called with the ``tool`` object of each run and
+    its return value is written instead. *dst* is replaced atomically, so it may
+    be the same file as *src*.
+
+    Returns:
+        Statistics for each run, in file order
+
+    Raises:
+        ValueError: If *src* is not valid JSON
+        OSError: If a file cannot be read or written
+    """
+
+    def rewrite_results(stats: RunStats, results: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for result in results:
+            if keep(result):
+                yield result
+            else:
+                stats.dropped += 1
+
+    return rewrite_sarif(src, dst, rewrite_results, chunk_size, rewrite_tool)
+
+
+def iter_results(src: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(tool name, result)`` for every result of the SARIF file *src*, streaming.
+
+    Raises:
+        ValueError: If *src* is not valid JSON
+    """
+    with open(src, encoding="utf-8") as fin:
+        reader = _Reader(fin, chunk_size)
+        for _, key in reader.members():
+            if key != "runs" or reader.peek() != "[":
+                reader.value()
+                continue
+            for _ in reader.elements():
+                if reader.peek() != "{":
+                    reader.value()
+                    continue
+                tool = "unknown"
+                for _, run_key in reader.members():
+                    if run_key == "results" and reader.peek() == "[":
+                        for _ in reader.elements():
+                            yield tool, reader.value()
+                    else:
+                        value = reader.value()
+                        if run_key == "tool" and isinstance(value, dict):
+                            tool = value.get("driver", {}).get("name", tool)
+        if reader.peek():
+            raise ValueError("Unexpected data after the SARIF object")
+
+
+def _relocate_location(location: dict[str, Any], prefix: str, index_offset: int) -> None:
+    uri = location.get("uri")
+    if uri and prefix and ":" not in uri and not uri.startswith("/"):
+        location["uri"] = prefix + uri
+    if isinstance(location.get("index"), int):
+        location["index"] += index_offset
+
+
+def _relocate(value: Any, prefix: str, index_offset: int) -> None:
+    """Prefix relative artifact URIs with *prefix* and shift artifact indices by *index_offset*."""
+    if isinstance(value, list):
+        for item in value:
+            _relocate(item, prefix, index_offset)
+        return
+    if not isinstance(value, dict):
+        return
+    for key, item in value.items():
+        if key == "artifactLocation" and isinstance(item, dict):
+            _relocate_location(item, prefix, index_offset)
+        else:
+            _relocate(item, prefix, index_offset)
+
+
+def merge_sarif(parts: Iterable[tuple[Path, str]], dst: Path) -> list[RunStats]:
+    """Merge SARIF files of separately analyzed source roots into one file.
+
+    Each part is a SARIF file and the prefix that makes its relative artifact
+    URIs relative to the common root, e.g. ``repos/<module>/``. Runs of all parts
+    with the same ``tool`` object (same CLI, packs and rules, so rule indices
+    agree) become one run; its other members are taken from the first such run.
+    Artifacts are concatenated and artifact indices shifted accordingly.
+
+    Only one part is held in memory at a time; results are spooled to a
+    temporary file per merged run.
+
+    Returns:
+        Statistics for each merged run
+    """
+    dst = Path(dst)
+    header: dict[str, Any] = {}
+    groups: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(dir=dst.parent) as spool_dir:
+        for path, prefix in parts:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            runs = data.pop("runs", None) or []
+            header = header or data
+            for run in runs:
+                tool = run.get("tool", {})
+                tool_key = hashlib.sha256(_dump(tool).encode("utf-8")).hexdigest()
+                if tool_key not in groups:
+                    members = {k: v for k, v in run.items() if k not in ("results", "artifacts")}
+                    spool = Path(spool_dir) / f"{len(groups)}.jsonl"
+                    stats = RunStats(tool=tool.get("driver", {}).get("name", "unknown"))
+                    groups[tool_key] = {"run": members, "artifacts": [], "spool": spool, "stats": stats}
+                group = groups[tool_key]
+                offset = len(group["artifacts"])
+                artifacts = run.get("artifacts") or []
+                results = run.get("results") or []
+                for artifact in artifacts:
+                    if isinstance(artifact.get("location"), dict):
+                        _relocate_location(artifact["location"], prefix, offset)
+                _relocate(results, prefix, offset)
+                group["artifacts"].extend(artifacts)
+                with open(group["spool"], "a", encoding="utf-8") as spool:
+                    spool.writelines(_dump(result) + "\n" for result in results)
+                group["stats"].kept += len(results)
+            del data, runs
+
+        tmp = dst.with_name(dst.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as out:
+                out.write(_dump(header)[:-1] + ("," if header else "") + '"runs":[')
+                for index, group in enumerate(groups.values()):
+                    run = dict(group["run"])
+                    if group["artifacts"]:
+                        run["artifacts"] = group["artifacts"]
+                    out.write(("," if index else "") + _dump(run)[:-1] + ("," if run else "") + '"results":[')
+                    if group["spool"].exists():
+                        with open(group["spool"], encoding="utf-8") as spool:
+                            for line_index, line in enumerate(spool):
+                                out.write(("," if line_index else "") + line.rstrip("\n"))
+                    out.write("]}")
+                out.write("]}\n")
+            tmp.replace(dst)
+        finally:
+            tmp.unlink(missing_ok=True)
+    return [group["stats"] for group in groups.values()]
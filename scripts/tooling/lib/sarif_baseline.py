@@ -0,0 +1,220 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Fingerprint baseline of SARIF findings per pinned module commit.
+
+Results of the multi-repo scan are attributed to a module by their location
+(``repos/<module>/...``) and identified by a fingerprint key made of the rule
+ID, the path inside the module and the result's ``partialFingerprints``. The
+store is a directory with one file per module and pinned hash::
+
+    <store>/<module>/<hash>.tsv    one "<key>\\t<tool>\\t<result JSON>" line per finding
+    <store>/index.json             {"<module>": "<hash>"} of the latest recording
+
+Loading a baseline for lookups only splits each line at the first tab; results
+are decoded only for findings that have to be reported as fixed. A baseline of
+hundreds of thousands of findings is therefore a set lookup per result.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .cache import default_cache_dir
+from .sarif import RunStats, iter_results, rewrite_sarif
+
+# Captures the module name and the path inside the module from an artifact URI
+_MODULE_URI = re.compile(r"(?:^|/)repos/(?P<module>[^/]+)/(?P<path>.*)")
+
+
+def default_store_path() -> Path:
+    """Return the default on-disk location of the SARIF baseline store."""
+    return default_cache_dir() / "sarif_baseline"
+
+
+def _artifact_uri(result: dict[str, Any]) -> str:
+    locations = result.get("locations") or [{}]
+    return locations[0].get("physicalLocation", {}).get("artifactLocation", {}).get("uri", "")
+
+
+def result_module(result: dict[str, Any]) -> Optional[tuple[str, str]]:
+    """Return ``(module, path inside the module)`` of a result, None outside repos/."""
+    match = _MODULE_URI.search(_artifact_uri(result))
+    return (match["module"], match["path"]) if match else None
+
+
+def result_key(result: dict[str, Any], path: str) -> str:
+    """Return the fingerprint key of a result located at *path* inside its module.
+
+    Results without ``partialFingerprints`` fall back to the start line and message.
+    """
+    rule_id = result.get("ruleId") or result.get("rule", {}).get("id", "")
+    fingerprints = result.get("partialFingerprints")
+    if fingerprints:
+        identity = "\0".join(f"{name}={value}" for name, value in sorted(fingerprints.items()))
+    else:
+        region = (result.get("locations") or [{}])[0].get("physicalLocation", {}).get("region", {})
+        identity = f"{region.get('startLine', '')}:{result.get('message', {}).get('text', '')}"
+    return hashlib.blake2b(f"{rule_id}\0{path}\0{identity}".encode(), digest_size=16).hexdigest()
+
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass
+class ModuleDelta:
+    """New and fixed findings of one module."""
+
+    module: str
+    base_hash: Optional[str]
+    new: int = 0
+    fixed: int = 0
+    unchanged: int = 0
+
+
+@dataclass
+class BaselineStore:
+    """Directory of per-module, per-hash SARIF fingerprint baselines."""
+
+    path: Path = field(default_factory=default_store_path)
+
+    def _file(self, module: str, module_hash: str) -> Path:
+        return self.path / module / f"{module_hash}.tsv"
+
+    def latest(self) -> dict[str, str]:
+        """Return ``{module: hash}`` of the latest recorded baseline of each module."""
+        index = self.path / "index.json"
+        if not index.exists():
+            return {}
+        with open(index, encoding="utf-8") as f:
+            return json.load(f)
+
+    def has(self, module: str, module_hash: str) -> bool:
+        return self._file(module, module_hash).exists()
+
+    def keys(self, module: str, module_hash: str) -> set[str]:
+        """Return the fingerprint keys of a baseline (empty if it does not exist)."""
+        file = self._file(module, module_hash)
+        if not file.exists():
+            return set()
+        with open(file, encoding="utf-8") as f:
+            return {line.split("\t", 1)[0] for line in f}
+
+    def entries(self, module: str, module_hash: str) -> Iterator[tuple[str, str, str]]:
+        """Yield ``(key, tool, result JSON)`` of a baseline."""
+        file = self._file(module, module_hash)
+        if not file.exists():
+            return
+        with open(file, encoding="utf-8") as f:
+            for line in f:
+                key, tool, result = line.rstrip("\n").split("\t", 2)
+                yield key, tool, result
+
+    def record(self, sarif: Path, module_hashes: dict[str, str]) -> dict[str, int]:
+        """Store the findings of *sarif* as the baseline of each module at its pinned hash.
+
+        Every module of *module_hashes* gets a baseline, an empty one if it has
+        no findings. Results of modules not in *module_hashes* are ignored.
+
+        Returns:
+            Number of distinct findings recorded per module
+        """
+        lines: dict[str, dict[str, str]] = {module: {} for module in module_hashes}
+        for tool, result in iter_results(sarif):
+            located = result_module(result)
+            if located is None or located[0] not in lines:
+                continue
+            module, path = located
+            key = result_key(result, path)
+            lines[module].setdefault(key, f"{key}\t{tool}\t{_dump(result)}\n")
+
+        for module, entries in lines.items():
+            file = self._file(module, module_hashes[module])
+            file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = file.with_name(file.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(entries.values())
+            tmp.replace(file)
+
+        index = {**self.latest(), **module_hashes}
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.path / "index.json.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        tmp.replace(self.path / "index.json")
+        return {module: len(entries) for module, entries in lines.items()}
+
+    def diff(self, sarif: Path, dst: Path, base_hashes: dict[str, str]) -> tuple[list[ModuleDelta], list[RunStats]]:
+        """Write a SARIF file with only the findings that changed against the baselines.
+
+        *base_hashes* selects the baseline of each module. New findings keep
+        their run and get ``"baselineState": "new"``; findings of the baseline
+        that are gone are appended to the first run of the same tool with
+        ``"baselineState": "absent"``. Modules without a stored baseline are
+        skipped, since all of their findings would be reported as new.
+
+        A tool may have several runs (CodeQL writes one per language), so the
+        findings that are gone are only known once all runs have been read: the
+        keys of the current findings are collected in a first pass over *sarif*.
+
+        Returns:
+            Per-module counts and the statistics of each written run
+        """
+        deltas = {
+            module: ModuleDelta(module, module_hash)
+            for module, module_hash in base_hashes.items()
+            if self.has(module, module_hash)
+        }
+        baseline = {module: self.keys(module, delta.base_hash) for module, delta in deltas.items()}
+        seen: dict[str, set[str]] = defaultdict(set)
+        for _, result in iter_results(sarif):
+            located = result_module(result)
+            if located is not None and located[0] in deltas:
+                seen[located[0]].add(result_key(result, located[1]))
+
+        def new_results(stats: RunStats, results: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+            for result in results:
+                located = result_module(result)
+                if located is None or located[0] not in deltas:
+                    stats.dropped += 1
+                    continue
+                module, path = located
+                key = result_key(result, path)
+                if key in baseline[module]:
+                    deltas[module].unchanged += 1
+                    stats.dropped += 1
+                    continue
+                deltas[module].new += 1
+                yield {**result, "baselineState": "new"}
+
+        emitted_tools: set[str] = set()
+
+        def rewrite_results(stats: RunStats, results: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+            yield from new_results(stats, results)
+            if stats.tool in emitted_tools:
+                return
+            emitted_tools.add(stats.tool)
+            for module, delta in deltas.items():
+                for key, tool, result in self.entries(module, delta.base_hash):
+                    if tool == stats.tool and key not in seen[module]:
+                        delta.fixed += 1
+                        yield {**json.loads(result), "baselineState": "absent"}
+
+        stats = rewrite_sarif(sarif, dst, rewrite_results)
+        return sorted(deltas.values(), key=lambda d: d.module), stats
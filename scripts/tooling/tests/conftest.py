@@ -12,12 +12,20 @@
 # *******************************************************************************
 """Shared pytest fixtures and test utilities."""
 
+import importlib
 import json
+import subprocess
+import sys
+from functools import partial
 from pathlib import Path
 
 import pytest
+from git import Repo
+from github import Github
 from lib.known_good import KnownGood, Module, load_known_good
 
+from .github_stub import GitHubStub
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -77,6 +85,10 @@ FULL_JSON = {
 
 KNOWN_GOOD_JSON = Path(__file__).parents[3] / "known_good.json"
 
+KNOWN_GOOD_SCRIPTS = Path(__file__).parents[2] / "known_good"
+
+UPSTREAM_COMMITS = [{"lib.cpp": "int f();\n"}]
+
 
 # ---------------------------------------------------------------------------
 # Helper functions
@@ -104,6 +116,16 @@ def make_known_good(**overrides) -> KnownGood:
     )
 
 
+def git(cwd: Path, *args: str) -> None:
+    """Run git in *cwd* with a fixed committer identity, failing on errors."""
+    subprocess.run(
+        ["git", "-c", "user.email=ci@example.com", "-c", "user.name=ci", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Fixtures - File-based
 # ---------------------------------------------------------------------------
@@ -162,6 +184,22 @@ def multi_group_known_good() -> KnownGood:
     )
 
 
+@pytest.fixture
+def known_good_script(monkeypatch):
+    """Return a function importing a script of scripts/known_good with the sys.path its script run has."""
+    monkeypatch.syspath_prepend(str(KNOWN_GOOD_SCRIPTS))
+    imported = []
+
+    def load(name: str):
+        imported.append(name)
+        return importlib.import_module(name)
+
+    yield load
+    # Their top-level ``models`` package would shadow scripts/models in later tests.
+    for name in [n for n in sys.modules if n in imported or n == "models" or n.startswith("models.")]:
+        del sys.modules[name]
+
+
 @pytest.fixture
 def real_known_good() -> KnownGood:
     """Load the actual known_good.json from the repository root."""
@@ -214,3 +252,64 @@ def modules_maintainers():
             },
         ],
     }
+
+
+# ---------------------------------------------------------------------------
+# Fixtures - Git repositories
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def upstream(request, tmp_path: Path) -> tuple[Path, str]:
+    """Create an upstream git repository on branch ``main`` plus a ``side`` branch at its head.
+
+    The commits default to UPSTREAM_COMMITS; parametrize the fixture indirectly with another
+    list of commits, each a mapping of file paths to contents.
+
+    Returns:
+        Path of the repository and hash of its first commit.
+    """
+    src = tmp_path / "upstream"
+    src.mkdir()
+    git(src, "init", "-q", "-b", "main")
+    git(src, "config", "uploadpack.allowFilter", "true")
+    first = None
+    for i, files in enumerate(getattr(request, "param", UPSTREAM_COMMITS)):
+        for name, content in files.items():
+            (src / name).parent.mkdir(parents=True, exist_ok=True)
+            (src / name).write_text(content)
+        git(src, "add", ".")
+        git(src, "commit", "-q", "-m", f"commit {i}")
+        first = first or Repo(src).head.commit.hexsha
+    git(src, "branch", "side")
+    return src, first
+
+
+# ---------------------------------------------------------------------------
+# Fixtures - GitHub API
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def github_stub(monkeypatch):
+    """Serve a GitHubStub at the URLs used by the release tooling."""
+    with GitHubStub() as stub:
+        monkeypatch.setenv("GITHUB_API_URL", stub.url)
+        monkeypatch.setenv("GITHUB_GRAPHQL_URL", stub.graphql_url)
+        # Drop PyGithub's client-side throttling, which only exists to be gentle with the real API.
+        monkeypatch.setattr(
+            "scripts.tooling.cli.release.check_approvals.Github",
+            partial(Github, seconds_between_requests=None, seconds_between_writes=None),
+        )
+        yield stub
+
+
+@pytest.fixture
+def github_env(monkeypatch, tmp_path: Path) -> Path:
+    """Set the GitHub Actions environment of the approval checks; return the directory of its files."""
+    monkeypatch.setenv("REPO_OWNER", "test-org")
+    monkeypatch.setenv("REPO_NAME", "test-repo")
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(tmp_path / "summary.md"))
+    monkeypatch.setenv("GITHUB_OUTPUT", str(tmp_path / "output"))
+    return tmp_path
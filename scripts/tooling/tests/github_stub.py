@@ -0,0 +1,234 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""Local stand-in for the parts of the GitHub REST and GraphQL APIs used by the release tooling."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+
+class GitHubStub:
+    """In-memory repositories, pull requests, reviews and issue comments served over HTTP.
+
+    Point ``GITHUB_API_URL`` at :attr:`url` and ``GITHUB_GRAPHQL_URL`` at :attr:`graphql_url`.
+    Every handled request is recorded in :attr:`requests` as ``(method, path, query)``. Review
+    lists are paginated by ``per_page`` and ``page`` with a ``Link`` header. The GraphQL
+    endpoint only answers the pull request and review queries of ``check_approvals`` and
+    selects the query by its variables.
+    """
+
+    def __init__(self) -> None:
+        self.pulls: dict[tuple[str, int], dict[str, Any]] = {}
+        self.reviews: dict[tuple[str, int], list[dict[str, Any]]] = {}
+        self.comments: dict[tuple[str, int], list[dict[str, Any]]] = {}
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self._next_id = 1000
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self.graphql_url = f"{self.url}/graphql"
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    def __enter__(self) -> GitHubStub:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _new_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def add_pull(self, owner_repo: str, pr_number: int, base: str, title: str = "", state: str = "OPEN") -> None:
+        self.pulls[(owner_repo, pr_number)] = {
+            "number": pr_number,
+            "title": title or f"PR {pr_number}",
+            "baseRefName": base,
+            "state": state,
+        }
+
+    def add_review(self, owner_repo: str, pr_number: int, user_id: int, state: str, submitted_at: str) -> dict:
+        """Add a review and return it in webhook payload form (as found in ``GITHUB_EVENT_PATH``)."""
+        review = {
+            "id": self._new_id(),
+            "user": {"id": user_id, "login": f"user{user_id}"},
+            "state": state,
+            "submitted_at": submitted_at,
+        }
+        self.reviews.setdefault((owner_repo, pr_number), []).append(review)
+        return {**review, "state": state.lower()}
+
+    def dismiss_review(self, owner_repo: str, pr_number: int, review_id: int) -> dict:
+        """Dismiss a review and return it in webhook payload form."""
+        review = next(r for r in self.reviews[(owner_repo, pr_number)] if r["id"] == review_id)
+        review["state"] = "DISMISSED"
+        return {**review, "state": "dismissed"}
+
+    def add_comment(self, owner_repo: str, pr_number: int, body: str) -> dict:
+        comment = {"id": self._new_id(), "body": body}
+        self.comments.setdefault((owner_repo, pr_number), []).append(comment)
+        return comment
+
+    def count(self, method: str, pattern: str, **query: str) -> int:
+        """Return how many *method* requests were made to paths matching the regex *pattern*.
+
+        Keyword arguments further restrict the count to requests with these query parameters.
+        """
+        return sum(
+            1
+            for m, path, params in self.requests
+            if m == method and re.fullmatch(pattern, path) and query.items() <= params.items()
+        )
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def _comment_json(self, owner_repo: str, pr_number: int, comment: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **comment,
+            "url": f"{self.url}/repos/{owner_repo}/issues/comments/{comment['id']}",
+            "issue_url": f"{self.url}/repos/{owner_repo}/issues/{pr_number}",
+        }
+
+    def _find_comment(self, owner_repo: str, comment_id: int) -> tuple[int, dict[str, Any]] | None:
+        for (repo, pr_number), comments in self.comments.items():
+            for comment in comments:
+                if repo == owner_repo and comment["id"] == comment_id:
+                    return pr_number, comment
+        return None
+
+    @staticmethod
+    def _page(items: list[Any], first: int, cursor: str | None) -> tuple[list[Any], dict[str, Any]]:
+        start = int(cursor) if cursor else 0
+        end = start + first
+        return items[start:end], {"hasNextPage": end < len(items), "endCursor": str(end)}
+
+    def _rest_page(self, path: str, items: list[Any], query: dict[str, str]) -> tuple[list[Any], dict[str, str]]:
+        if "per_page" not in query:
+            return items, {}
+        per_page = int(query["per_page"])
+        page = int(query.get("page", 1))
+        last = max(1, -(-len(items) // per_page))
+        headers = {"Link": f'<{self.url}{path}?per_page={per_page}&page={last}>; rel="last"'} if last > 1 else {}
+        return items[(page - 1) * per_page : page * per_page], headers
+
+    def _graphql_reviews(self, owner_repo: str, pr_number: int, first: int, cursor: str | None) -> dict[str, Any]:
+        reviews, page_info = self._page(self.reviews.get((owner_repo, pr_number), []), first, cursor)
+        nodes = [
+            {
+                "databaseId": r["id"],
+                "state": r["state"],
+                "submittedAt": r["submitted_at"],
+                "author": {"databaseId": r["user"]["id"]},
+            }
+            for r in reviews
+        ]
+        return {"pageInfo": page_info, "nodes": nodes}
+
+    def _graphql(self, variables: dict[str, Any]) -> dict[str, Any]:
+        owner_repo = f"{variables['owner']}/{variables['name']}"
+        if "number" in variables:
+            reviews = self._graphql_reviews(owner_repo, variables["number"], variables["reviews"], variables["cursor"])
+            return {"data": {"repository": {"pullRequest": {"reviews": reviews}}}}
+        pulls = [pr for (repo, _), pr in sorted(self.pulls.items()) if repo == owner_repo and pr["state"] == "OPEN"]
+        pulls, page_info = self._page(pulls, variables["prs"], variables["cursor"])
+        nodes = [
+            {
+                "number": pr["number"],
+                "title": pr["title"],
+                "baseRefName": pr["baseRefName"],
+                "reviews": self._graphql_reviews(owner_repo, pr["number"], variables["reviews"], None),
+            }
+            for pr in pulls
+        ]
+        return {"data": {"repository": {"pullRequests": {"pageInfo": page_info, "nodes": nodes}}}}
+
+    def _handle(
+        self, method: str, path: str, query: dict[str, str], body: dict[str, Any]
+    ) -> tuple[int, Any] | tuple[int, Any, dict[str, str]]:
+        self.requests.append((method, path, query))
+        if path == "/graphql" and method == "POST":
+            return 200, self._graphql(body["variables"])
+        if m := re.fullmatch(r"/repos/([^/]+/[^/]+)", path):
+            owner, name = m.group(1).split("/")
+            return 200, {
+                "name": name,
+                "full_name": m.group(1),
+                "owner": {"login": owner},
+                "url": f"{self.url}/repos/{m.group(1)}",
+            }
+        if m := re.fullmatch(r"/repos/([^/]+/[^/]+)/pulls/(\d+)", path):
+            owner_repo, pr_number = m.group(1), int(m.group(2))
+            return 200, {
+                "number": pr_number,
+                "url": f"{self.url}/repos/{owner_repo}/pulls/{pr_number}",
+                "issue_url": f"{self.url}/repos/{owner_repo}/issues/{pr_number}",
+            }
+        if m := re.fullmatch(r"/repos/([^/]+/[^/]+)/pulls/(\d+)/reviews", path):
+            reviews, headers = self._rest_page(path, self.reviews.get((m.group(1), int(m.group(2))), []), query)
+            return 200, reviews, headers
+        if m := re.fullmatch(r"/repos/([^/]+/[^/]+)/pulls/(\d+)/reviews/(\d+)", path):
+            reviews = self.reviews.get((m.group(1), int(m.group(2))), [])
+            review = next((r for r in reviews if r["id"] == int(m.group(3))), None)
+            return (200, review) if review is not None else (404, {"message": "Not Found"})
+        if m := re.fullmatch(r"/repos/([^/]+/[^/]+)/issues/(\d+)/comments", path):
+            owner_repo, pr_number = m.group(1), int(m.group(2))
+            if method == "POST":
+                comment = self.add_comment(owner_repo, pr_number, body["body"])
+                return 201, self._comment_json(owner_repo, pr_number, comment)
+            comments = self.comments.get((owner_repo, pr_number), [])
+            return 200, [self._comment_json(owner_repo, pr_number, c) for c in comments]
+        if m := re.fullmatch(r"/repos/([^/]+/[^/]+)/issues/comments/(\d+)", path):
+            found = self._find_comment(m.group(1), int(m.group(2)))
+            if found is None:
+                return 404, {"message": "Not Found"}
+            pr_number, comment = found
+            if method == "PATCH":
+                comment["body"] = body["body"]
+            return 200, self._comment_json(m.group(1), pr_number, comment)
+        return 404, {"message": "Not Found"}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else {}
+                url = urlsplit(self.path)
+                query = dict(parse_qsl(url.query))
+                status, data, *headers = stub._handle(self.command, url.path, query, body)
+                payload = json.dumps(data).encode()
+                self.send_response(status)
+                for name, value in (headers[0] if headers else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PATCH = _respond
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
@@ -0,0 +1,51 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+
+from scripts.tooling.benchmarks import run_benchmarks
+
+
+def test_cases_check_results_and_append_timings(tmp_path):
+    results = tmp_path / "results.jsonl"
+    argv = ["load_known_good", "filter_sarif", "--scale=0.0001", "--repeat=1", f"--inputs={tmp_path / 'inputs'}"]
+
+    assert run_benchmarks.main([*argv, f"--results={results}"]) == 0
+    assert run_benchmarks.main([*argv, f"--results={results}"]) == 0
+
+    records = [json.loads(line) for line in results.read_text().splitlines()]
+    assert len(records) == 2
+    assert set(records[1]["cases"]) == {"load_known_good", "filter_sarif"}
+    timing = records[1]["cases"]["filter_sarif"]
+    assert timing["seconds"] == min(timing["runs"])
+    assert timing["input_bytes"] > 0
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    def record(**seconds):
+        return {"cases": {name: {"seconds": value} for name, value in seconds.items()}}
+
+    baseline = record(a=1.0, b=1.0)
+    current = record(a=1.1, b=1.5, c=2.0)
+    assert run_benchmarks.compare(current, baseline, max_regression=0.2) == ["b"]
+    assert run_benchmarks.compare(current, baseline, max_regression=None) == []
+    assert run_benchmarks.compare(current, None, max_regression=0.0) == []
+
+
+def test_baseline_is_latest_run_of_same_host_and_scale():
+    records = [
+        {"host": "ci", "scale": 1.0, "commit": "a"},
+        {"host": "ci", "scale": 0.1, "commit": "b"},
+        {"host": "laptop", "scale": 1.0, "commit": "c"},
+    ]
+    assert run_benchmarks.find_baseline(records, "ci", 1.0)["commit"] == "a"
+    assert run_benchmarks.find_baseline(records, "ci", 0.5) is None
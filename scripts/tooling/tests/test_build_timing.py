@@ -0,0 +1,61 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sphinx")
+
+DOCS = Path(__file__).parents[3] / "docs"
+DOCUMENTS = [f"doc{i}" for i in range(12)]
+
+
+def _project(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "conf.py").write_text(
+        textwrap.dedent(f"""\
+            import sys
+            sys.path.insert(0, {str(DOCS)!r})
+            extensions = ["build_timing"]
+        """)
+    )
+    toctree = "\n".join(f"   {name}" for name in DOCUMENTS)
+    (src / "index.rst").write_text(f"Index\n=====\n\n.. toctree::\n\n{toctree}\n")
+    for name in DOCUMENTS:
+        (src / f"{name}.rst").write_text(f"{name}\n{'=' * len(name)}\n\n.. note::\n\n   Text.\n")
+    return src
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_report_covers_all_documents(tmp_path, jobs):
+    src, out = _project(tmp_path), tmp_path / "out"
+    subprocess.run(
+        [sys.executable, "-m", "sphinx", "-q", "-j", jobs, "-b", "html", "-d", str(out / "doctrees"), src, out],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+        capture_output=True,
+    )
+
+    report = json.loads((out / "doctrees" / "timing.json").read_text())
+    assert report["parallel"] == int(jobs)
+    assert set(report["documents"]) == {"index", *DOCUMENTS}
+    for timings in report["documents"].values():
+        assert all(timings[phase] is not None for phase in ("read", "resolve", "write")), timings
+    assert report["directives"].keys() >= {"note", "toctree"}
+    assert not list((out / "doctrees").glob("*.jsonl"))
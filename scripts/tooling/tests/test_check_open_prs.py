@@ -0,0 +1,96 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from unittest.mock import patch
+
+import pytest
+
+from scripts.tooling.cli.release import check_approvals
+from scripts.tooling.cli.release.check_approvals import cmd_check_open_prs, fetch_release_pull_requests
+
+OWNER_REPO = "test-org/test-repo"
+
+
+def test_only_open_release_prs_are_fetched(github_stub):
+    github_stub.add_pull(OWNER_REPO, 1, "releases/1.0")
+    github_stub.add_pull(OWNER_REPO, 2, "main")
+    github_stub.add_pull(OWNER_REPO, 3, "releases/1.1", state="CLOSED")
+    github_stub.add_pull(OWNER_REPO, 4, "releases/1.1")
+
+    prs = fetch_release_pull_requests("test-org", "test-repo", "test-token")
+
+    assert [pr["number"] for pr in prs] == [1, 4]
+    assert github_stub.count("POST", "/graphql") == 1
+
+
+@patch.object(check_approvals, "GRAPHQL_REVIEWS_PAGE_SIZE", 2)
+@patch.object(check_approvals, "GRAPHQL_PAGE_SIZE", 2)
+def test_pull_requests_and_reviews_are_paged(github_stub):
+    for number in range(1, 6):
+        github_stub.add_pull(OWNER_REPO, number, "releases/1.0")
+    for hour in range(5):
+        github_stub.add_review(OWNER_REPO, 3, 100 + hour, "APPROVED", f"2026-01-01T1{hour}:00:00Z")
+
+    prs = fetch_release_pull_requests("test-org", "test-repo", "test-token")
+
+    assert [pr["number"] for pr in prs] == [1, 2, 3, 4, 5]
+    assert len(prs[2]["reviews"]) == 5
+    # 3 pages of PRs + 2 extra review pages for PR 3
+    assert github_stub.count("POST", "/graphql") == 5
+
+
+def test_latest_review_per_user_wins(github_stub, modules_maintainers):
+    github_stub.add_pull(OWNER_REPO, 1, "releases/1.0")
+    github_stub.add_review(OWNER_REPO, 1, 100, "CHANGES_REQUESTED", "2026-01-01T10:00:00Z")
+    github_stub.add_review(OWNER_REPO, 1, 100, "APPROVED", "2026-01-01T11:00:00Z")
+
+    (pr,) = fetch_release_pull_requests("test-org", "test-repo", "test-token")
+    results = check_approvals.evaluate_reviews(pr["reviews"], modules_maintainers)
+
+    assert results["moduleResults"]["module_a"]["status"] == "approved"
+
+
+def test_check_open_prs_emits_one_summary_per_pr(github_stub, github_env, modules_maintainers, capsys):
+    github_stub.add_pull(OWNER_REPO, 1, "releases/1.0", title="Approved release PR")
+    github_stub.add_pull(OWNER_REPO, 2, "releases/1.0", title="Pending release PR")
+    for user_id in (100, 102, 103):
+        github_stub.add_review(OWNER_REPO, 1, user_id, "APPROVED", "2026-01-01T10:00:00Z")
+    github_stub.add_review(OWNER_REPO, 2, 102, "CHANGES_REQUESTED", "2026-01-01T10:00:00Z")
+
+    with patch.object(check_approvals, "fetch_maintainers", return_value=modules_maintainers) as fetch:
+        exit_code = cmd_check_open_prs(github_env / "known_good.json")
+
+    assert exit_code == 1
+    fetch.assert_called_once()
+    assert github_stub.count("POST", "/graphql") == 1
+    assert not github_stub.comments
+
+    summary = (github_env / "summary.md").read_text()
+    assert "## PR #1: Approved release PR" in summary
+    assert "## PR #2: Pending release PR" in summary
+    assert "Changes requested by charlie" in summary
+    output = (github_env / "output").read_text()
+    assert "approved-prs=1\n" in output
+    assert "not-approved-prs=2\n" in output
+    assert "## PR #2: Pending release PR" in capsys.readouterr().out
+
+
+def test_check_open_prs_without_release_prs(github_stub, github_env, modules_maintainers):
+    github_stub.add_pull(OWNER_REPO, 1, "main")
+
+    with patch.object(check_approvals, "fetch_maintainers", return_value=modules_maintainers):
+        assert cmd_check_open_prs(github_env / "known_good.json") == 0
+
+
+def test_check_open_prs_requires_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv("REPO_OWNER", raising=False)
+    assert cmd_check_open_prs(tmp_path / "known_good.json") == 1
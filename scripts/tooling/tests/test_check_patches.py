@@ -0,0 +1,128 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import shutil
+from unittest.mock import patch
+
+import pytest
+from git import Repo
+
+from scripts.tooling.cli.workflow import check_patches
+from scripts.tooling.lib.known_good import Module
+from scripts.tooling.lib.patch_check import PatchCheckCache
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+GOOD_PATCH = """\
+--- a/lib.cpp
++++ b/lib.cpp
+@@ -1 +1 @@
+-int f();
++int f(int);
+"""
+
+FOLLOW_UP_PATCH = """\
+--- a/lib.cpp
++++ b/lib.cpp
+@@ -1 +1 @@
+-int f(int);
++int f(int, int);
+"""
+
+STALE_PATCH = """\
+--- a/lib.cpp
++++ b/lib.cpp
+@@ -1 +1 @@
+-int g();
++int g(int);
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "workspace"
+    (root / "patches" / "mod").mkdir(parents=True)
+    for name, content in (("001.patch", GOOD_PATCH), ("002.patch", FOLLOW_UP_PATCH), ("stale.patch", STALE_PATCH)):
+        (root / "patches" / "mod" / name).write_text(content)
+    return root
+
+
+def _module(src, sha, *patch_names):
+    return Module(name="mod", hash=sha, repo=f"file://{src}", bazel_patches=[f"//patches/mod:{n}" for n in patch_names])
+
+
+def test_patches_apply_in_order(upstream, workspace, tmp_path):
+    module = _module(*upstream, "001.patch", "002.patch")
+
+    result = check_patches.check_module(module, workspace, tmp_path / "store", PatchCheckCache())
+
+    assert result.ok, result.error
+
+
+def test_stale_patch_is_reported(upstream, workspace, tmp_path):
+    module = _module(*upstream, "001.patch", "stale.patch")
+
+    result = check_patches.check_module(module, workspace, tmp_path / "store", PatchCheckCache())
+
+    assert not result.ok
+    assert "stale.patch" in result.error
+
+
+def test_worktree_is_cleaned_up(upstream, workspace, tmp_path):
+    store = tmp_path / "store"
+    check_patches.check_module(_module(*upstream, "stale.patch"), workspace, store, PatchCheckCache())
+
+    mirror = next(store.glob("*.git"))
+    assert Repo(mirror).git.worktree("list", "--porcelain").count("worktree ") == 1
+
+
+def test_results_are_cached_by_commit_and_patch_digest(upstream, workspace, tmp_path):
+    cache_path = tmp_path / "cache.json"
+    module = _module(*upstream, "001.patch")
+    cache = PatchCheckCache(cache_path)
+    check_patches.check_all([module], workspace, tmp_path / "store", cache)
+    cache.save()
+
+    with patch.object(check_patches, "apply_patches") as apply:
+        result = check_patches.check_module(module, workspace, tmp_path / "store", PatchCheckCache(cache_path))
+    assert result.ok
+    assert result.cached
+    apply.assert_not_called()
+
+    # A changed patch is a new cache key.
+    (workspace / "patches" / "mod" / "001.patch").write_text(STALE_PATCH)
+    result = check_patches.check_module(module, workspace, tmp_path / "store", PatchCheckCache(cache_path))
+    assert not result.ok
+    assert not result.cached
+
+
+def test_main_fails_on_stale_patch(upstream, workspace, tmp_path, monkeypatch):
+    src, sha = upstream
+    url = f"file://{src}"
+    known_good = {
+        "modules": {
+            "target_sw": {
+                "good": {"repo": url, "hash": sha, "bazel_patches": ["//patches/mod:001.patch"]},
+                "bad": {"repo": url, "hash": sha, "bazel_patches": ["//patches/mod:stale.patch"]},
+                "unpatched": {"repo": url, "hash": sha},
+            }
+        },
+        "timestamp": "",
+    }
+    (workspace / "known_good.json").write_text(json.dumps(known_good))
+    monkeypatch.setenv("BUILD_WORKING_DIRECTORY", str(workspace))
+
+    exit_code = check_patches.main(["--object-store", str(tmp_path / "store"), "--cache", str(tmp_path / "c.json")])
+
+    assert exit_code == 1
+    assert json.loads((tmp_path / "c.json").read_text())["results"]
@@ -0,0 +1,107 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from scripts.tooling.cli.workflow.checkout_repos import checkout_all, checkout_repo_with_retries, main
+
+from .conftest import FULL_JSON
+
+CLONE = "scripts.tooling.cli.workflow.checkout_repos.shallow_clone_repository"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep():
+    with patch("scripts.tooling.cli.workflow.checkout_repos.time.sleep") as sleep:
+        yield sleep
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    (tmp_path / "known_good.json").write_text(json.dumps(FULL_JSON))
+    monkeypatch.setenv("BUILD_WORKING_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("GITHUB_OUTPUT", str(tmp_path / "output"))
+    return tmp_path
+
+
+def test_retries_until_success(tmp_path, no_backoff_sleep):
+    with patch(CLONE, side_effect=[RuntimeError("reset by peer"), None]) as clone:
+        result = checkout_repo_with_retries("repo", "https://example.com/repo.git", "main", tmp_path / "repo")
+    assert result.ok
+    assert result.attempts == 2
+    assert clone.call_count == 2
+    assert no_backoff_sleep.call_count == 1
+
+
+def test_backoff_is_jittered_and_exponential(tmp_path, no_backoff_sleep):
+    with patch(CLONE, side_effect=RuntimeError("boom")):
+        result = checkout_repo_with_retries("repo", "url", "main", tmp_path / "repo", attempts=3, backoff_s=2.0)
+    assert not result.ok
+    assert result.error == "boom"
+    first, second = (call.args[0] for call in no_backoff_sleep.call_args_list)
+    assert 1.0 <= first <= 3.0
+    assert 2.0 <= second <= 6.0
+
+
+def test_partial_checkout_is_removed_before_retry(tmp_path):
+    path = tmp_path / "repo"
+
+    def clone(path, **_):
+        if (path / "partial").exists():
+            raise AssertionError("partial checkout was not removed")
+        path.mkdir()
+        (path / "partial").touch()
+        raise RuntimeError("interrupted")
+
+    with patch(CLONE, side_effect=clone):
+        result = checkout_repo_with_retries("repo", "url", "main", path, attempts=2)
+    assert result.error == "interrupted"
+
+
+def test_checkouts_run_concurrently(tmp_path):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def clone(**_):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.05)
+        with lock:
+            running -= 1
+
+    repos = [(f"repo{i}", "url", "main", tmp_path / f"repo{i}", None) for i in range(6)]
+    with patch(CLONE, side_effect=clone):
+        results = checkout_all(repos, jobs=3)
+    assert [r.name for r in results] == [f"repo{i}" for i in range(6)]
+    assert all(r.ok for r in results)
+    assert peak == 3
+
+
+def test_main_reports_partial_success(workspace):
+    def clone(url, **_):
+        if "persistency" in url:
+            raise RuntimeError("not found")
+
+    with patch(CLONE, side_effect=clone):
+        assert main([]) == 1
+        assert main(["--allow-partial"]) == 0
+
+    output = (workspace / "output").read_text()
+    assert f"repo_paths={workspace / 'repos' / 'score_baselibs'}\n" in output
+    assert "failed_repos=score_persistency\n" in output
@@ -0,0 +1,99 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import argparse
+import importlib
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.tooling.cli.commands import COMMANDS, GROUPS
+from scripts.tooling.cli.main import build_parser
+
+REPO_ROOT = Path(__file__).parents[3]
+
+# Modules the CLI may add to a bare interpreter for --help (about 10: argparse and the cli package)
+MAX_ADDED_MODULES = 25
+# Import time it may add, in milliseconds (about 8 on a developer machine), as the median of
+# IMPORT_TIME_RUNS runs so a single slow run on a loaded machine does not fail the test
+IMPORT_BUDGET_MS = float(os.environ.get("TOOLING_IMPORT_BUDGET_MS", "60"))
+IMPORT_TIME_RUNS = 5
+# Dependencies only the command modules may import
+HEAVY_PACKAGES = {"github", "jinja2"}
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Run python -X importtime with *args*; return the self import time in µs per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative, module = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            times[module.strip()] = times.get(module.strip(), 0) + int(self_us)
+    return times
+
+
+def _added_import_times(baseline: dict[str, int], *args: str) -> dict[str, int]:
+    """Return the import times of the modules the CLI run with *args* imports beyond *baseline*."""
+    times = _import_times("-m", "scripts.tooling.cli.main", *args)
+    return {module: us for module, us in times.items() if module not in baseline}
+
+
+@pytest.mark.parametrize("args", [["--help"], ["misc", "--help"], ["release", "--help"]])
+def test_help_stays_within_import_budget(args):
+    baseline = _import_times("-c", "pass")
+    runs = [_added_import_times(baseline, *args) for _ in range(IMPORT_TIME_RUNS)]
+    added = runs[-1]
+
+    assert not {module.split(".")[0] for module in added} & HEAVY_PACKAGES
+    assert len(added) <= MAX_ADDED_MODULES, sorted(added)
+    slowest = sorted(added.items(), key=lambda item: -item[1])[:10]
+    median_ms = statistics.median(sum(run.values()) for run in runs) / 1000
+    assert median_ms < IMPORT_BUDGET_MS, f"slowest imports (µs): {slowest}"
+
+
+def test_manifest_lists_the_commands_of_every_group():
+    assert set(COMMANDS) == set(GROUPS)
+
+
+@pytest.mark.parametrize(("group", "command"), [(group, command) for group in COMMANDS for command in COMMANDS[group]])
+def test_manifest_matches_registered_command(group, command):
+    module, help_text = COMMANDS[group][command]
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers()
+    importlib.import_module(module).register(subparsers)
+
+    assert list(subparsers.choices) == [command]
+    assert f"{command} {help_text}" in " ".join(parser.format_help().split())
+    assert subparsers.choices[command].get_default("func") is not None
+
+
+def test_only_the_invoked_command_is_registered():
+    parser = build_parser(["misc", "known_good_history", "ingest"])
+    args = parser.parse_args(["misc", "known_good_history", "--no-ingest", "ingest"])
+    assert args.func is not None
+
+    # Other commands are placeholders for --help only
+    assert "func" not in parser.parse_args(["misc", "html_report"])
@@ -0,0 +1,171 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import sys
+import textwrap
+
+import pytest
+
+from scripts.tooling.cli.workflow import codeql_scan
+from scripts.tooling.lib.codeql_cache import module_config
+
+from .conftest import git
+
+pytest.importorskip("yaml")
+
+# Stand-in for the CodeQL CLI: logs each call and reports one finding per .cpp file.
+FAKE_CODEQL = """\
+import json, sys
+from pathlib import Path
+
+args = sys.argv[1:]
+opts = dict(a[2:].split("=", 1) for a in args if a.startswith("--") and "=" in a)
+with open(Path(__file__).with_name("calls.log"), "a") as log:
+    log.write(" ".join(args[:2]) + "\\n")
+if args[0] == "version":
+    print("2.99.0")
+elif args[:2] == ["database", "create"]:
+    db = Path(args[2])
+    db.mkdir(parents=True, exist_ok=True)
+    (db / "source_root").write_text(opts["source-root"])
+elif args[:2] == ["database", "analyze"]:
+    root = Path((Path(args[2]) / "source_root").read_text())
+    files = sorted(p.relative_to(root).as_posix() for p in root.rglob("*.cpp"))
+    sarif = {
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {"name": "CodeQL", "rules": [{"id": "cpp/rule"}]}},
+            "artifacts": [{"location": {"uri": f, "uriBaseId": "%SRCROOT%", "index": i}} for i, f in enumerate(files)],
+            "results": [
+                {"ruleId": "cpp/rule", "ruleIndex": 0, "locations": [{"physicalLocation": {
+                    "artifactLocation": {"uri": f, "uriBaseId": "%SRCROOT%", "index": i}}}]}
+                for i, f in enumerate(files)
+            ],
+        }],
+    }
+    Path(opts["output"]).write_text(json.dumps(sarif))
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    codeql = tmp_path / "codeql"
+    (tmp_path / "fake_codeql.py").write_text(FAKE_CODEQL)
+    codeql.write_text(f'#!/bin/sh\nexec {sys.executable} {tmp_path / "fake_codeql.py"} "$@"\n')
+    codeql.chmod(0o755)
+
+    root = tmp_path / "ws"
+    (root / ".github/codeql").mkdir(parents=True)
+    (root / ".github/codeql/codeql-config.yml").write_text(
+        textwrap.dedent("""\
+            name: test
+            paths:
+              - repos
+            paths-ignore:
+              - "**/test/**"
+        """)
+    )
+    for name in ("mod_a", "mod_b"):
+        (root / "repos" / name / "src").mkdir(parents=True)
+        (root / "repos" / name / "src" / f"{name}.cpp").write_text("int f();\n")
+    monkeypatch.setenv("BUILD_WORKING_DIRECTORY", str(root))
+    return root, codeql, tmp_path / "calls.log", tmp_path / "cache"
+
+
+def _pin(root, **hashes):
+    modules = {name: {"repo": f"https://github.com/eclipse-score/{name}.git", "hash": h} for name, h in hashes.items()}
+    (root / "known_good.json").write_text(json.dumps({"modules": {"target_sw": modules}}))
+
+
+def _scan(codeql, cache):
+    return codeql_scan.main(["--codeql", str(codeql), "--cache", str(cache), "--packs", "codeql/pack@1.0"])
+
+
+def _analyzed(log):
+    calls = log.read_text().splitlines()
+    log.unlink()
+    return calls.count("database analyze")
+
+
+def test_only_changed_modules_are_analyzed(workspace):
+    root, codeql, log, cache = workspace
+    _pin(root, mod_a="a" * 40, mod_b="b" * 40)
+    assert _scan(codeql, cache) == 0
+    assert _analyzed(log) == 2
+
+    assert _scan(codeql, cache) == 0
+    assert _analyzed(log) == 0
+
+    _pin(root, mod_a="a" * 40, mod_b="c" * 40)
+    assert _scan(codeql, cache) == 0
+    assert _analyzed(log) == 1
+    assert len(list((cache / "mod_b").iterdir())) == 1
+
+    data = json.loads((root / "sarif-results/cpp.sarif").read_text())
+    assert len(data["runs"]) == 1
+    run = data["runs"][0]
+    uris = ["repos/mod_a/src/mod_a.cpp", "repos/mod_b/src/mod_b.cpp"]
+    assert [a["location"]["uri"] for a in run["artifacts"]] == uris
+    locations = [r["locations"][0]["physicalLocation"]["artifactLocation"] for r in run["results"]]
+    assert [(loc["uri"], loc["index"]) for loc in locations] == [(uris[0], 0), (uris[1], 1)]
+
+
+def test_changed_module_without_checkout_fails(workspace):
+    root, codeql, log, cache = workspace
+    _pin(root, mod_a="a" * 40, mod_c="c" * 40)
+    assert _scan(codeql, cache) == 1
+    assert _analyzed(log) == 1
+
+
+def test_branch_pinned_module_is_keyed_on_checked_out_commit(workspace):
+    root, codeql, log, cache = workspace
+    checkout = root / "repos" / "mod_a"
+    git(checkout, "init", "-q", "-b", "main")
+    git(checkout, "add", ".")
+    git(checkout, "commit", "-q", "-m", "first")
+    modules = {"mod_a": {"repo": "https://github.com/eclipse-score/mod_a.git", "branch": "main"}}
+    (root / "known_good.json").write_text(json.dumps({"modules": {"target_sw": modules}}))
+
+    assert _scan(codeql, cache) == 0
+    assert _analyzed(log) == 1
+    assert _scan(codeql, cache) == 0
+    assert _analyzed(log) == 0
+
+    (checkout / "src" / "new.cpp").write_text("int g();\n")
+    git(checkout, "add", ".")
+    git(checkout, "commit", "-q", "-m", "second")
+    assert _scan(codeql, cache) == 0
+    assert _analyzed(log) == 1
+
+
+def test_branch_pinned_module_without_checkout_fails(workspace):
+    root, codeql, log, cache = workspace
+    modules = {"mod_c": {"repo": "https://github.com/eclipse-score/mod_c.git", "branch": "main"}}
+    (root / "known_good.json").write_text(json.dumps({"modules": {"target_sw": modules}}))
+
+    assert _scan(codeql, cache) == 1
+    assert _analyzed(log) == 0
+
+
+@pytest.mark.parametrize("content", ["paths: [repos\n", "- repos\n"])
+def test_invalid_config_fails(workspace, content):
+    root, codeql, _, cache = workspace
+    _pin(root, mod_a="a" * 40)
+    (root / ".github/codeql/codeql-config.yml").write_text(content)
+
+    assert _scan(codeql, cache) == 1
+
+
+def test_module_config_drops_paths_and_adds_packs():
+    config = module_config({"paths": ["repos"], "paths-ignore": ["**/test/**"], "packs": ["b"]}, ["a", "b"])
+    assert config == {"paths-ignore": ["**/test/**"], "packs": ["a", "b"]}
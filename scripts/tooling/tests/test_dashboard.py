@@ -0,0 +1,103 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import re
+from unittest.mock import patch
+
+from cli.misc.html_dashboard import generate_dashboard, parse_source
+from lib.github import CompareResult
+from lib.known_good import KnownGood, Module
+
+from .conftest import make_known_good
+
+HEAD_SHA = "f" * 40
+
+
+def _matrix(html: str) -> dict:
+    match = re.search(r"const MATRIX\s*=\s*(\{.*?\});\n", html, re.DOTALL)
+    assert match, "MATRIX not found in HTML"
+    return json.loads(match.group(1))
+
+
+# ---------------------------------------------------------------------------
+# parse_source
+# ---------------------------------------------------------------------------
+
+
+class TestParseSource:
+    def test_explicit_label(self, tmp_path):
+        label, path = parse_source(f"main={tmp_path / 'kg.json'}")
+        assert (label, path) == ("main", tmp_path / "kg.json")
+
+    def test_directory_uses_known_good_json(self, tmp_path):
+        label, path = parse_source(str(tmp_path))
+        assert path == tmp_path / "known_good.json"
+        assert label == tmp_path.name
+
+    def test_file_stem_is_default_label(self, tmp_path):
+        label, _ = parse_source(str(tmp_path / "release_1.json"))
+        assert label == "release_1"
+
+
+# ---------------------------------------------------------------------------
+# generate_dashboard
+# ---------------------------------------------------------------------------
+
+
+class TestGenerateDashboard:
+    def test_matrix_layout(self, multi_group_known_good):
+        main = multi_group_known_good
+        release = make_known_good(hash="1" * 40)
+        matrix = _matrix(generate_dashboard([("main", main), ("release", release)]))
+        assert [c["label"] for c in matrix["columns"]] == ["main", "release"]
+        rows = {row["name"]: row for row in matrix["rows"]}
+        assert rows["score_baselibs"]["cells"][1]["hash"] == "1" * 40
+        # score_crates only exists on main
+        assert rows["score_crates"]["cells"][1] is None
+
+    def test_same_name_in_two_groups_is_two_rows(self):
+        def module(repo):
+            return Module.from_dict(
+                "score_common", {"repo": f"https://github.com/eclipse-score/{repo}.git", "hash": "a" * 40}
+            )
+
+        known_good = KnownGood(
+            modules={"target_sw": {"score_common": module("common")}, "tooling": {"score_common": module("tools")}},
+            timestamp="2026-01-01T00:00:00+00:00Z",
+        )
+        matrix = _matrix(generate_dashboard([("main", known_good)]))
+        rows = [(row["group"], row["repo"]) for row in matrix["rows"]]
+        assert rows == [
+            ("target_sw", "https://github.com/eclipse-score/common.git"),
+            ("tooling", "https://github.com/eclipse-score/tools.git"),
+        ]
+
+    @patch("scripts.tooling.cli.misc.html_report.fetch_compare")
+    @patch("scripts.tooling.cli.misc.html_report.resolve_ref_sha", return_value=HEAD_SHA)
+    def test_shared_refs_resolved_once(self, mock_resolve, mock_compare):
+        mock_compare.return_value = CompareResult(ahead_by=2, status="ahead", head_sha=HEAD_SHA)
+        sources = [(f"release_{i}", make_known_good()) for i in range(5)]
+        matrix = _matrix(generate_dashboard(sources, token="token"))
+        assert mock_resolve.call_count == 1
+        assert mock_compare.call_count == 1
+        assert all(cell["behind_by"] == 2 for cell in matrix["rows"][0]["cells"])
+
+    @patch("scripts.tooling.cli.misc.html_report.fetch_compare")
+    @patch("scripts.tooling.cli.misc.html_report.resolve_ref_sha", return_value=HEAD_SHA)
+    def test_distinct_pins_compared_separately(self, mock_resolve, mock_compare):
+        mock_compare.return_value = CompareResult(ahead_by=0, status="identical", head_sha=HEAD_SHA)
+        sources = [("main", make_known_good()), ("release", make_known_good(hash="1" * 40))]
+        generate_dashboard(sources, token="token")
+        # Same branch HEAD, two different pinned commits
+        assert mock_resolve.call_count == 1
+        assert mock_compare.call_count == 2
@@ -0,0 +1,97 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from datetime import UTC, datetime
+
+from lib.drift_history import DriftHistory, build_timeline
+
+DAY = 24 * 60 * 60
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC).timestamp()
+
+
+def _entry(name: str, behind_by, group: str = "g"):
+    return {"name": name, "group": group, "behind_by": behind_by}
+
+
+# ---------------------------------------------------------------------------
+# DriftHistory – append / read
+# ---------------------------------------------------------------------------
+
+
+class TestDriftHistory:
+    def test_append_skips_entries_without_data(self, tmp_path):
+        history = DriftHistory(tmp_path / "history.jsonl")
+        assert history.append([_entry("a", None)], ts=NOW) is False
+        assert not history.path.exists()
+
+    def test_round_trip(self, tmp_path):
+        history = DriftHistory(tmp_path / "history.jsonl")
+        history.append([_entry("a", 1), _entry("b", None)], ts=NOW)
+        assert history.read_since(0) == [(NOW, {"g/a": 1})]
+
+    def test_modules_are_keyed_by_group(self, tmp_path):
+        history = DriftHistory(tmp_path / "history.jsonl")
+        history.append([_entry("a", 1, group="target_sw"), _entry("a", 5, group="tooling")], ts=NOW)
+        timeline = build_timeline(history.read_since(0), days=1, now=NOW)
+        assert timeline["modules"] == {"target_sw/a": [1], "tooling/a": [5]}
+        assert timeline["total"] == [6]
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert DriftHistory(tmp_path / "missing.jsonl").read_since(0) == []
+
+    def test_read_since_large_history(self, tmp_path):
+        history = DriftHistory(tmp_path / "history.jsonl")
+        start = NOW - 5000 * 3600
+        for i in range(5000):
+            history.append([_entry(f"module_{m}", i % 7) for m in range(20)], ts=start + i * 3600)
+        since = NOW - 48 * 3600
+        snapshots = history.read_since(since)
+        assert len(snapshots) == 48
+        assert all(ts >= since for ts, _ in snapshots)
+        assert [ts for ts, _ in snapshots] == sorted(ts for ts, _ in snapshots)
+
+    def test_corrupt_line_is_ignored(self, tmp_path):
+        history = DriftHistory(tmp_path / "history.jsonl")
+        history.append([_entry("a", 1)], ts=NOW - 10)
+        with open(history.path, "a") as f:
+            f.write("{truncated\n")
+        history.append([_entry("a", 2)], ts=NOW)
+        assert [behind["g/a"] for _, behind in history.read_since(0)] == [1, 2]
+
+
+# ---------------------------------------------------------------------------
+# build_timeline
+# ---------------------------------------------------------------------------
+
+
+class TestBuildTimeline:
+    def test_one_column_per_day(self):
+        timeline = build_timeline([], days=14, now=NOW)
+        assert len(timeline["days"]) == 14
+        assert timeline["days"][-1] == "2026-03-01"
+        assert timeline["modules"] == {}
+
+    def test_last_snapshot_of_day_wins(self):
+        snapshots = [(NOW - 3600, {"a": 5, "b": 0}), (NOW, {"a": 2, "b": 1})]
+        timeline = build_timeline(snapshots, days=7, now=NOW)
+        assert timeline["modules"]["a"][-1] == 2
+        assert timeline["total"][-1] == 3
+        assert timeline["behind_count"][-1] == 2
+
+    def test_missing_days_are_none(self):
+        timeline = build_timeline([(NOW - 2 * DAY, {"a": 4})], days=7, now=NOW)
+        assert timeline["modules"]["a"][-3:] == [4, None, None]
+        assert timeline["total"][-1] is None
+
+    def test_snapshots_outside_window_are_dropped(self):
+        timeline = build_timeline([(NOW - 30 * DAY, {"old": 1})], days=7, now=NOW)
+        assert "old" not in timeline["modules"]
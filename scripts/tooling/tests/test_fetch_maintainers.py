@@ -0,0 +1,130 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import io
+import json
+from email.message import Message
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from scripts.tooling.cli.release.check_approvals import fetch_maintainers
+
+MAINTAINER = {"name": "Alice Developer", "github": "alice", "github_user_id": 100}
+TOOLING_MODULES = ["score_docs_as_code", "score_platform", "score_itf", "score_test_scenarios"]
+
+
+def _response(data: dict, etag: str = '"v1"') -> MagicMock:
+    response = MagicMock()
+    response.read.return_value = json.dumps(data).encode()
+    headers = Message()
+    headers["ETag"] = etag
+    response.headers = headers
+    response.__enter__.return_value = response
+    return response
+
+
+def _http_error(code):
+    def raise_error(request, **_):
+        raise HTTPError(request.full_url, code, "", Message(), io.BytesIO())
+
+    return raise_error
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Local bazel registry checkout with metadata for every module requested."""
+    root = tmp_path / "bazel_registry"
+    for module_name in ["score_baselibs", *TOOLING_MODULES]:
+        module_dir = root / "modules" / module_name
+        module_dir.mkdir(parents=True)
+        (module_dir / "metadata.json").write_text(json.dumps({"maintainers": [MAINTAINER]}))
+    return root
+
+
+@patch("scripts.tooling.cli.release.check_approvals.urlopen")
+def test_local_registry_is_used_offline(mock_urlopen, minimal_json_file, registry):
+    result = fetch_maintainers(minimal_json_file, registry_dir=registry)
+    mock_urlopen.assert_not_called()
+    assert result["score_baselibs"] == [MAINTAINER]
+    assert list(result)[:5] == ["score_baselibs", *TOOLING_MODULES]
+
+
+@patch("scripts.tooling.cli.release.check_approvals.urlopen")
+def test_missing_module_in_registry(mock_urlopen, minimal_json_file, tmp_path):
+    result = fetch_maintainers(minimal_json_file, registry_dir=tmp_path)
+    mock_urlopen.assert_not_called()
+    assert result["score_baselibs"] == []
+
+
+@patch("scripts.tooling.cli.release.check_approvals.urlopen")
+def test_downloads_use_timeout(mock_urlopen, minimal_json_file):
+    mock_urlopen.return_value = _response({"maintainers": [MAINTAINER]})
+    fetch_maintainers(minimal_json_file, timeout=3.0)
+    assert mock_urlopen.call_count == 1 + len(TOOLING_MODULES)
+    assert all(call.kwargs["timeout"] == 3.0 for call in mock_urlopen.call_args_list)
+
+
+@patch("scripts.tooling.cli.release.check_approvals.urlopen")
+def test_cache_revalidated_with_etag(mock_urlopen, minimal_json_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    mock_urlopen.return_value = _response({"maintainers": [MAINTAINER]})
+    fetch_maintainers(minimal_json_file, cache_dir=cache_dir)
+    assert (cache_dir / "score_baselibs.json").exists()
+
+    mock_urlopen.reset_mock(return_value=True)
+    mock_urlopen.side_effect = _http_error(304)
+    result = fetch_maintainers(minimal_json_file, cache_dir=cache_dir)
+    request = mock_urlopen.call_args_list[0].args[0]
+    assert request.get_header("If-none-match") == '"v1"'
+    assert result["score_baselibs"] == [MAINTAINER]
+
+
+@patch("scripts.tooling.cli.release.check_approvals.urlopen")
+def test_cache_used_when_registry_unreachable(mock_urlopen, minimal_json_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    mock_urlopen.return_value = _response({"maintainers": [MAINTAINER]})
+    fetch_maintainers(minimal_json_file, cache_dir=cache_dir)
+
+    mock_urlopen.reset_mock(return_value=True)
+    mock_urlopen.side_effect = URLError("offline")
+    assert fetch_maintainers(minimal_json_file, cache_dir=cache_dir)["score_baselibs"] == [MAINTAINER]
+
+
+@pytest.mark.parametrize("code", [429, 503])
+@patch("scripts.tooling.cli.release.check_approvals.urlopen")
+def test_cache_used_on_http_error(mock_urlopen, code, minimal_json_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    mock_urlopen.return_value = _response({"maintainers": [MAINTAINER]})
+    fetch_maintainers(minimal_json_file, cache_dir=cache_dir)
+
+    mock_urlopen.reset_mock(return_value=True)
+    mock_urlopen.side_effect = _http_error(code)
+    assert fetch_maintainers(minimal_json_file, cache_dir=cache_dir)["score_baselibs"] == [MAINTAINER]
+
+
+@patch("scripts.tooling.cli.release.check_approvals.urlopen")
+def test_corrupt_cache_entry_is_ignored(mock_urlopen, minimal_json_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "score_baselibs.json").write_text(json.dumps({"etag": '"v1"'}))
+    mock_urlopen.return_value = _response({"maintainers": [MAINTAINER]})
+
+    assert fetch_maintainers(minimal_json_file, cache_dir=cache_dir)["score_baselibs"] == [MAINTAINER]
+    assert all(call.args[0].get_header("If-none-match") is None for call in mock_urlopen.call_args_list)
+
+
+@patch("scripts.tooling.cli.release.check_approvals.urlopen", side_effect=URLError("offline"))
+def test_unreachable_without_cache(mock_urlopen, minimal_json_file):
+    assert fetch_maintainers(minimal_json_file)["score_baselibs"] == []
+    mock_urlopen.assert_called()
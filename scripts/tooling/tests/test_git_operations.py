@@ -0,0 +1,128 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import shutil
+
+import pytest
+from git import Repo
+
+from scripts.tooling.lib.git_operations import object_store_path, shallow_clone_repository, sparse_paths_from_code_root
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+# Two commits on main; the first one is pinned.
+UPSTREAM = pytest.mark.parametrize(
+    "upstream",
+    [
+        [
+            {
+                "score/lib/lib.cpp": "int f();\n",
+                "docs/index.md": "docs\n",
+                "MODULE.bazel": 'module(name = "upstream")\n',
+            },
+            {"docs/index.md": "more docs\n"},
+        ]
+    ],
+    indirect=True,
+)
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("//score/...", ["score"]),
+        ("//src/lib/...", ["src/lib"]),
+        ("//...", []),
+        ("//score/mw:all", ["score/mw"]),
+    ],
+)
+def test_sparse_paths_from_code_root(pattern, expected):
+    assert sparse_paths_from_code_root(pattern) == expected
+
+
+@UPSTREAM
+def test_commit_is_fetched_alone(upstream, tmp_path):
+    src, pinned = upstream
+    dest = tmp_path / "checkout"
+
+    shallow_clone_repository(f"file://{src}", dest, ref=pinned)
+
+    repo = Repo(dest)
+    assert repo.head.commit.hexsha == pinned
+    assert (dest / "docs" / "index.md").read_text() == "docs\n"
+    # Only the pinned commit is present: no branches, no history.
+    assert repo.git.rev_list("--all").split() == [pinned]
+    assert repo.git.config("remote.origin.promisor") == "true"
+
+
+@UPSTREAM
+def test_sparse_checkout_limits_working_tree(upstream, tmp_path):
+    src, pinned = upstream
+    dest = tmp_path / "checkout"
+
+    shallow_clone_repository(f"file://{src}", dest, ref=pinned, sparse_paths=["score"])
+
+    assert (dest / "score" / "lib" / "lib.cpp").exists()
+    assert (dest / "MODULE.bazel").exists()
+    assert not (dest / "docs").exists()
+    assert Repo(dest).git.config("core.sparseCheckoutCone") == "true"
+
+
+def _head_of(src):
+    return Repo(src).head.commit.hexsha
+
+
+@UPSTREAM
+def test_existing_checkout_is_updated_in_place(upstream, tmp_path):
+    src, pinned = upstream
+    dest = tmp_path / "checkout"
+    shallow_clone_repository(f"file://{src}", dest, ref=pinned)
+    marker = dest / ".git" / "marker"
+    marker.touch()
+
+    shallow_clone_repository(f"file://{src}", dest, ref=_head_of(src))
+
+    assert marker.exists()
+    assert Repo(dest).head.commit.hexsha == _head_of(src)
+    assert (dest / "docs" / "index.md").read_text() == "more docs\n"
+
+
+@UPSTREAM
+def test_object_store_is_reused_without_network(upstream, tmp_path):
+    src, pinned = upstream
+    store = tmp_path / "store"
+    shallow_clone_repository(f"file://{src}", tmp_path / "first", ref=pinned, object_store=store)
+
+    # A second checkout of the same commit must not need the upstream at all.
+    shutil.rmtree(src)
+    shallow_clone_repository(f"file://{src}", tmp_path / "second", ref=pinned, object_store=store)
+
+    second = Repo(tmp_path / "second")
+    assert second.head.commit.hexsha == pinned
+    assert (tmp_path / "second" / "docs" / "index.md").read_text() == "docs\n"
+    alternates = tmp_path / "second" / ".git" / "objects" / "info" / "alternates"
+    assert alternates.read_text().strip() == str((object_store_path(store, f"file://{src}") / "objects").resolve())
+
+
+@UPSTREAM
+def test_object_store_fetches_new_commits_incrementally(upstream, tmp_path):
+    src, pinned = upstream
+    store = tmp_path / "store"
+    dest = tmp_path / "checkout"
+    shallow_clone_repository(f"file://{src}", dest, ref=pinned, object_store=store)
+
+    shallow_clone_repository(f"file://{src}", dest, ref=_head_of(src), object_store=store)
+
+    assert Repo(dest).head.commit.hexsha == _head_of(src)
+    pinned_refs = Repo(object_store_path(store, f"file://{src}")).git.for_each_ref("refs/pinned").splitlines()
+    assert len(pinned_refs) == 2
@@ -0,0 +1,190 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+from unittest.mock import patch
+
+import pytest
+
+from scripts.tooling.cli.release.check_approvals import cmd_check_all
+from scripts.tooling.lib.approval_state import ApprovalState, ApprovalStateStore, Review
+
+from .github_stub import GitHubStub
+
+OWNER_REPO = "test-org/test-repo"
+PR_NUMBER = 7
+REVIEWS = r"/repos/test-org/test-repo/pulls/7/reviews"
+COMMENT_LIST = r"/repos/test-org/test-repo/issues/7/comments"
+COMMENT = r"/repos/test-org/test-repo/issues/comments/\d+"
+
+
+@pytest.fixture
+def env(github_env, monkeypatch):
+    monkeypatch.setenv("PR_NUMBER", str(PR_NUMBER))
+    monkeypatch.setenv("BASE_BRANCH", "releases/1.0")
+    event_path = github_env / "event.json"
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+    return event_path
+
+
+@pytest.fixture
+def run_check(env, tmp_path, modules_maintainers):
+    store = ApprovalStateStore(tmp_path / "state")
+
+    def run(review: dict) -> int:
+        env.write_text(json.dumps({"action": "submitted", "review": review}))
+        with patch("scripts.tooling.cli.release.check_approvals.fetch_maintainers", return_value=modules_maintainers):
+            return cmd_check_all(tmp_path / "known_good.json", state_store=store)
+
+    run.store = store
+    return run
+
+
+def _comment_bodies(stub: GitHubStub) -> list[str]:
+    return [c["body"] for c in stub.comments.get((OWNER_REPO, PR_NUMBER), [])]
+
+
+def test_first_run_scans_reviews_and_creates_comment(github_stub, run_check):
+    github_stub.add_review(OWNER_REPO, PR_NUMBER, 102, "APPROVED", "2026-01-01T09:00:00Z")
+    event = github_stub.add_review(OWNER_REPO, PR_NUMBER, 100, "APPROVED", "2026-01-01T10:00:00Z")
+
+    assert run_check(event) == 1  # module_c still pending
+
+    assert github_stub.count("GET", REVIEWS) == 1
+    assert github_stub.count("POST", COMMENT_LIST) == 1
+    state = run_check.store.load(OWNER_REPO, PR_NUMBER)
+    assert state.comment_id is not None
+    assert state.module_results["module_a"]["status"] == "approved"
+    assert state.module_results["module_b"]["status"] == "approved"
+    assert state.module_results["module_c"]["status"] == "pending"
+
+
+def test_later_events_update_comment_in_place_without_scanning(github_stub, run_check):
+    # Many unrelated comments that the full check would have to page through.
+    for i in range(50):
+        github_stub.add_comment(OWNER_REPO, PR_NUMBER, f"comment {i}")
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 100, "APPROVED", "2026-01-01T10:00:00Z"))
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 102, "APPROVED", "2026-01-01T11:00:00Z"))
+    exit_code = run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 103, "APPROVED", "2026-01-01T12:00:00Z"))
+
+    assert exit_code == 0
+    # One full fetch on the first run, then only the review count (one review per page).
+    assert github_stub.count("GET", REVIEWS) == 3
+    assert github_stub.count("GET", REVIEWS, per_page="1") == 2
+    assert github_stub.count("GET", COMMENT_LIST) == 1
+    assert github_stub.count("POST", COMMENT_LIST) == 1
+    assert github_stub.count("PATCH", COMMENT) == 2
+    bodies = [body for body in _comment_bodies(github_stub) if "release-approval-check" in body]
+    assert len(bodies) == 1
+    assert "All modules have required approvals" in bodies[0]
+
+
+def test_unchanged_summary_is_not_reposted(github_stub, run_check):
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 100, "APPROVED", "2026-01-01T10:00:00Z"))
+    # A review by a user who maintains nothing does not change the summary.
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 999, "APPROVED", "2026-01-01T11:00:00Z"))
+
+    assert github_stub.count("PATCH", COMMENT) == 0
+    assert github_stub.count("POST", COMMENT_LIST) == 1
+
+
+def test_dismissal_revokes_approval(github_stub, run_check):
+    event = github_stub.add_review(OWNER_REPO, PR_NUMBER, 102, "APPROVED", "2026-01-01T10:00:00Z")
+    run_check(event)
+    run_check(github_stub.dismiss_review(OWNER_REPO, PR_NUMBER, event["id"]))
+
+    state = run_check.store.load(OWNER_REPO, PR_NUMBER)
+    assert state.module_results["module_b"]["status"] == "pending"
+
+
+def test_missed_dismissal_revokes_approval(github_stub, run_check):
+    approval = github_stub.add_review(OWNER_REPO, PR_NUMBER, 102, "APPROVED", "2026-01-01T10:00:00Z")
+    run_check(approval)
+    # The run for the dismissal was dropped; the number of reviews is unchanged.
+    github_stub.dismiss_review(OWNER_REPO, PR_NUMBER, approval["id"])
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 999, "COMMENTED", "2026-01-01T11:00:00Z"))
+
+    state = run_check.store.load(OWNER_REPO, PR_NUMBER)
+    assert state.latest_reviews[102].state == "DISMISSED"
+    assert state.module_results["module_b"]["status"] == "pending"
+
+
+def test_missed_review_triggers_full_fetch(github_stub, run_check):
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 100, "APPROVED", "2026-01-01T10:00:00Z"))
+    # The run for this review was dropped, e.g. by the workflow's concurrency group.
+    github_stub.add_review(OWNER_REPO, PR_NUMBER, 102, "APPROVED", "2026-01-01T11:00:00Z")
+    exit_code = run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 103, "APPROVED", "2026-01-01T12:00:00Z"))
+
+    assert exit_code == 0
+    assert github_stub.count("GET", REVIEWS) - github_stub.count("GET", REVIEWS, per_page="1") == 2
+    state = run_check.store.load(OWNER_REPO, PR_NUMBER)
+    assert state.review_count == 3
+    assert state.module_results["module_b"]["status"] == "approved"
+
+    # Back in sync: the next event is applied without a full fetch.
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 999, "COMMENTED", "2026-01-01T13:00:00Z"))
+    assert github_stub.count("GET", REVIEWS) - github_stub.count("GET", REVIEWS, per_page="1") == 2
+
+
+def test_deleted_comment_is_recreated(github_stub, run_check):
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 100, "APPROVED", "2026-01-01T10:00:00Z"))
+    github_stub.comments[(OWNER_REPO, PR_NUMBER)].clear()
+    run_check(github_stub.add_review(OWNER_REPO, PR_NUMBER, 102, "APPROVED", "2026-01-01T11:00:00Z"))
+
+    assert github_stub.count("POST", COMMENT_LIST) == 2
+    assert len(_comment_bodies(github_stub)) == 1
+
+
+def _review(review_id: int, user_id: int, state: str, submitted_at: str) -> Review:
+    return Review(review_id=review_id, user_id=user_id, state=state, submitted_at=submitted_at)
+
+
+class TestApprovalState:
+    def test_newer_review_replaces_latest(self):
+        state = ApprovalState(pr_number=1)
+        assert state.apply(_review(1, 100, "APPROVED", "2026-01-01T10:00:00+00:00"))
+        assert state.apply(_review(2, 100, "CHANGES_REQUESTED", "2026-01-01T11:00:00+00:00"))
+        assert state.review_states() == {100: "CHANGES_REQUESTED"}
+
+    def test_older_review_is_ignored(self):
+        state = ApprovalState(pr_number=1)
+        state.apply(_review(2, 100, "APPROVED", "2026-01-01T11:00:00+00:00"))
+        assert not state.apply(_review(1, 100, "CHANGES_REQUESTED", "2026-01-01T10:00:00+00:00"))
+        assert state.review_states() == {100: "APPROVED"}
+
+    def test_replayed_event_is_ignored(self):
+        state = ApprovalState(pr_number=1)
+        review = _review(1, 100, "APPROVED", "2026-01-01T10:00:00+00:00")
+        state.apply(review)
+        assert not state.apply(review)
+
+    def test_highest_review_id_is_tracked(self):
+        state = ApprovalState(pr_number=1)
+        state.apply(_review(5, 100, "APPROVED", "2026-01-01T11:00:00+00:00"))
+        state.apply(_review(3, 100, "COMMENTED", "2026-01-01T10:00:00+00:00"))
+        assert state.max_review_id == 5
+
+    def test_round_trip(self, tmp_path):
+        store = ApprovalStateStore(tmp_path)
+        state = ApprovalState(
+            pr_number=3, comment_id=42, module_results={"module_a": {"status": "approved"}}, review_count=1
+        )
+        state.apply(_review(1, 100, "APPROVED", "2026-01-01T10:00:00+00:00"))
+        store.save(OWNER_REPO, state)
+        assert store.load(OWNER_REPO, 3) == state
+        assert store.load(OWNER_REPO, 4) is None
+
+    def test_corrupt_state_is_ignored(self, tmp_path):
+        store = ApprovalStateStore(tmp_path)
+        store.save(OWNER_REPO, ApprovalState(pr_number=3))
+        next(tmp_path.glob("*.json")).write_text("{not json")
+        assert store.load(OWNER_REPO, 3) is None
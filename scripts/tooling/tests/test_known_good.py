@@ -182,6 +182,75 @@ class TestMetadataDefaults:
         assert meta.langs == ["rust"]
 
 
+class TestPatchPaths:
+    def test_labels_and_relative_paths(self, tmp_path: Path):
+        module = Module(
+            name="mod",
+            hash="deadbeef",
+            repo="https://github.com/a/b.git",
+            bazel_patches=["//patches/baselibs:001.patch", "patches/a.patch"],
+        )
+        assert module.patch_paths(tmp_path) == [
+            tmp_path / "patches/baselibs/001.patch",
+            tmp_path / "patches/a.patch",
+        ]
+
+    def test_no_patches(self, tmp_path: Path):
+        assert Module(name="mod", hash="deadbeef", repo="https://github.com/a/b.git").patch_paths(tmp_path) == []
+
+
+# ---------------------------------------------------------------------------
+# Indexes
+# ---------------------------------------------------------------------------
+
+
+def _indexed() -> KnownGood:
+    return KnownGood.from_dict(
+        {
+            "modules": {
+                "target_sw": {
+                    "a": {"repo": "https://github.com/org/mono.git", "hash": "1", "metadata": {"langs": ["cpp"]}},
+                    "b": {"repo": "https://github.com/org/mono.git", "hash": "2", "metadata": {"langs": ["rust"]}},
+                },
+                "tooling": {
+                    "c": {"repo": "https://gitlab.com/org/c.git", "version": "1.0.0"},
+                },
+            },
+            "timestamp": "",
+        }
+    )
+
+
+class TestIndexes:
+    def test_all_modules_in_file_order(self):
+        assert [m.name for m in _indexed().all_modules] == ["a", "b", "c"]
+
+    def test_lookup_by_name_and_group(self):
+        kg = _indexed()
+        assert kg.get("c").version == "1.0.0"
+        assert kg.get("missing") is None
+        assert kg.group_of("b") == "target_sw"
+        assert kg.group_of("c") == "tooling"
+
+    def test_lookup_by_repo_ignores_git_suffix_and_case(self):
+        kg = _indexed()
+        assert [m.name for m in kg.modules_for_repo("https://github.com/Org/Mono/")] == ["a", "b"]
+        assert kg.modules_for_repo("https://github.com/org/other") == []
+
+    def test_reindex_after_mutation(self):
+        kg = _indexed()
+        kg.modules["target_sw"]["a"].repo = "https://github.com/org/a.git"
+        kg.modules["tooling"]["d"] = Module(name="d", hash="3", repo="https://github.com/org/d.git")
+        kg.reindex()
+        assert [m.name for m in kg.modules_for_repo("https://github.com/org/mono")] == ["b"]
+        assert kg.group_of("d") == "tooling"
+
+    def test_to_dict_round_trip(self):
+        kg = _indexed()
+        assert KnownGood.from_dict(kg.to_dict()).to_dict() == kg.to_dict()
+        assert kg.to_dict()["modules"]["target_sw"]["a"]["metadata"]["rust_coverage_config"] == "ferrocene-coverage"
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
@@ -0,0 +1,162 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import shutil
+
+import pytest
+from lib.known_good_history import KnownGoodHistory, flatten_modules
+
+from .conftest import git
+
+
+def _known_good(**hashes):
+    modules = {name: {"repo": f"https://github.com/org/{name}.git", "hash": h} for name, h in hashes.items()}
+    return {"modules": {"target_sw": modules}, "timestamp": ""}
+
+
+@pytest.fixture
+def history(tmp_path):
+    h = KnownGoodHistory(tmp_path / "store")
+    h.ingest("r1", 100, _known_good(a="a1", b="b1"))
+    h.ingest("r2", 200, _known_good(a="a1", b="b2"))
+    data = _known_good(a="a2", b="b2")
+    data["modules"]["target_sw"]["b"]["bazel_patches"] = ["//patches/b:001.patch"]
+    h.ingest("r3", 300, data)
+    h.ingest("r4", 400, _known_good(a="a2"))
+    return h
+
+
+# ---------------------------------------------------------------------------
+# Ingestion and storage
+# ---------------------------------------------------------------------------
+
+
+class TestIngest:
+    def test_revision_is_ingested_once(self, history):
+        assert history.ingest("r2", 200, _known_good(a="x")) is False
+        assert len(history) == 4
+
+    def test_unchanged_entries_are_stored_once(self, history):
+        history.ingest("r5", 500, _known_good(a="a2"))
+        history.save()
+        objects = (history.path / "objects.jsonl").read_text().splitlines()
+        # a1, b1, b2, a2, b2 with patch
+        assert len(objects) == 5
+        assert json.loads((history.path / "revisions.jsonl").read_text().splitlines()[-1])["set"] == {}
+
+    def test_reload_from_disk(self, history):
+        history.save()
+        reloaded = KnownGoodHistory(history.path)
+        assert reloaded.revisions == history.revisions
+        assert reloaded.diff("r1", "r4") == history.diff("r1", "r4")
+
+    def test_flat_legacy_format(self):
+        modules = flatten_modules({"modules": {"a": {"repo": "https://github.com/org/a.git", "hash": "1"}}})
+        assert modules == {"a": {"group": "", "repo": "https://github.com/org/a.git", "hash": "1"}}
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+
+class TestQueries:
+    def test_modules_at(self, history):
+        assert {name: m["hash"] for name, m in history.modules_at("r2").items()} == {"a": "a1", "b": "b2"}
+        assert list(history.modules_at("r4")) == ["a"]
+
+    def test_diff(self, history):
+        changes = history.diff("r1", "r4")
+        assert [(c.name, c.rev, c.old["hash"]) for c in changes] == [("a", "r4", "a1"), ("b", "r4", "b1")]
+        assert changes[0].new["hash"] == "a2"
+        assert changes[1].new is None
+
+    def test_log_range(self, history):
+        assert [c.rev for c in history.log("b")] == ["r1", "r2", "r3", "r4"]
+        assert [c.rev for c in history.log("b", since="r1", until="r3")] == ["r2", "r3"]
+
+    def test_blame(self, history):
+        assert history.blame("a").rev == "r3"
+        assert history.blame("a", rev="r2").rev == "r1"
+        assert history.blame("missing") is None
+
+    def test_introduced(self, history):
+        changes = history.introduced("//patches/b:001.patch")
+        assert [(c.name, c.rev) for c in changes] == [("b", "r3")]
+
+    def test_unknown_revision(self, history):
+        with pytest.raises(KeyError, match="Unknown"):
+            history.diff("r1", "nope")
+
+    def test_many_revisions(self, tmp_path):
+        h = KnownGoodHistory(tmp_path / "store")
+        for i in range(3000):
+            # module m<k> moves every k-th revision
+            h.ingest(f"rev{i:05d}", i, _known_good(**{f"m{k}": str(i // k) for k in range(1, 21)}))
+        h.save()
+        h = KnownGoodHistory(tmp_path / "store")
+        assert h.blame("m20").rev == "rev02980"
+        assert len(h.log("m10", since="rev01000", until="rev02000")) == 100
+        assert [c.name for c in h.diff("rev00000", "rev00001")] == ["m1"]
+
+
+# ---------------------------------------------------------------------------
+# Git ingestion
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_ingest_git(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "main")
+    for content in (_known_good(a="a1"), "{broken", _known_good(a="a2")):
+        (repo / "known_good.json").write_text(content if isinstance(content, str) else json.dumps(content))
+        (repo / "other.txt").write_text(str(content))
+        git(repo, "add", ".")
+        git(repo, "commit", "-q", "-m", "update")
+    (repo / "other.txt").write_text("unrelated")
+    git(repo, "commit", "-q", "-am", "unrelated")
+
+    history = KnownGoodHistory(tmp_path / "store")
+    assert history.ingest_git(repo) == 2
+    assert history.ingest_git(repo) == 0
+    assert [c.new["hash"] for c in history.log("a")] == ["a1", "a2"]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_ingest_git_follows_first_parent(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "main")
+
+    def commit(**hashes):
+        (repo / "known_good.json").write_text(json.dumps(_known_good(**hashes)))
+        git(repo, "add", ".")
+        git(repo, "commit", "-q", "-m", "update")
+
+    commit(a="a1", b="b1")
+    git(repo, "checkout", "-q", "-b", "side")
+    commit(a="a1", b="b2")
+    commit(a="a1", b="b3")
+    git(repo, "checkout", "-q", "main")
+    commit(a="a2", b="b1")
+    # Resolve the conflicting merge by hand
+    git(repo, "merge", "-q", "-s", "ours", "--no-commit", "side")
+    commit(a="a2", b="b3")
+
+    history = KnownGoodHistory(tmp_path / "store")
+    assert history.ingest_git(repo) == 3
+    # The side branch is seen only through the merge.
+    assert [c.new["hash"] for c in history.log("b")] == ["b1", "b3"]
+    assert [c.new["hash"] for c in history.log("a")] == ["a1", "a2"]
@@ -0,0 +1,88 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sphinx")
+Figure = pytest.importorskip("matplotlib.figure").Figure
+
+DOCS = Path(__file__).parents[3] / "docs"
+
+
+@pytest.fixture
+def charts(monkeypatch, tmp_path):
+    """Import docs/needs_charts.py, install its savefig wrappers and cache in tmp_path; restore savefig after."""
+    monkeypatch.syspath_prepend(str(DOCS))
+    monkeypatch.setattr(Figure, "savefig", Figure.savefig)
+    import needpie_cache
+    import needs_charts
+
+    monkeypatch.setitem(needpie_cache._state, "installed", value=False)  # noqa: SLF001
+    monkeypatch.setattr(needs_charts, "_legend_suppression_installed", False)
+    needpie_cache.install()
+    needs_charts._install_legend_suppression()  # noqa: SLF001
+    needpie_cache.configure(tmp_path / "cache")
+    return needpie_cache
+
+
+def _pie(values, *, legend=False):
+    figure = Figure(figsize=(2, 2))
+    axes = figure.add_subplot()
+    axes.pie(values, labels=[f"label {i}" for i in range(len(values))])
+    if legend:
+        axes.legend()
+    return figure
+
+
+def test_unchanged_chart_is_copied_from_the_cache(charts, tmp_path):
+    _pie([1, 2, 3]).savefig(tmp_path / "need_pie_a.png")
+    assert charts.stats() == (0, 1)
+
+    _pie([1, 2, 3]).savefig(tmp_path / "need_pie_b.png")
+    assert charts.stats() == (1, 1)
+    assert (tmp_path / "need_pie_b.png").read_bytes() == (tmp_path / "need_pie_a.png").read_bytes()
+
+    _pie([1, 2, 4]).savefig(tmp_path / "need_pie_c.png")
+    _pie([1, 2, 3]).savefig(tmp_path / "need_pie_a.svg")
+    assert charts.stats() == (1, 3)
+    assert len(list((tmp_path / "cache").iterdir())) == 3
+
+
+def test_other_figures_are_not_cached(charts, tmp_path):
+    _pie([1, 2, 3]).savefig(tmp_path / "plot.png")
+    assert charts.stats() == (0, 0)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_prune_removes_unused_images(charts, tmp_path):
+    _pie([1, 2, 3]).savefig(tmp_path / "need_pie_a.png")
+    _pie([1, 2, 4]).savefig(tmp_path / "need_pie_b.png")
+    old, recent = sorted((tmp_path / "cache").iterdir())
+    os.utime(old, (0, 0))
+
+    charts.prune()
+    assert list((tmp_path / "cache").iterdir()) == [recent]
+
+
+def test_legends_of_charts_are_removed(charts, tmp_path):
+    chart, other = _pie([1, 2], legend=True), _pie([1, 2], legend=True)
+    chart.savefig(tmp_path / "need_pie_a.png")
+    other.savefig(tmp_path / "plot.png")
+
+    assert chart.axes[0].get_legend() is None
+    assert other.axes[0].get_legend() is not None
+    # A chart with a legend is the same image as the chart without one.
+    _pie([1, 2]).savefig(tmp_path / "need_pie_b.png")
+    assert charts.stats() == (1, 1)
@@ -0,0 +1,277 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+NEEDS_FILTERS = Path(__file__).parents[3] / "docs" / "needs_filters.py"
+
+AREAS = ["requirements_engineering", "safety_management", "verification"]
+WORKFLOWS = ["wf__req", "wf__safety", "wf__verify", "wf__unused"]
+VERIFICATION_TAGS = ["done_automation", "prio_1_automation", "prio_2_automation", "manual_prio_1", "other_tag"]
+STD_REQ_TAGS = ["ok", "recommendation", "open", "action", "deviation", "n/a", "unrelated"]
+
+
+@pytest.fixture
+def needs_filters():
+    spec = importlib.util.spec_from_file_location("needs_filters", NEEDS_FILTERS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# The filter functions as they were before the NeedsIndex, each a scan over all needs.
+def old_std_req_status_for_area(needs, results, arg1=""):
+    """
+    filter_func for needpie: counts the tag-based compliance status distribution
+    of std_req needs referenced via `complies` from gd_req needs tagged with the
+    given process area tag.
+
+    Recognized tags (in priority order): ok, recommendation, open, action,
+    deviation, n/a. Needs with none of these tags are counted as "other".
+
+    arg1 = process area tag (e.g. requirements_engineering)
+    """
+    area_tag = arg1.strip()
+    std_req_ids = set()
+    needs_by_id = {n["id"]: n for n in needs}
+    for need in needs:
+        if need.get("type") == "gd_req" and not need.get("is_external", False) and area_tag in need.get("tags", []):
+            for ref_id in need.get("complies", []):
+                if ref_id.startswith("std_req__iso26262__"):
+                    std_req_ids.add(ref_id)
+    ok = recommendation = open_ = action = deviation = na = other = 0
+    for sid in std_req_ids:
+        n = needs_by_id.get(sid)
+        if n:
+            t = set(n.get("tags", []))
+            if "deviation" in t:
+                deviation += 1
+            elif "action" in t:
+                action += 1
+            elif "open" in t:
+                open_ += 1
+            elif "ok" in t:
+                ok += 1
+            elif "recommendation" in t:
+                recommendation += 1
+            elif "n/a" in t:
+                na += 1
+            else:
+                other += 1
+    results += [ok, recommendation, open_, action, deviation, na, other]
+
+
+def old_wp_tag_status(needs, results, arg1=""):
+    """
+    filter_func for needpie: counts the tag-based verification status distribution
+    of gd_req needs associated with one or more workflows (pipe-separated in arg1).
+
+    Tags (in priority order):
+    - done_automation → Automated
+    - prio_<X>_automation → Waiting for automation
+    - manual_prio_<X> → Inspection list
+    - (none of the above) → Other
+
+    arg1 = workflow id(s), pipe-separated (e.g. wf__foo or wf__foo|wf__bar)
+    """
+    workflow_ids = [w.strip() for w in arg1.split("|") if w.strip()]
+    automated = waiting = inspection = other = 0
+    for need in needs:
+        if need.get("type") == "gd_req" and not need.get("is_external", False):
+            satisfies = need.get("satisfies", [])
+            if any(wf in satisfies for wf in workflow_ids):
+                tags = set(need.get("tags", []))
+                if "done_automation" in tags:
+                    automated += 1
+                elif any(t.startswith("prio_") and t.endswith("_automation") for t in tags):
+                    waiting += 1
+                elif any(t.startswith("manual_prio_") for t in tags):
+                    inspection += 1
+                else:
+                    other += 1
+    results += [automated, waiting, inspection, other]
+
+
+def old_area_verification_status(needs, results, arg1=""):
+    """
+    filter_func for needpie: counts the tag-based verification status distribution
+    of gd_req needs tagged with the given process area tag, aggregated across all
+    workflows for that area.
+
+    Tags (in priority order):
+    - done_automation → Automated
+    - prio_<X>_automation → Waiting for automation
+    - manual_prio_<X> → Inspection list
+    - (none of the above) → Other
+
+    arg1 = process area tag (e.g. requirements_engineering)
+    """
+    area_tag = arg1.strip()
+    automated = waiting = inspection = other = 0
+    for need in needs:
+        if need.get("type") == "gd_req" and not need.get("is_external", False) and area_tag in need.get("tags", []):
+            tags = set(need.get("tags", []))
+            if "done_automation" in tags:
+                automated += 1
+            elif any(t.startswith("prio_") and t.endswith("_automation") for t in tags):
+                waiting += 1
+            elif any(t.startswith("manual_prio_") for t in tags):
+                inspection += 1
+            else:
+                other += 1
+    results += [automated, waiting, inspection, other]
+
+
+def old_wp_done_automation_status(needs, results, arg1=""):
+    """
+    filter_func for needpie: counts gd_req needs associated with one or more
+    workflows and splits them into done_automation vs. remaining requirements.
+
+    arg1 = workflow id(s), pipe-separated (e.g. wf__foo or wf__foo|wf__bar)
+    """
+    workflow_ids = [w.strip() for w in arg1.split("|") if w.strip()]
+    done = rest = 0
+    for need in needs:
+        if need.get("type") == "gd_req" and not need.get("is_external", False):
+            satisfies = need.get("satisfies", [])
+            if any(wf in satisfies for wf in workflow_ids):
+                tags = set(need.get("tags", []))
+                if "done_automation" in tags:
+                    done += 1
+                else:
+                    rest += 1
+    results += [done, rest]
+
+
+def _needs(seed=0):
+    """A need set like the process docs': internal and external gd_reqs with their parts, std_reqs, workflows."""
+    rng = random.Random(seed)
+    std_reqs = [
+        {"id": f"std_req__iso26262__{i}", "type": "std_req", "tags": rng.sample(STD_REQ_TAGS, rng.randint(0, 2))}
+        for i in range(30)
+    ]
+    # Referenced by gd_reqs, but not ISO 26262 std_reqs or not in the needs at all
+    others = [{"id": f"std_req__aspice__{i}", "type": "std_req", "tags": ["ok"]} for i in range(5)]
+    needs = std_reqs + others + [{"id": f"wf__{w}", "type": "workflow"} for w in WORKFLOWS]
+    for i in range(200):
+        need = {
+            "id": f"gd_req__{i}",
+            "type": "gd_req",
+            "is_external": rng.random() < 0.1,
+            "tags": rng.sample(AREAS, rng.randint(0, 2)) + rng.sample(VERIFICATION_TAGS, rng.randint(0, 2)),
+            "satisfies": rng.sample(WORKFLOWS[:-1], rng.randint(0, 2)),
+            "complies": rng.sample(
+                [n["id"] for n in std_reqs + others] + ["std_req__iso26262__missing"], rng.randint(0, 3)
+            ),
+        }
+        needs.append(need)
+        if rng.random() < 0.2:
+            needs.append({**need, "is_part": True})
+    return needs
+
+
+OLD_FILTERS = {
+    "std_req_status_for_area": old_std_req_status_for_area,
+    "area_verification_status": old_area_verification_status,
+    "wp_tag_status": old_wp_tag_status,
+    "wp_done_automation_status": old_wp_done_automation_status,
+}
+
+ARGS = {
+    "std_req_status_for_area": [*AREAS, " requirements_engineering ", "unknown", ""],
+    "area_verification_status": [*AREAS, " verification ", "unknown", ""],
+    "wp_tag_status": [*WORKFLOWS, "wf__req|wf__safety", " wf__req | wf__verify ", "wf__unused|", ""],
+    "wp_done_automation_status": [*WORKFLOWS, "wf__req|wf__safety", " wf__req | wf__verify ", "wf__unused|", ""],
+}
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize(
+    ("name", "arg1"), [(name, arg1) for name, args in ARGS.items() for arg1 in args], ids=lambda v: repr(v)
+)
+def test_filters_match_the_scans_they_replace(needs_filters, seed, name, arg1):
+    needs = _needs(seed)
+    needs_filters.reset_needs_index()
+    expected, actual = [], []
+    OLD_FILTERS[name](needs, expected, arg1)
+    getattr(needs_filters, name)(needs, actual, arg1)
+    assert actual == expected
+
+
+class _Need(dict):
+    """A need without parts, as far as the sphinx-needs views use it."""
+
+    def __init__(self, need):
+        super().__init__({"is_external": False, "type_name": need["type"], "status": None, "tags": [], "parts": {}})
+        self.update(need)
+
+    def iter_part_items(self):
+        return iter(())
+
+    def get_part_item(self, _part_id):
+        return None
+
+
+def _views(needs):
+    """Return the view of all *needs* sphinx-needs passes to filter functions, and the view a scoped needpie passes."""
+    views = pytest.importorskip("sphinx_needs.views")
+    all_needs = {need["id"]: _Need(need) for need in needs if not need.get("is_part", False)}
+    # sphinx-needs has no public constructor for its views; this is how it builds them.
+    indexes = views._LazyIndexes(all_needs)  # noqa: SLF001
+    full = views.NeedsView(_indexes=indexes, _selected_ids=None).to_list_with_parts()
+    scoped = full.filter_ids([need_id for need_id in all_needs if need_id.endswith("7")])
+    return full, scoped
+
+
+@pytest.mark.parametrize(("name", "arg1"), [(name, args[0]) for name, args in ARGS.items()])
+def test_scoped_views_are_not_answered_from_the_full_index(needs_filters, name, arg1):
+    full, scoped = _views(_needs())
+    needs_filters.reset_needs_index()
+    for needs in (full, scoped, full):
+        expected, actual = [], []
+        OLD_FILTERS[name](list(needs), expected, arg1)
+        getattr(needs_filters, name)(needs, actual, arg1)
+        assert actual == expected
+
+
+def test_index_of_all_needs_is_built_once_per_build(needs_filters, monkeypatch):
+    built = []
+    monkeypatch.setattr(needs_filters, "NeedsIndex", lambda needs: built.append(needs) or object())
+    needs_filters.reset_needs_index()
+    full, scoped = _views(_needs())
+
+    indexes = [needs_filters.needs_index(view) for view in (full, full, scoped, full)]
+    assert len(built) == 2
+    assert indexes[0] is indexes[1] is indexes[3]
+    assert indexes[2] is not indexes[0]
+
+    next_build, _ = _views(_needs(1))
+    needs_filters.needs_index(next_build)
+    needs_filters.needs_index(next_build)
+    assert len(built) == 3
+
+    needs_filters.reset_needs_index()
+    needs_filters.needs_index(next_build)
+    assert len(built) == 4
+
+
+def test_plain_lists_are_indexed_on_every_call(needs_filters):
+    needs_filters.reset_needs_index()
+    for seed in (0, 1):
+        expected, actual = [], []
+        old_area_verification_status(_needs(seed), expected, "verification")
+        needs_filters.area_verification_status(_needs(seed), actual, "verification")
+        assert actual == expected
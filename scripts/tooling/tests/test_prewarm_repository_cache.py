@@ -0,0 +1,151 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import base64
+import hashlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from scripts.tooling.cli.workflow import prewarm_repository_cache as prewarm
+
+
+def _integrity(content: bytes) -> str:
+    return "sha256-" + base64.b64encode(hashlib.sha256(content).digest()).decode()
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """A file:// registry with one module that has a source archive, a patch and an overlay file."""
+    module_dir = tmp_path / "registry" / "modules" / "foo" / "1.0"
+    (module_dir / "patches").mkdir(parents=True)
+    (module_dir / "overlay").mkdir()
+    archive = tmp_path / "foo-1.0.tar.gz"
+    archive.write_bytes(b"archive")
+    (module_dir / "patches" / "fix.patch").write_bytes(b"patch")
+    (module_dir / "overlay" / "BUILD.bazel").write_bytes(b"overlay")
+    source = {
+        "url": archive.as_uri(),
+        "integrity": _integrity(b"archive"),
+        "patches": {"fix.patch": _integrity(b"patch")},
+        "overlay": {"BUILD.bazel": _integrity(b"overlay")},
+    }
+    source_json = module_dir / "source.json"
+    source_json.write_text(json.dumps(source))
+    lockfile = tmp_path / "MODULE.bazel.lock"
+    lockfile.write_text(
+        json.dumps(
+            {
+                "registryFileHashes": {
+                    source_json.as_uri(): hashlib.sha256(source_json.read_bytes()).hexdigest(),
+                    (module_dir / "MODULE.bazel").as_uri(): "0" * 64,
+                }
+            }
+        )
+    )
+    return lockfile
+
+
+def test_integrity_to_sha256():
+    assert prewarm.integrity_to_sha256(_integrity(b"x")) == hashlib.sha256(b"x").hexdigest()
+    assert prewarm.integrity_to_sha256("sha384-AAAA") is None
+
+
+def test_prewarm_stores_files_content_addressed(registry, tmp_path):
+    cache = tmp_path / "cache"
+    counts = prewarm.prewarm_registry_modules(registry, cache, jobs=4, timeout=5)
+
+    assert counts == {"cached": 0, "downloaded": 3, "failed": 0}
+    for content in (b"archive", b"patch", b"overlay"):
+        assert prewarm.cache_path(cache, hashlib.sha256(content).hexdigest()).read_bytes() == content
+
+
+def test_second_run_downloads_nothing(registry, tmp_path):
+    cache = tmp_path / "cache"
+    prewarm.prewarm_registry_modules(registry, cache, jobs=4, timeout=5)
+
+    with patch.object(prewarm, "urlopen", wraps=prewarm.urlopen) as fetch:
+        counts = prewarm.prewarm_registry_modules(registry, cache, jobs=4, timeout=5)
+
+    assert counts == {"cached": 3, "downloaded": 0, "failed": 0}
+    assert fetch.call_count == 1  # only source.json
+
+
+def test_corrupt_download_is_not_cached(registry, tmp_path):
+    (tmp_path / "foo-1.0.tar.gz").write_bytes(b"tampered")
+    cache = tmp_path / "cache"
+
+    counts = prewarm.prewarm_registry_modules(registry, cache, jobs=4, timeout=5)
+
+    assert counts["failed"] == 1
+    assert not prewarm.cache_path(cache, hashlib.sha256(b"archive").hexdigest()).exists()
+
+
+def test_source_json_not_matching_lockfile_is_skipped(registry, tmp_path):
+    source_json = next((tmp_path / "registry").rglob("source.json"))
+    source_json.write_text(source_json.read_text() + " ")
+
+    counts = prewarm.prewarm_registry_modules(registry, tmp_path / "cache", jobs=4, timeout=5)
+
+    assert counts == {"cached": 0, "downloaded": 0, "failed": 1}
+
+
+@pytest.mark.usefixtures("registry")
+def test_main_fetches_git_override_modules_in_one_bazel_call(tmp_path, monkeypatch):
+    (tmp_path / "patches").mkdir()
+    (tmp_path / "patches" / "a.patch").write_text("")
+    known_good = {
+        "modules": {
+            "target_sw": {
+                "score_a": {
+                    "repo": "https://github.com/org/a.git",
+                    "hash": "a" * 40,
+                    "bazel_patches": ["//patches:a.patch"],
+                },
+                "score_b": {"repo": "https://github.com/org/b.git", "hash": "b" * 40},
+            }
+        },
+        "timestamp": "2026-01-01T00:00:00+00:00Z",
+    }
+    (tmp_path / "known_good.json").write_text(json.dumps(known_good))
+    monkeypatch.setenv("BUILD_WORKING_DIRECTORY", str(tmp_path))
+
+    with patch.object(prewarm.subprocess, "run") as run:
+        run.return_value.returncode = 0
+        exit_code = prewarm.main(["--repository-cache", str(tmp_path / "cache"), "--bazel-fetch"])
+
+    assert exit_code == 0
+    run.assert_called_once()
+    cmd = run.call_args.args[0]
+    assert cmd[:2] == ["bazel", "fetch"]
+    assert "--repo=@score_a" in cmd
+    assert "--repo=@score_b" in cmd
+
+
+def test_main_fails_on_missing_patch(tmp_path, monkeypatch):
+    known_good = {
+        "modules": {
+            "target_sw": {
+                "score_a": {
+                    "repo": "https://github.com/org/a.git",
+                    "hash": "a" * 40,
+                    "bazel_patches": ["//patches:a.patch"],
+                }
+            }
+        },
+        "timestamp": "2026-01-01T00:00:00+00:00Z",
+    }
+    (tmp_path / "known_good.json").write_text(json.dumps(known_good))
+    monkeypatch.setenv("BUILD_WORKING_DIRECTORY", str(tmp_path))
+
+    assert prewarm.main(["--repository-cache", str(tmp_path / "cache")]) == 1
@@ -12,8 +12,18 @@
 # *******************************************************************************
 import json
 import re
-
-from cli.misc.html_report import TEMPLATE_DIR, generate_report, write_report
+from unittest.mock import patch
+
+from cli.misc.html_report import (
+    TEMPLATE_DIR,
+    collect_entries,
+    enrich_with_compare_data,
+    generate_report,
+    write_report,
+)
+from lib.drift_cache import DriftCache
+from lib.drift_history import DriftHistory
+from lib.github import CompareResult
 from lib.known_good import KnownGood
 from lib.known_good.module import Module
 
@@ -246,3 +256,95 @@ class TestReportFromRealFile:
             assert "hash" in entry
             assert "branch" in entry
             assert "owner_repo" in entry
+
+
+# ---------------------------------------------------------------------------
+# enrich_with_compare_data – concurrency and drift cache
+# ---------------------------------------------------------------------------
+
+HEAD_SHA = "f" * 40
+
+
+class TestEnrichWithCompareData:
+    @patch("cli.misc.html_report.fetch_compare")
+    @patch("cli.misc.html_report.resolve_ref_sha", return_value=HEAD_SHA)
+    def test_entries_are_enriched(self, mock_resolve, mock_compare, multi_group_known_good):
+        mock_compare.return_value = CompareResult(ahead_by=3, status="ahead", head_sha=HEAD_SHA)
+        entries = collect_entries(multi_group_known_good)
+        enrich_with_compare_data(entries, "token")
+        for entry in entries:
+            assert entry["current_hash"] == HEAD_SHA
+            assert entry["behind_by"] == 3
+            assert entry["compare_status"] == "ahead"
+        assert mock_compare.call_count == len(entries)
+
+    @patch("cli.misc.html_report.fetch_compare")
+    @patch("cli.misc.html_report.resolve_ref_sha", return_value=HEAD_SHA)
+    def test_persistent_cache_avoids_network(self, mock_resolve, mock_compare, tmp_path, multi_group_known_good):
+        mock_compare.return_value = CompareResult(ahead_by=1, status="ahead", head_sha=HEAD_SHA)
+        cache_file = tmp_path / "drift.json"
+        enrich_with_compare_data(collect_entries(multi_group_known_good), "token", DriftCache(cache_file))
+        assert cache_file.exists()
+
+        mock_resolve.reset_mock()
+        mock_compare.reset_mock()
+        entries = collect_entries(multi_group_known_good)
+        enrich_with_compare_data(entries, "token", DriftCache(cache_file))
+        mock_resolve.assert_not_called()
+        mock_compare.assert_not_called()
+        assert all(entry["behind_by"] == 1 for entry in entries)
+
+    @patch("cli.misc.html_report.fetch_compare")
+    @patch("cli.misc.html_report.resolve_ref_sha", return_value=HEAD_SHA)
+    def test_expired_head_reuses_compare(self, mock_resolve, mock_compare, tmp_path, minimal_known_good):
+        mock_compare.return_value = CompareResult(ahead_by=2, status="ahead", head_sha=HEAD_SHA)
+        cache_file = tmp_path / "drift.json"
+        enrich_with_compare_data(collect_entries(minimal_known_good), "token", DriftCache(cache_file))
+
+        mock_compare.reset_mock()
+        enrich_with_compare_data(collect_entries(minimal_known_good), "token", DriftCache(cache_file, head_ttl=0))
+        # HEAD is looked up again, but it has not moved, so the comparison is served from cache.
+        assert mock_resolve.call_count == 2
+        mock_compare.assert_not_called()
+
+    @patch("cli.misc.html_report.fetch_compare", return_value=None)
+    @patch("cli.misc.html_report.resolve_ref_sha", return_value=HEAD_SHA)
+    def test_failed_compare_leaves_entry_empty(self, mock_resolve, mock_compare, minimal_known_good):
+        entries = collect_entries(minimal_known_good)
+        enrich_with_compare_data(entries, "token")
+        assert entries[0]["behind_by"] is None
+        assert entries[0]["current_hash"] is None
+
+    def test_unreadable_cache_is_ignored(self, tmp_path):
+        cache_file = tmp_path / "drift.json"
+        cache_file.write_text("not json")
+        cache = DriftCache(cache_file)
+        assert cache.get_ref("eclipse-score/baselibs", "1.0.0") is None
+
+
+# ---------------------------------------------------------------------------
+# generate_report – drift history
+# ---------------------------------------------------------------------------
+
+
+class TestGenerateReportHistory:
+    def test_no_history_embeds_null(self, minimal_known_good):
+        html = generate_report(minimal_known_good)
+        assert "const HISTORY = null;" in html
+
+    @patch("cli.misc.html_report.fetch_compare")
+    @patch("cli.misc.html_report.resolve_ref_sha", return_value=HEAD_SHA)
+    def test_snapshot_appended_and_embedded(self, mock_resolve, mock_compare, tmp_path, minimal_known_good):
+        mock_compare.return_value = CompareResult(ahead_by=4, status="ahead", head_sha=HEAD_SHA)
+        history = DriftHistory(tmp_path / "history.jsonl")
+        html = generate_report(minimal_known_good, "token", history=history, history_weeks=2)
+        assert len(history.read_since(0)) == 1
+        match = re.search(r"const HISTORY\s*=\s*(\{.*?\});", html)
+        timeline = json.loads(match.group(1))
+        assert len(timeline["days"]) == 14
+        assert timeline["modules"]["target_sw/score_baselibs"][-1] == 4
+
+    def test_without_token_nothing_is_recorded(self, tmp_path, minimal_known_good):
+        history = DriftHistory(tmp_path / "history.jsonl")
+        generate_report(minimal_known_good, history=history)
+        assert history.read_since(0) == []
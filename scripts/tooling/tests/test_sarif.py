@@ -0,0 +1,225 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import re
+import tracemalloc
+
+import pytest
+from lib.coding_standards import GuidelineRecategorization, Recategorizer, get_recategorizations, load_config
+from lib.sarif import filter_sarif, merge_sarif
+
+from scripts.tooling.cli.workflow.recategorize_guidelines import in_repos
+
+
+def _result(uri, rule="cpp/rule", message="Ünïcode message"):
+    return {
+        "ruleId": rule,
+        "message": {"text": message},
+        "locations": [{"physicalLocation": {"artifactLocation": {"uri": uri}, "region": {"startLine": 7}}}],
+    }
+
+
+def _sarif(*runs):
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {"tool": {"driver": {"name": name, "rules": [{"id": "cpp/rule"}]}}, "results": results, "columnKind": "x"}
+            for name, results in runs
+        ],
+    }
+
+
+def _write(path, data, indent=2):
+    path.write_text(json.dumps(data, indent=indent, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _expected(data):
+    expected = json.loads(json.dumps(data))
+    for run in expected["runs"]:
+        run["results"] = [r for r in run["results"] if in_repos(r)]
+    return expected
+
+
+# ---------------------------------------------------------------------------
+# filter_sarif
+# ---------------------------------------------------------------------------
+
+
+class TestFilterSarif:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_matches_in_memory_filter(self, tmp_path, chunk_size):
+        data = _sarif(
+            ("CodeQL", [_result("repos/a/x.cpp"), _result("bazel-out/x.cpp"), _result("/src/repos/b/y.h")]),
+            ("Other", [_result("myrepos/z.cpp"), {"ruleId": "no-location"}]),
+        )
+        src = _write(tmp_path / "in.sarif", data)
+
+        stats = filter_sarif(src, tmp_path / "out.sarif", in_repos, chunk_size=chunk_size)
+
+        assert json.loads((tmp_path / "out.sarif").read_text(encoding="utf-8")) == _expected(data)
+        assert [(s.tool, s.kept, s.dropped) for s in stats] == [("CodeQL", 2, 1), ("Other", 0, 2)]
+
+    def test_in_place_and_compact(self, tmp_path):
+        data = _sarif(("CodeQL", [_result("repos/a/x.cpp")] * 3))
+        path = _write(tmp_path / "cpp.sarif", data)
+        size_before = path.stat().st_size
+
+        filter_sarif(path, path, in_repos)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+        assert path.stat().st_size < size_before
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_empty_and_missing_results(self, tmp_path):
+        data = {"version": "2.1.0", "runs": [{"tool": {"driver": {"name": "a"}}, "results": []}, {"tool": {}}]}
+        src = _write(tmp_path / "in.sarif", data)
+        filter_sarif(src, tmp_path / "out.sarif", in_repos)
+        assert json.loads((tmp_path / "out.sarif").read_text()) == data
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ('{"runs": [{"results": [{"a": 1}', "found 'end of file'"),
+            ('{"runs": []} {}', "Unexpected data after the SARIF object"),
+            ("[]", "Expected one of '{'"),
+        ],
+    )
+    def test_malformed_input_raises_and_keeps_destination(self, tmp_path, text, message):
+        src = tmp_path / "in.sarif"
+        src.write_text(text)
+        dst = tmp_path / "out.sarif"
+        dst.write_text("previous")
+        with pytest.raises(ValueError, match=re.escape(message)):
+            filter_sarif(src, dst, in_repos)
+        assert dst.read_text() == "previous"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_memory_does_not_grow_with_results(self, tmp_path):
+        results = [_result(f"repos/m/f{i}.cpp" if i % 2 else f"ext/f{i}.cpp") for i in range(20000)]
+        src = _write(tmp_path / "in.sarif", _sarif(("CodeQL", results)), indent=None)
+        assert src.stat().st_size > 3_000_000
+
+        tracemalloc.start()
+        try:
+            stats = filter_sarif(src, tmp_path / "out.sarif", in_repos, chunk_size=64 * 1024)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert stats[0].kept == 10000
+        assert peak < 1_000_000
+
+
+# ---------------------------------------------------------------------------
+# merge_sarif
+# ---------------------------------------------------------------------------
+
+
+def test_merge_groups_runs_by_tool(tmp_path):
+    a = _write(tmp_path / "a.sarif", _sarif(("CodeQL", [_result("src/a.cpp")])))
+    b = _write(tmp_path / "b.sarif", _sarif(("CodeQL", [_result("/abs/b.cpp")]), ("Other", [_result("c.cpp")])))
+
+    stats = merge_sarif([(a, "repos/a/"), (b, "repos/b/")], tmp_path / "out.sarif")
+
+    data = json.loads((tmp_path / "out.sarif").read_text(encoding="utf-8"))
+    uris = [
+        [r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for r in run["results"]]
+        for run in data["runs"]
+    ]
+    assert uris == [["repos/a/src/a.cpp", "/abs/b.cpp"], ["repos/b/c.cpp"]]
+    assert data["version"] == "2.1.0"
+    assert data["runs"][0]["columnKind"] == "x"
+    assert [(s.tool, s.kept) for s in stats] == [("CodeQL", 2), ("Other", 1)]
+
+
+# ---------------------------------------------------------------------------
+# recategorization
+# ---------------------------------------------------------------------------
+
+
+def _rule(rule_id, obligation, standard="misra"):
+    return {
+        "id": f"cpp/{standard}/{rule_id}",
+        "properties": {"tags": [f"external/{standard}/id/{rule_id}", f"external/{standard}/obligation/{obligation}"]},
+    }
+
+
+def _pack_sarif(*rules):
+    return {
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {"name": "CodeQL", "rules": []},
+                    "extensions": [{"name": "pack", "rules": list(rules)}],
+                },
+                "results": [_result("repos/a/x.cpp"), _result("ext/y.cpp")],
+            }
+        ],
+    }
+
+
+class TestRecategorization:
+    def test_config(self, tmp_path):
+        config = tmp_path / "coding-standards.yml"
+        config.write_text(
+            "deviations: []\nguideline-recategorizations:\n  - rule-id: RULE-0-1-2\n    category: required\n"
+        )
+        assert get_recategorizations(load_config(config)) == [GuidelineRecategorization("RULE-0-1-2", "required")]
+
+        config.write_text("guideline-recategorizations: []\n")
+        assert get_recategorizations(load_config(config)) == []
+
+    def test_recategorized_and_filtered_in_one_pass(self, tmp_path):
+        data = _pack_sarif(_rule("rule-0-1-2", "advisory"), _rule("rule-5-0-1", "advisory"))
+        path = _write(tmp_path / "cpp.sarif", data)
+        recategorizer = Recategorizer([GuidelineRecategorization("RULE-0-1-2", "required")])
+
+        stats = filter_sarif(path, path, in_repos, rewrite_tool=recategorizer)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        rules = data["runs"][0]["tool"]["extensions"][0]["rules"]
+        assert rules[0]["properties"]["tags"] == [
+            "external/misra/id/rule-0-1-2",
+            "external/misra/obligation/required",
+            "external/misra/original-obligation/advisory",
+        ]
+        assert rules[1] == _rule("rule-5-0-1", "advisory")
+        assert (stats[0].kept, stats[0].dropped, recategorizer.applied) == (1, 1, 1)
+
+    def test_invalid_recategorization_is_skipped(self, tmp_path):
+        data = _pack_sarif(_rule("rule-0-1-2", "mandatory"))
+        path = _write(tmp_path / "cpp.sarif", data)
+        recategorizer = Recategorizer([GuidelineRecategorization("RULE-0-1-2", "advisory")])
+
+        filter_sarif(path, path, in_repos, rewrite_tool=recategorizer)
+
+        tool = json.loads(path.read_text(encoding="utf-8"))["runs"][0]["tool"]
+        assert tool == data["runs"][0]["tool"]
+        assert recategorizer.applied == 0
+        assert recategorizer.invalid == [(GuidelineRecategorization("rule-0-1-2", "advisory"), "mandatory")]
+
+
+# ---------------------------------------------------------------------------
+# repos/ predicate
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("uri", "expected"),
+    [("repos/a.cpp", True), ("file:///w/repos/a.cpp", True), ("myrepos/a.cpp", False), ("", False)],
+)
+def test_in_repos(uri, expected):
+    assert in_repos(_result(uri)) is expected
@@ -0,0 +1,153 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import time
+
+import pytest
+from lib.sarif_baseline import BaselineStore, result_key, result_module
+
+from scripts.tooling.cli.workflow import sarif_baseline
+
+
+def _result(uri, fingerprint, rule="cpp/rule"):
+    return {
+        "ruleId": rule,
+        "message": {"text": "m"},
+        "locations": [{"physicalLocation": {"artifactLocation": {"uri": uri}, "region": {"startLine": 3}}}],
+        "partialFingerprints": {"primaryLocationLineHash": fingerprint},
+    }
+
+
+def _write_sarif(path, results, tool="CodeQL"):
+    data = {"version": "2.1.0", "runs": [{"tool": {"driver": {"name": tool}}, "results": results}]}
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def _read_results(path):
+    return json.loads(path.read_text(encoding="utf-8"))["runs"][0]["results"]
+
+
+# ---------------------------------------------------------------------------
+# fingerprint keys
+# ---------------------------------------------------------------------------
+
+
+def test_key_ignores_checkout_location_and_line():
+    a = _result("repos/mod/src/a.cpp", "abc:1")
+    b = _result("/work/repos/mod/src/a.cpp", "abc:1")
+    b["locations"][0]["physicalLocation"]["region"]["startLine"] = 40
+
+    assert result_module(a) == result_module(b) == ("mod", "src/a.cpp")
+    assert result_key(a, "src/a.cpp") == result_key(b, "src/a.cpp")
+    assert result_key(a, "src/a.cpp") != result_key(a, "src/b.cpp")
+    assert result_key(a, "src/a.cpp") != result_key(_result("repos/mod/src/a.cpp", "abc:1", "other"), "src/a.cpp")
+    assert result_module(_result("ext/a.cpp", "x")) is None
+
+
+# ---------------------------------------------------------------------------
+# record / diff
+# ---------------------------------------------------------------------------
+
+
+class TestBaselineStore:
+    def test_diff_reports_only_new_and_fixed(self, tmp_path):
+        store = BaselineStore(tmp_path / "store")
+        old = [_result("repos/a/x.cpp", "1"), _result("repos/a/x.cpp", "2"), _result("repos/b/y.cpp", "3")]
+        store.record(_write_sarif(tmp_path / "old.sarif", old), {"a": "a1", "b": "b1"})
+        assert store.latest() == {"a": "a1", "b": "b1"}
+
+        new = [_result("repos/a/x.cpp", "1"), _result("repos/a/x.cpp", "4"), _result("repos/b/y.cpp", "3")]
+        src = _write_sarif(tmp_path / "new.sarif", new)
+        deltas, stats = store.diff(src, tmp_path / "delta.sarif", store.latest())
+
+        results = _read_results(tmp_path / "delta.sarif")
+        assert [(r["partialFingerprints"]["primaryLocationLineHash"], r["baselineState"]) for r in results] == [
+            ("4", "new"),
+            ("2", "absent"),
+        ]
+        assert [(d.module, d.new, d.fixed, d.unchanged) for d in deltas] == [("a", 1, 1, 1), ("b", 0, 0, 1)]
+        assert stats[0].kept == 2
+
+    def test_findings_of_later_runs_of_a_tool_are_not_absent(self, tmp_path):
+        store = BaselineStore(tmp_path / "store")
+        old = [_result("repos/a/x.cpp", "1"), _result("repos/a/y.rs", "2"), _result("repos/a/x.cpp", "3")]
+        store.record(_write_sarif(tmp_path / "old.sarif", old), {"a": "a1"})
+
+        # CodeQL writes one run per language, all named CodeQL.
+        runs = [[_result("repos/a/x.cpp", "1")], [_result("repos/a/y.rs", "2"), _result("repos/a/y.rs", "4")]]
+        data = {"version": "2.1.0", "runs": [{"tool": {"driver": {"name": "CodeQL"}}, "results": r} for r in runs]}
+        src = tmp_path / "new.sarif"
+        src.write_text(json.dumps(data), encoding="utf-8")
+        deltas, _ = store.diff(src, tmp_path / "delta.sarif", {"a": "a1"})
+
+        delta_runs = json.loads((tmp_path / "delta.sarif").read_text(encoding="utf-8"))["runs"]
+        states = [
+            [(r["partialFingerprints"]["primaryLocationLineHash"], r["baselineState"]) for r in run["results"]]
+            for run in delta_runs
+        ]
+        assert states == [[("3", "absent")], [("4", "new")]]
+        assert (deltas[0].new, deltas[0].fixed, deltas[0].unchanged) == (1, 1, 2)
+
+    def test_modules_without_baseline_are_skipped(self, tmp_path):
+        store = BaselineStore(tmp_path / "store")
+        store.record(_write_sarif(tmp_path / "old.sarif", []), {"a": "a1"})
+
+        src = _write_sarif(tmp_path / "new.sarif", [_result("repos/a/x.cpp", "1"), _result("repos/c/z.cpp", "2")])
+        deltas, _ = store.diff(src, tmp_path / "delta.sarif", {"a": "a1", "c": "c1"})
+
+        assert [r["baselineState"] for r in _read_results(tmp_path / "delta.sarif")] == ["new"]
+        assert [d.module for d in deltas] == ["a"]
+
+    def test_large_baseline_lookup(self, tmp_path):
+        store = BaselineStore(tmp_path / "store")
+        results = [_result(f"repos/a/f{i % 100}.cpp", str(i)) for i in range(50_000)]
+        store.record(_write_sarif(tmp_path / "old.sarif", results), {"a": "a1"})
+
+        results[0] = _result("repos/a/new.cpp", "new")
+        src = _write_sarif(tmp_path / "new.sarif", results)
+        start = time.monotonic()
+        deltas, _ = store.diff(src, tmp_path / "delta.sarif", {"a": "a1"})
+        duration = time.monotonic() - start
+
+        assert (deltas[0].new, deltas[0].fixed, deltas[0].unchanged) == (1, 1, 49_999)
+        assert duration < 10
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _known_good(path, **hashes):
+    modules = {name: {"repo": f"https://github.com/eclipse-score/{name}.git", "hash": h} for name, h in hashes.items()}
+    path.write_text(json.dumps({"modules": {"target_sw": modules}}), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("use_base", [False, True])
+def test_cli_record_then_diff(tmp_path, monkeypatch, use_base):
+    monkeypatch.delenv("BUILD_WORKING_DIRECTORY", raising=False)
+    store = tmp_path / "store"
+    sarif = _write_sarif(tmp_path / "cpp.sarif", [_result("repos/a/x.cpp", "1")])
+    base = _known_good(tmp_path / "base.json", a="a1")
+    args = ["--sarif", str(sarif), "--store", str(store)]
+    assert sarif_baseline.main(["record", "--known-good", str(base), *args]) == 0
+
+    _write_sarif(sarif, [_result("repos/a/x.cpp", "2")])
+    current = _known_good(tmp_path / "known_good.json", a="a2")
+    extra = ["--base-known-good", str(base)] if use_base else []
+    delta = tmp_path / "delta.sarif"
+    assert sarif_baseline.main(["diff", "--known-good", str(current), "--output", str(delta), *args, *extra]) == 0
+
+    assert [r["baselineState"] for r in _read_results(delta)] == ["new", "absent"]
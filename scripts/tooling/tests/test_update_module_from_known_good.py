@@ -0,0 +1,103 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import copy
+import json
+import os
+import sys
+
+import pytest
+
+from .conftest import FULL_JSON
+
+
+@pytest.fixture
+def update_module(known_good_script):
+    return known_good_script("update_module_from_known_good")
+
+
+@pytest.fixture
+def generate(update_module, tmp_path, monkeypatch):
+    """Run the script on known_good.json content; return the GITHUB_OUTPUT lines it appended."""
+    github_output = tmp_path / "github_output"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(github_output))
+
+    def run(known_good: dict) -> list[str]:
+        known = tmp_path / "known_good.json"
+        known.write_text(json.dumps(known_good))
+        github_output.write_text("")
+        argv = ["update_module_from_known_good.py", "--known", str(known)]
+        argv += ["--output-dir-modules", str(tmp_path / "modules"), "--output-dir-coverage", str(tmp_path)]
+        monkeypatch.setattr(sys, "argv", argv)
+        update_module.main()
+        return github_output.read_text().splitlines()
+
+    return run
+
+
+def _age_outputs(tmp_path):
+    """Set the mtime of the generated files to 0, so files written afterwards can be told apart."""
+    for path in [*(tmp_path / "modules").iterdir(), tmp_path / "BUILD"]:
+        os.utime(path, ns=(0, 0))
+
+
+def _rewritten(tmp_path):
+    return sorted(
+        path.name for path in [*(tmp_path / "modules").iterdir(), tmp_path / "BUILD"] if path.stat().st_mtime_ns
+    )
+
+
+def test_semantic_content_ignores_generation_time(update_module):
+    header = "# Generated from known_good.json at {}\n# Do not edit manually\n\nbazel_dep(name = 'a')\n"
+    first = header.format("2026-01-01T00:00:00Z")
+    assert update_module.semantic_content(first) == update_module.semantic_content(header.format("2026-02-01"))
+    assert update_module.semantic_content(first) != update_module.semantic_content(first.replace("'a'", "'b'"))
+
+
+def test_write_if_changed(update_module, tmp_path):
+    path = tmp_path / "score_modules_target_sw.MODULE.bazel"
+    content = "# Generated from known_good.json at 2026-01-01T00:00:00Z\nbazel_dep(name = 'a')\n"
+
+    assert update_module.write_if_changed(path, content)
+    assert not update_module.write_if_changed(path, content.replace("2026-01-01", "2026-02-01"))
+    assert path.read_text() == content
+    assert update_module.write_if_changed(path, content.replace("'a'", "'b'"))
+    assert "'b'" in path.read_text()
+
+
+def test_new_timestamp_alone_rewrites_nothing(generate, tmp_path):
+    assert generate(FULL_JSON) == ["changed_groups=target_sw tooling"]
+    _age_outputs(tmp_path)
+
+    assert generate({**FULL_JSON, "timestamp": "2026-06-01T00:00:00+00:00Z"}) == ["changed_groups="]
+    assert _rewritten(tmp_path) == []
+
+
+def test_changed_module_rewrites_only_its_group(generate, tmp_path):
+    generate(FULL_JSON)
+    _age_outputs(tmp_path)
+    known_good = copy.deepcopy(FULL_JSON)
+    known_good["modules"]["tooling"]["score_itf"]["hash"] = "0" * 40
+
+    assert generate(known_good) == ["changed_groups=tooling"]
+    assert _rewritten(tmp_path) == ["score_modules_tooling.MODULE.bazel"]
+    assert "0" * 40 in (tmp_path / "modules" / "score_modules_tooling.MODULE.bazel").read_text()
+
+
+def test_changed_coverage_marks_target_sw_changed(generate, tmp_path):
+    generate(FULL_JSON)
+    _age_outputs(tmp_path)
+    known_good = copy.deepcopy(FULL_JSON)
+    known_good["modules"]["target_sw"]["score_persistency"]["metadata"]["code_root_path"] = "//lib/..."
+
+    assert generate(known_good) == ["changed_groups=target_sw"]
+    assert _rewritten(tmp_path) == ["BUILD"]
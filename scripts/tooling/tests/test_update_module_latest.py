@@ -0,0 +1,104 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import argparse
+import json
+
+import pytest
+
+
+@pytest.fixture
+def update_module_latest(known_good_script):
+    return known_good_script("update_module_latest")
+
+
+def _known_good(module, tmp_path, name, hashes):
+    modules = {
+        group: {mod: {"repo": f"https://github.com/org/{mod}.git", "hash": h} for mod, h in mods.items()}
+        for group, mods in hashes.items()
+    }
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps({"modules": modules, "timestamp": ""}))
+    return module.load_known_good(path)
+
+
+@pytest.fixture
+def known_goods(update_module_latest, tmp_path):
+    """Original and updated known_good with the module ``mod`` in two groups."""
+    original = _known_good(
+        update_module_latest, tmp_path, "original", {"target_sw": {"mod": "a1", "lib": "b1"}, "tooling": {"mod": "c1"}}
+    )
+    updated = _known_good(
+        update_module_latest, tmp_path, "updated", {"target_sw": {"mod": "a2", "lib": "b2"}, "tooling": {"mod": "c2"}}
+    )
+    return original, updated
+
+
+KEYS = [("target_sw", "mod"), ("target_sw", "lib"), ("tooling", "mod")]
+
+
+def _stub_builds(monkeypatch, module, original, fails):
+    """Replace build_variant; a variant fails if *fails* holds for the set of its updated modules."""
+    built = []
+
+    def build_variant(known_good, label, work_dir, args):  # noqa: ARG001
+        updated = {
+            (group, name)
+            for group, mods in known_good.modules.items()
+            for name, mod in mods.items()
+            if mod.hash != original.modules[group][name].hash
+        }
+        built.append(label)
+        return not fails(updated)
+
+    monkeypatch.setattr(module, "build_variant", build_variant)
+    return built
+
+
+def test_apply_updates_takes_modules_by_group(update_module_latest, known_goods):
+    original, updated = known_goods
+
+    result = update_module_latest.apply_updates(original, updated, [("tooling", "mod")])
+
+    assert result.modules["tooling"]["mod"].hash == "c2"
+    assert result.modules["target_sw"]["mod"].hash == "a1"
+    assert original.modules["tooling"]["mod"].hash == "c1"
+
+
+def test_combined_update_is_accepted(update_module_latest, known_goods, monkeypatch):
+    original, updated = known_goods
+    built = _stub_builds(monkeypatch, update_module_latest, original, lambda _: False)
+
+    accepted = update_module_latest.trial_updates(original, updated, KEYS, argparse.Namespace(jobs=2))
+
+    assert accepted == KEYS
+    assert sorted(built) == ["combined", "target_sw-lib", "target_sw-mod", "tooling-mod"]
+
+
+def test_failing_update_is_rejected(update_module_latest, known_goods, monkeypatch):
+    original, updated = known_goods
+    _stub_builds(monkeypatch, update_module_latest, original, lambda keys: ("tooling", "mod") in keys)
+
+    accepted = update_module_latest.trial_updates(original, updated, KEYS, argparse.Namespace(jobs=2))
+
+    assert accepted == [("target_sw", "mod"), ("target_sw", "lib")]
+
+
+def test_conflicting_updates_are_added_one_by_one(update_module_latest, known_goods, monkeypatch):
+    original, updated = known_goods
+    conflict = {("target_sw", "mod"), ("tooling", "mod")}
+    built = _stub_builds(monkeypatch, update_module_latest, original, lambda keys: conflict <= keys)
+
+    accepted = update_module_latest.trial_updates(original, updated, KEYS, argparse.Namespace(jobs=2))
+
+    assert accepted == [("target_sw", "mod"), ("target_sw", "lib")]
+    assert built[-4:] == ["passing", "passing-1", "passing-2", "passing-3"]